@@ -13,6 +13,11 @@ from pydub import AudioSegment
 import simpleaudio as sa
 
 
+# Quiet time after a solo/mute change before the stem mix is rebuilt, so a
+# burst of clicks costs one rebuild (and one playback restart)
+MIX_REBUILD_DEBOUNCE_SECONDS = 0.15
+
+
 class AudioPlayer:
     """
     Audio player with stem mixing support.
@@ -51,6 +56,9 @@ class AudioPlayer:
         self._solo_states: dict[str, bool] = {name: False for name in self._stem_audio}
         self._mute_states: dict[str, bool] = {name: False for name in self._stem_audio}
 
+        # Monotonic deadline for a pending mix rebuild (None if up to date)
+        self._mix_rebuild_deadline: Optional[float] = None
+
         # Callbacks
         self._on_position_change: Optional[Callable[[float], None]] = None
         self._on_playback_end: Optional[Callable[[], None]] = None
@@ -166,6 +174,11 @@ class AudioPlayer:
         """
         self.stop()
 
+        # Apply solo/mute changes still waiting out their debounce
+        if self._mix_rebuild_deadline is not None:
+            self._mix_rebuild_deadline = None
+            self._rebuild_mix()
+
         if self._mixed_audio is None:
             return
 
@@ -265,7 +278,12 @@ class AudioPlayer:
             self._on_mix_state_changed()
 
     def _on_mix_state_changed(self):
-        """Handle solo/mute state change - rebuild mix and restart if playing."""
+        """Handle solo/mute state change - schedule a debounced mix rebuild."""
+        self._mix_rebuild_deadline = time.monotonic() + MIX_REBUILD_DEBOUNCE_SECONDS
+
+    def _apply_mix_state(self):
+        """Rebuild the mix and restart playback if playing."""
+        self._mix_rebuild_deadline = None
         current_pos = self.position
         was_playing = self._is_playing
 
@@ -284,6 +302,13 @@ class AudioPlayer:
         Returns:
             Current position in seconds
         """
+        # Rebuild the mix once solo/mute changes have settled
+        if (
+            self._mix_rebuild_deadline is not None
+            and time.monotonic() >= self._mix_rebuild_deadline
+        ):
+            self._apply_mix_state()
+
         pos = self.position
 
         # Check for end of playback
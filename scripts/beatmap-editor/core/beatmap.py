@@ -66,6 +66,38 @@ class Note:
         return Note(time=self.time, level=self.level, type=self.type)
 
 
+def bisect_notes_left(notes: list[Note], time: float) -> int:
+    """Index of the first note in a time-sorted list with note.time >= time."""
+    lo, hi = 0, len(notes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if notes[mid].time < time:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def bisect_notes_right(notes: list[Note], time: float) -> int:
+    """Index of the first note in a time-sorted list with note.time > time."""
+    lo, hi = 0, len(notes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if time < notes[mid].time:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def insort_note(notes: list[Note], note: Note):
+    """
+    Insert a note into a time-sorted list in O(log N) comparisons.
+    Equal times keep insertion order, matching append + stable sort.
+    """
+    notes.insert(bisect_notes_right(notes, note.time), note)
+
+
 @dataclass
 class BeatmapMeta:
     """Metadata for a beatmap."""
@@ -144,7 +176,14 @@ class Beatmap:
 
     def add_note(self, note: Note):
         """Add a note and keep list sorted by time."""
-        self._notes.append(note)
+        insort_note(self._notes, note)
+        self._dirty = True
+
+    def add_notes(self, notes: list[Note]):
+        """Add multiple notes with a single extend and one sort pass."""
+        if not notes:
+            return
+        self._notes.extend(notes)
         self._notes.sort(key=lambda n: n.time)
         self._dirty = True
 
@@ -169,8 +208,10 @@ class Beatmap:
         return None
 
     def get_notes_in_range(self, start_time: float, end_time: float) -> list[Note]:
-        """Get all notes within a time range."""
-        return [n for n in self._notes if start_time <= n.time <= end_time]
+        """Get all notes within a time range (inclusive), via binary search."""
+        lo = bisect_notes_left(self._notes, start_time)
+        hi = bisect_notes_right(self._notes, end_time)
+        return self._notes[lo:hi]
 
     def get_notes_by_type(self, note_type: str) -> list[Note]:
         """Get all notes of a specific type."""
@@ -3,13 +3,13 @@ Shared constants and configuration for the beatmap editor.
 Consolidates lane mappings, colors, UI dimensions, and keyboard constants.
 """
 
-import platform
+import sys
 
 # =============================================================================
 # Platform Detection
 # =============================================================================
 
-IS_MACOS = platform.system() == "Darwin"
+IS_MACOS = sys.platform == "darwin"
 
 # =============================================================================
 # Lane Configuration
@@ -18,6 +18,9 @@ IS_MACOS = platform.system() == "Darwin"
 # Lane names in display order
 LANES = ["base", "drum", "bass", "vocal", "lead"]
 
+# Lane name -> display index
+LANE_INDEX = {name: i for i, name in enumerate(LANES)}
+
 # Waveform/stem names
 WAVEFORMS = ["main", "drums", "bass", "vocals", "other"]
 
@@ -134,6 +137,10 @@ MAX_ZOOM = 500.0
 DEFAULT_THRESHOLD_PERCENT = 50.0
 DEFAULT_REARM_RATIO = 0.7  # Rearm threshold is 70% of main threshold
 MIN_PEAK_GAP_SECONDS = 0.05
+PEAK_SLIDER_DEBOUNCE_SECONDS = 0.15  # Quiet time before re-detecting peaks
+PEAK_CACHE_SIZE = 64  # Detection results remembered per PeakControls
+WAVEFORM_TILE_WIDTH = 1024  # Pixels per cached waveform polyline tile
+WAVEFORM_CACHE_TILES = 48  # Waveform tile textures kept across all lanes
 
 # History
 MAX_HISTORY_SIZE = 100
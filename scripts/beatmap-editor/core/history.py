@@ -2,6 +2,7 @@
 Undo/Redo history management using Command pattern.
 """
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
@@ -29,6 +30,13 @@ class Command(ABC):
         """Human-readable description of the command."""
         pass
 
+    def merge(self, command: "Command") -> bool:
+        """
+        Fold an already executed follow-up command into this one.
+        Returns True if merged, so the follow-up needs no history entry.
+        """
+        return False
+
 
 class AddNoteCommand(Command):
     """Command to add a note to the beatmap."""
@@ -56,8 +64,7 @@ class AddNotesCommand(Command):
         self.notes = notes
 
     def execute(self):
-        for note in self.notes:
-            self.beatmap.add_note(note)
+        self.beatmap.add_notes(self.notes)
 
     def undo(self):
         self.beatmap.remove_notes(self.notes)
@@ -96,8 +103,7 @@ class RemoveNotesCommand(Command):
         self.beatmap.remove_notes(self.notes)
 
     def undo(self):
-        for note in self.notes:
-            self.beatmap.add_note(note)
+        self.beatmap.add_notes(self.notes)
 
     @property
     def description(self) -> str:
@@ -247,25 +253,29 @@ class MoveNotesCommand(Command):
     ):
         self.beatmap = beatmap
         self.notes = notes
-        self.old_times = [n.time for n in notes]
-        self.old_types = [n.type for n in notes]
-        self.new_times = new_times if new_times is not None else self.old_times
-        self.new_types = new_types if new_types is not None else self.old_types
+        # Only the fields being changed are stored and written back
+        self.old_times = [n.time for n in notes] if new_times is not None else None
+        self.old_types = [n.type for n in notes] if new_types is not None else None
+        self.new_times = new_times
+        self.new_types = new_types
         self._description = description_text
 
-    def execute(self):
-        for note, new_time, new_type in zip(self.notes, self.new_times, self.new_types):
-            note.time = new_time
-            note.type = new_type
-        self.beatmap._notes.sort(key=lambda n: n.time)
+    def _apply(self, times: Optional[list[float]], types: Optional[list[str]]):
+        if types is not None:
+            for note, note_type in zip(self.notes, types):
+                note.type = note_type
+        # Lane changes leave the time order intact, so only re-sort on moves
+        if times is not None:
+            for note, note_time in zip(self.notes, times):
+                note.time = note_time
+            self.beatmap._notes.sort(key=lambda n: n.time)
         self.beatmap.mark_dirty()
 
+    def execute(self):
+        self._apply(self.new_times, self.new_types)
+
     def undo(self):
-        for note, old_time, old_type in zip(self.notes, self.old_times, self.old_types):
-            note.time = old_time
-            note.type = old_type
-        self.beatmap._notes.sort(key=lambda n: n.time)
-        self.beatmap.mark_dirty()
+        self._apply(self.old_times, self.old_types)
 
     @property
     def description(self) -> str:
@@ -273,6 +283,24 @@ class MoveNotesCommand(Command):
             return self._description
         return f"Move {len(self.notes)} notes"
 
+    def merge(self, command: Command) -> bool:
+        if not isinstance(command, MoveNotesCommand):
+            return False
+        if len(command.notes) != len(self.notes) or any(
+            a is not b for a, b in zip(command.notes, self.notes)
+        ):
+            return False
+        # Both must change the same fields for the old state to stay complete
+        if (command.new_times is None) != (self.new_times is None) or (
+            command.new_types is None
+        ) != (self.new_types is None):
+            return False
+        # Keep the original old state, take the follow-up's final state
+        self.new_times = command.new_times
+        self.new_types = command.new_types
+        self._description = command._description
+        return True
+
 
 class CleanupDuplicatesCommand(Command):
     """Command to remove duplicate notes at the same time."""
@@ -285,8 +313,7 @@ class CleanupDuplicatesCommand(Command):
         self.beatmap.remove_notes(self.notes_to_remove)
 
     def undo(self):
-        for note in self.notes_to_remove:
-            self.beatmap.add_note(note)
+        self.beatmap.add_notes(self.notes_to_remove)
 
     @property
     def description(self) -> str:
@@ -356,6 +383,11 @@ class PatternEditCommand(Command):
         return f"Edit {self.lane_type} pattern (+{added}, -{removed})"
 
 
+# Mergeable commands executed within this many seconds of each other
+# (e.g. arrow key repeats) share a single undo entry
+MERGE_WINDOW = 0.5
+
+
 class History:
     """
     Manages undo/redo history using a command stack.
@@ -365,12 +397,29 @@ class History:
         self._undo_stack: list[Command] = []
         self._redo_stack: list[Command] = []
         self._max_size = max_size
+        self._merge_deadline: float = 0.0  # See execute(merge=True)
 
-    def execute(self, command: Command):
-        """Execute a command and add it to the history."""
+    def execute(self, command: Command, merge: bool = False):
+        """
+        Execute a command and add it to the history.
+        With merge=True, a command following the previous mergeable one
+        within MERGE_WINDOW is folded into that entry instead.
+        """
         command.execute()
-        self._undo_stack.append(command)
         self._redo_stack.clear()  # Clear redo stack on new action
+
+        now = time.monotonic()
+        if (
+            merge
+            and now <= self._merge_deadline
+            and self._undo_stack
+            and self._undo_stack[-1].merge(command)
+        ):
+            self._merge_deadline = now + MERGE_WINDOW
+            return
+
+        self._undo_stack.append(command)
+        self._merge_deadline = now + MERGE_WINDOW if merge else 0.0
         self._trim_stack()
 
     def record(self, command: Command):
@@ -380,6 +429,7 @@ class History:
         """
         self._undo_stack.append(command)
         self._redo_stack.clear()
+        self._merge_deadline = 0.0
         self._trim_stack()
 
     def _trim_stack(self):
@@ -399,6 +449,7 @@ class History:
 
         command = self._undo_stack.pop()
         command.undo()
+        self._merge_deadline = 0.0
         self._redo_stack.append(command)
         return command.description
 
@@ -414,6 +465,7 @@ class History:
 
         command = self._redo_stack.pop()
         command.execute()
+        self._merge_deadline = 0.0
         self._undo_stack.append(command)
         return command.description
 
@@ -429,6 +481,7 @@ class History:
         """Clear all history."""
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._merge_deadline = 0.0
 
     @property
     def undo_description(self) -> Optional[str]:
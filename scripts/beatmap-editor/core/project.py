@@ -96,7 +96,7 @@ class Project:
         }
 
         # Waveform data for visualization (downsampled min/max envelope)
-        # Each entry is a dict with 'min', 'max', 'rms' arrays
+        # Each entry is a dict with 'min', 'max', 'rms' float32 arrays
         self.waveform_data: dict[str, Optional[dict]] = {
             "main": None,
             "vocals": None,
@@ -158,7 +158,7 @@ class Project:
             target_samples: Number of samples to generate for visualization
 
         Returns:
-            Dict with 'min', 'max', and 'rms' arrays for detailed waveform rendering
+            Dict with 'min', 'max', and 'rms' float32 arrays for detailed waveform rendering
         """
         import numpy as np
 
@@ -171,18 +171,21 @@ class Project:
         if max_val > 0:
             audio_data = audio_data / max_val
 
-        # Downsample by taking min/max/rms in chunks for envelope display
+        # Downsample by taking min/max/rms in chunks for envelope display,
+        # reducing whole chunks as rows of a 2D view plus any partial tail
+        audio_data = np.asarray(audio_data, dtype=np.float32)
         chunk_size = max(1, len(audio_data) // target_samples)
-        waveform_min = []
-        waveform_max = []
-        waveform_rms = []
-
-        for i in range(0, len(audio_data), chunk_size):
-            chunk = audio_data[i : i + chunk_size]
-            if len(chunk) > 0:
-                waveform_min.append(float(np.min(chunk)))
-                waveform_max.append(float(np.max(chunk)))
-                waveform_rms.append(float(np.sqrt(np.mean(chunk**2))))
+        num_full = len(audio_data) // chunk_size
+        chunks = audio_data[: num_full * chunk_size].reshape(num_full, chunk_size)
+        waveform_min = chunks.min(axis=1)
+        waveform_max = chunks.max(axis=1)
+        waveform_rms = np.sqrt(np.mean(chunks**2, axis=1))
+
+        tail = audio_data[num_full * chunk_size :]
+        if len(tail) > 0:
+            waveform_min = np.append(waveform_min, tail.min())
+            waveform_max = np.append(waveform_max, tail.max())
+            waveform_rms = np.append(waveform_rms, np.sqrt(np.mean(tail**2)))
 
         return {"min": waveform_min, "max": waveform_max, "rms": waveform_rms}
 
@@ -4,7 +4,9 @@ Orchestrates all UI components and handles application logic.
 """
 
 import dearpygui.dearpygui as dpg
+import numpy as np
 import os
+from collections import defaultdict
 from typing import Optional
 
 # Environment variables for default directories
@@ -20,6 +22,11 @@ def _get_default_directory(env_var: str) -> Optional[str]:
     return None
 
 
+def _ms(t: float) -> int:
+    """Convert a time in seconds to integer milliseconds (editor resolution)."""
+    return int(round(t * 1000))
+
+
 from core.project import Project
 from core.beatmap import Note
 from core.constants import (
@@ -44,7 +51,13 @@ from core.history import (
     MoveNoteCommand,
 )
 from audio.player import AudioPlayer
-from utils.grid import generate_beat_grid, snap_to_grid
+from utils.grid import (
+    beat_duration,
+    generate_beat_grid,
+    snap_to_grid,
+    snap_times_to_grid,
+)
+from utils.peaks import waveform_to_lane_key
 from utils.input import (
     is_modifier_down,
     is_shift_down,
@@ -87,10 +100,20 @@ class BeatmapEditorApp:
 
         # Clipboard for copy/paste operations
         self._clipboard: list[Note] = []
+        # Time span of the clipboard (largest relative offset), set on copy
+        self._clipboard_duration: float = 0.0
 
         # Initial audio file to load on startup
         self._initial_audio_file = initial_audio_file
 
+        # Mouse wheel zoom accumulated since the last frame (applied in _update)
+        self._wheel_steps: int = 0
+        self._wheel_pending: bool = False
+        self._wheel_center_time: Optional[float] = None
+
+        # Scratch buffer for snapping peak times, grown to the largest batch seen
+        self._snap_scratch: np.ndarray = np.empty(0, dtype=np.float64)
+
     def run(self):
         """Run the application."""
         dpg.create_context()
@@ -326,6 +349,7 @@ class BeatmapEditorApp:
         """Connect peak controls callbacks."""
         self.peak_controls.on_peaks_changed = self._on_peaks_changed
         self.peak_controls.on_add_markers = self._on_add_markers_from_peaks
+        self.peak_controls.on_add_markers_batch = self._on_add_markers_from_peaks_batch
 
     def _connect_beat_insert_callbacks(self):
         """Connect beat insert controls callbacks."""
@@ -441,6 +465,14 @@ class BeatmapEditorApp:
         if self.project.is_playing:
             self.project.playhead = self.audio_player.update()
 
+        # Apply mouse wheel zoom coalesced from this frame's scroll events
+        if self._wheel_pending:
+            self._apply_wheel_zoom()
+
+        # Run peak detection deferred while a threshold slider was dragged
+        if self.peak_controls:
+            self.peak_controls.update_pending()
+
         # Update UI components
         if self.transport:
             self.transport.update()
@@ -451,6 +483,8 @@ class BeatmapEditorApp:
 
     def _cleanup(self):
         """Cleanup resources."""
+        if self.peak_controls:
+            self.peak_controls.shutdown()
         self.audio_player.cleanup()
         self.project.cleanup()
 
@@ -532,6 +566,9 @@ class BeatmapEditorApp:
         except Exception as e:
             self._set_status(f"Error: {e}")
 
+        # New waveforms: cached peaks no longer apply
+        if self.peak_controls:
+            self.peak_controls.invalidate()
         self._update_all()
 
     def _load_beatmap(self, file_path: str):
@@ -608,14 +645,13 @@ class BeatmapEditorApp:
             self._set_status("No grid positions available")
             return
 
-        # Calculate new times for each selected note
-        new_times = []
-        moved_count = 0
-        for note in selected:
-            new_time = snap_to_grid(note.time, grid)
-            new_times.append(new_time)
-            if abs(new_time - note.time) > 0.001:  # Threshold for "moved"
-                moved_count += 1
+        # Snap all selected notes in one vectorized pass
+        old_times = np.fromiter(
+            (note.time for note in selected), dtype=np.float64, count=len(selected)
+        )
+        snapped = snap_times_to_grid(old_times, grid)
+        moved_count = int(np.count_nonzero(np.abs(snapped - old_times) > 0.001))
+        new_times = snapped.tolist()
 
         if moved_count == 0:
             self._set_status("All selected markers already on grid")
@@ -649,8 +685,6 @@ class BeatmapEditorApp:
             return
 
         # Group notes by time (rounded to avoid floating point issues)
-        from collections import defaultdict
-
         time_groups: dict[float, list] = defaultdict(list)
 
         for note in notes:
@@ -787,6 +821,7 @@ class BeatmapEditorApp:
             # Store relative time offset from the first note
             copy.time = note.time - base_time
             self._clipboard.append(copy)
+        self._clipboard_duration = max(n.time for n in self._clipboard)
 
         self._set_status(f"Copied {len(self._clipboard)} marker(s)")
 
@@ -803,13 +838,19 @@ class BeatmapEditorApp:
 
         playhead = self.project.playhead
 
-        # Create new notes at playhead position + relative offsets
+        # Compute all pasted times at once: playhead + relative offsets,
+        # rounded and clamped to the valid range
+        times = playhead + np.fromiter((n.time for n in self._clipboard), dtype=float)
+        # round() rather than np.round, which can differ in the last digit
+        times = np.clip(
+            [round(t, 3) for t in times.tolist()], 0.0, self.project.duration
+        )
+
+        # Create new notes at the precomputed times
         notes_to_add = []
-        for clipboard_note in self._clipboard:
+        for clipboard_note, time in zip(self._clipboard, times.tolist()):
             new_note = clipboard_note.copy()
-            new_note.time = round(playhead + clipboard_note.time, 3)
-            # Clamp to valid range
-            new_note.time = max(0, min(new_note.time, self.project.duration))
+            new_note.time = time
             notes_to_add.append(new_note)
 
         if notes_to_add:
@@ -822,14 +863,9 @@ class BeatmapEditorApp:
                 note.selected = True
 
             # Move playhead to end of pasted selection if requested
-            if move_playhead_after and self._clipboard:
-                # Calculate the duration of the clipboard selection
-                # (time from first to last note in clipboard)
-                clipboard_duration = self._clipboard[
-                    -1
-                ].time  # Already relative to first note
+            if move_playhead_after:
                 # Move playhead to just after the last pasted note
-                new_playhead = playhead + clipboard_duration
+                new_playhead = playhead + self._clipboard_duration
                 # Clamp to valid range
                 self.project.playhead = max(0, min(new_playhead, self.project.duration))
 
@@ -903,20 +939,29 @@ class BeatmapEditorApp:
         after_playhead_only: bool = False,
     ):
         """Add markers at detected peak positions."""
-        from utils.peaks import waveform_to_lane_key
+        self._on_add_markers_from_peaks_batch(
+            [(waveform_key, peak_times)], after_playhead_only
+        )
 
-        if not peak_times:
+    def _on_add_markers_from_peaks_batch(
+        self,
+        track_peaks: list[tuple[str, list[float]]],
+        after_playhead_only: bool = False,
+    ):
+        """Add markers at detected peak positions for one or more tracks at once."""
+        track_peaks = [(key, peaks) for key, peaks in track_peaks if peaks]
+        if not track_peaks:
             self._set_status("No peaks to add")
             return
 
-        # Map waveform key to lane type
-        lane_type = waveform_to_lane_key(waveform_key)
-
         # Filter peaks to only those after playhead if requested
         if after_playhead_only:
             playhead = self.project.playhead
-            peak_times = [t for t in peak_times if t > playhead]
-            if not peak_times:
+            track_peaks = [
+                (key, [t for t in peaks if t > playhead]) for key, peaks in track_peaks
+            ]
+            track_peaks = [(key, peaks) for key, peaks in track_peaks if peaks]
+            if not track_peaks:
                 self._set_status("No peaks after playhead")
                 return
 
@@ -928,24 +973,41 @@ class BeatmapEditorApp:
         # Clear selection first
         self.project.beatmap.clear_selection()
 
-        existing_times = {
-            n.time for n in self.project.beatmap.notes if n.type == lane_type
-        }
         notes_to_add = []
+        lane_types = []
+        total_peaks = 0
+
+        for waveform_key, peak_times in track_peaks:
+            # Map waveform key to lane type
+            lane_type = waveform_to_lane_key(waveform_key)
+            lane_types.append(lane_type)
+            total_peaks += len(peak_times)
+
+            existing_ms = {
+                _ms(n.time) for n in self.project.beatmap.notes if n.type == lane_type
+            }
+
+            # Snap all peaks to the grid at once, reusing the scratch buffer
+            num_peaks = len(peak_times)
+            if self._snap_scratch.size < num_peaks:
+                self._snap_scratch = np.empty(num_peaks, dtype=np.float64)
+            snapped_times = snap_times_to_grid(
+                peak_times, grid, out=self._snap_scratch[:num_peaks]
+            )
 
-        for peak_time in peak_times:
-            # Snap to grid
-            snapped_time = snap_to_grid(peak_time, grid)
-            snapped_time = round(snapped_time, 3)
+            for snapped_time in snapped_times.tolist():
+                # Stored like _on_add_marker does; _ms() is only the dedupe key
+                snapped_time = round(snapped_time, 3)
+                snapped_ms = _ms(snapped_time)
 
-            # Skip if marker already exists at this time for this lane
-            if snapped_time in existing_times:
-                continue
+                # Skip if marker already exists at this time for this lane
+                if snapped_ms in existing_ms:
+                    continue
 
-            # Create note with default level 1
-            note = Note(time=snapped_time, level=1, type=lane_type)
-            notes_to_add.append(note)
-            existing_times.add(snapped_time)
+                # Create note with default level 1
+                note = Note(time=snapped_time, level=1, type=lane_type)
+                notes_to_add.append(note)
+                existing_ms.add(snapped_ms)
 
         # Add all notes in a single command (for single undo)
         if notes_to_add:
@@ -958,7 +1020,7 @@ class BeatmapEditorApp:
 
         mode_str = " after playhead" if after_playhead_only else ""
         self._set_status(
-            f"Added {len(notes_to_add)} markers from {len(peak_times)} peaks in {lane_type}{mode_str} (selected)"
+            f"Added {len(notes_to_add)} markers from {total_peaks} peaks in {', '.join(lane_types)}{mode_str} (selected)"
         )
         self._update_all()
 
@@ -982,8 +1044,7 @@ class BeatmapEditorApp:
             return
 
         # Generate beat grid at the specified interval
-        beat_duration = 60.0 / self.project.bpm
-        interval_duration = beat_duration * beats_interval
+        interval_duration = beat_duration(self.project.bpm) * beats_interval
 
         # Determine start time
         if start_from_playhead:
@@ -998,8 +1059,6 @@ class BeatmapEditorApp:
             start_time = 0.0
 
         # Generate grid times
-        import numpy as np
-
         num_markers = int(
             np.ceil((self.project.duration - start_time) / interval_duration)
         )
@@ -1007,8 +1066,8 @@ class BeatmapEditorApp:
         grid = grid[grid < self.project.duration]
 
         # Get existing marker times for this lane to avoid duplicates
-        existing_times = {
-            round(n.time, 3) for n in self.project.beatmap.notes if n.type == lane_type
+        existing_ms = {
+            _ms(n.time) for n in self.project.beatmap.notes if n.type == lane_type
         }
 
         # Clear selection first
@@ -1016,17 +1075,19 @@ class BeatmapEditorApp:
 
         notes_to_add = []
 
-        for time in grid:
+        # Python floats, so round() matches the time _on_add_marker stores
+        for time in grid.tolist():
             snapped_time = round(time, 3)
+            snapped_ms = _ms(snapped_time)
 
             # Skip if marker already exists at this time for this lane
-            if snapped_time in existing_times:
+            if snapped_ms in existing_ms:
                 continue
 
             # Create note with specified level
             note = Note(time=snapped_time, level=level, type=lane_type)
             notes_to_add.append(note)
-            existing_times.add(snapped_time)
+            existing_ms.add(snapped_ms)
 
         # Add all notes in a single command (for single undo)
         if notes_to_add:
@@ -1099,7 +1160,7 @@ class BeatmapEditorApp:
         """Handle playhead click - seek to time."""
         self.project.playhead = time
         self.audio_player.seek(time)
-        self._update_all()
+        self._update_all(redraw_timeline=False)
 
     # =========================================================================
     # Keyboard Handlers
@@ -1162,14 +1223,30 @@ class BeatmapEditorApp:
             mouse_pos = dpg.get_mouse_pos(local=False)
             local_pos = self.timeline._screen_to_local(mouse_pos)
             if local_pos:
-                center_time = local_pos[0] / self.timeline.zoom
+                self._wheel_center_time = local_pos[0] / self.timeline.zoom
             else:
-                center_time = self.timeline.get_visible_center_time()
+                self._wheel_center_time = self.timeline.get_visible_center_time()
 
+            # Trackpads fire many wheel events per flick - count one zoom step
+            # per event and apply them together on the next frame
             if app_data > 0:
-                self.timeline.zoom_in(center_time)
+                self._wheel_steps += 1
             elif app_data < 0:
-                self.timeline.zoom_out(center_time)
+                self._wheel_steps -= 1
+            self._wheel_pending = True
+
+    def _apply_wheel_zoom(self):
+        """Apply the mouse wheel zoom accumulated since the last frame."""
+        steps = self._wheel_steps
+        center_time = self._wheel_center_time
+        self._wheel_steps = 0
+        self._wheel_pending = False
+        self._wheel_center_time = None
+
+        if not self.timeline:
+            return
+        if steps:
+            self.timeline.zoom_steps(steps, center_time)
 
     # =========================================================================
     # Helpers
@@ -1179,11 +1256,20 @@ class BeatmapEditorApp:
         """Update status text (no-op, status text removed)."""
         pass  # Status text UI element removed
 
-    def _update_all(self):
-        """Force update all UI components."""
+    def _update_all(self, redraw_timeline: bool = True):
+        """
+        Force update all UI components.
+
+        Args:
+            redraw_timeline: Rebuild the timeline's static layer. Playhead-only
+                changes pass False, as the retained playhead is just moved.
+        """
         if self.transport:
             self.transport.update()
         if self.timeline:
+            # Selection, levels and peaks can change without the note count
+            if redraw_timeline:
+                self.timeline.mark_dirty()
             self.timeline.update()
         if self.preview:
             self.preview.update()
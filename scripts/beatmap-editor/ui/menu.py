@@ -4,17 +4,52 @@ File operations, edit commands, etc.
 """
 
 import dearpygui.dearpygui as dpg
-import platform
+import sys
 from typing import TYPE_CHECKING, Optional, Callable
 
+from core.constants import IS_MACOS, LEVEL_NAMES
+
 if TYPE_CHECKING:
     from core.project import Project
 
 # Use Cmd on macOS, Ctrl elsewhere
-MOD_KEY = "Cmd" if platform.system() == "Darwin" else "Ctrl"
+MOD_KEY = "Cmd" if IS_MACOS else "Ctrl"
+
+# Modifier shortcut labels, shared by the menu items and the shortcuts dialog
+SHORTCUTS = {
+    "new": f"{MOD_KEY}+N",
+    "open_audio": f"{MOD_KEY}+O",
+    "save": f"{MOD_KEY}+S",
+    "save_as": f"{MOD_KEY}+Shift+S",
+    "undo": f"{MOD_KEY}+Z",
+    "redo": f"{MOD_KEY}+Shift+Z",
+    "copy": f"{MOD_KEY}+C",
+    "paste": f"{MOD_KEY}+V",
+    "duplicate": f"{MOD_KEY}+D",
+    "select_all": f"{MOD_KEY}+A",
+    "multi_select": f"{MOD_KEY}+Click",
+}
+
+
+def _noop(*args) -> None:
+    """Default for unassigned menu callbacks, so dispatch needs no None check."""
+
+
+def _close_window(sender, app_data, user_data: int):
+    """Close button callback shared by the menu dialogs (user_data is the window)."""
+    dpg.hide_item(user_data)
+
 
 # Note types for selection menu
-NOTE_TYPES = ["base", "drum", "bass", "vocal", "lead"]
+# (interned, so track comparisons downstream can short-circuit on identity)
+NOTE_TYPES = tuple(sys.intern(t) for t in ("base", "drum", "bass", "vocal", "lead"))
+NOTE_TYPES_CAP = tuple(sys.intern(t.capitalize()) for t in NOTE_TYPES)
+
+# Menu labels per level, e.g. "Level 1 (Easy)"
+LEVEL_LABELS = {level: f"Level {level} ({name})" for level, name in LEVEL_NAMES.items()}
+
+# Lane choices for the Select Every Nth dialog
+_LANE_ITEMS = ["All Lanes", *NOTE_TYPES_CAP]
 
 
 class Menu:
@@ -22,324 +57,419 @@ class Menu:
     Menu bar with File, Edit, and Select menus.
     """
 
+    __slots__ = (
+        "project",
+        "on_new",
+        "on_open_audio",
+        "on_open_beatmap",
+        "on_save",
+        "on_save_as",
+        "on_undo",
+        "on_redo",
+        "on_copy",
+        "on_paste",
+        "on_duplicate",
+        "on_delete",
+        "on_snap_selection",
+        "on_cleanup_duplicates",
+        "on_select_all",
+        "on_deselect_all",
+        "on_select_by_track",
+        "on_select_by_level",
+        "on_select_by_track_and_level",
+        "on_select_every_nth",
+        "on_set_level",
+        "on_move_to_playhead",
+        "_menu_bar_tag",
+        "_lazy_submenus",
+        "_lazy_handler_registry",
+        "_shortcuts_window",
+        "_about_window",
+        "_nth_dialog_tag",
+        "_n_input_tag",
+        "_lane_combo_tag",
+    )
+
+    # Keyboard shortcuts dialog contents; None marks a separator
+    _SHORTCUT_LINES = (
+        "Playback",
+        "  Space         - Play/Pause",
+        None,
+        "File",
+        f"  {SHORTCUTS['new']:<14}- New Project",
+        f"  {SHORTCUTS['open_audio']:<14}- Open Audio",
+        f"  {SHORTCUTS['save']:<14}- Save Beatmap",
+        f"  {SHORTCUTS['save_as']:<14}- Save As",
+        None,
+        "Edit",
+        f"  {SHORTCUTS['undo']:<14}- Undo",
+        f"  {SHORTCUTS['redo']:<14}- Redo",
+        f"  {SHORTCUTS['copy']:<14}- Copy Selected",
+        f"  {SHORTCUTS['paste']:<14}- Paste at Playhead",
+        f"  {SHORTCUTS['duplicate']:<14}- Duplicate Selected",
+        "  Delete        - Delete Selected",
+        "  1/2/3         - Set Level for Selected",
+        None,
+        "Select",
+        f"  {SHORTCUTS['select_all']:<14}- Select All",
+        "  (Use Select menu for track/level/Nth selection)",
+        None,
+        "Markers",
+        "  Double-Click  - Add Marker / Cycle Level",
+        "  Click         - Select Marker",
+        f"  {SHORTCUTS['multi_select']:<14}- Multi-Select",
+    )
+
     def __init__(self, project: "Project"):
         self.project = project
 
         # Callbacks
-        self.on_new: Optional[Callable[[], None]] = None
-        self.on_open_audio: Optional[Callable[[], None]] = None
-        self.on_open_beatmap: Optional[Callable[[], None]] = None
-        self.on_save: Optional[Callable[[], None]] = None
-        self.on_save_as: Optional[Callable[[], None]] = None
-        self.on_undo: Optional[Callable[[], None]] = None
-        self.on_redo: Optional[Callable[[], None]] = None
-        self.on_copy: Optional[Callable[[], None]] = None
-        self.on_paste: Optional[Callable[[], None]] = None
-        self.on_duplicate: Optional[Callable[[], None]] = None
-        self.on_delete: Optional[Callable[[], None]] = None
-        self.on_snap_selection: Optional[Callable[[int], None]] = None
-        self.on_cleanup_duplicates: Optional[Callable[[], None]] = None
-        self.on_select_all: Optional[Callable[[], None]] = None
-        self.on_deselect_all: Optional[Callable[[], None]] = None
-        self.on_select_by_track: Optional[Callable[[str], None]] = None
-        self.on_select_by_level: Optional[Callable[[int], None]] = None
-        self.on_select_by_track_and_level: Optional[Callable[[str, int], None]] = None
-        self.on_select_every_nth: Optional[Callable[[int, str], None]] = None
-        self.on_set_level: Optional[Callable[[int], None]] = None
-        self.on_move_to_playhead: Optional[Callable[[], None]] = None
+        self.on_new: Callable[[], None] = _noop
+        self.on_open_audio: Callable[[], None] = _noop
+        self.on_open_beatmap: Callable[[], None] = _noop
+        self.on_save: Callable[[], None] = _noop
+        self.on_save_as: Callable[[], None] = _noop
+        self.on_undo: Callable[[], None] = _noop
+        self.on_redo: Callable[[], None] = _noop
+        self.on_copy: Callable[[], None] = _noop
+        self.on_paste: Callable[[], None] = _noop
+        self.on_duplicate: Callable[[], None] = _noop
+        self.on_delete: Callable[[], None] = _noop
+        self.on_snap_selection: Callable[[int], None] = _noop
+        self.on_cleanup_duplicates: Callable[[], None] = _noop
+        self.on_select_all: Callable[[], None] = _noop
+        self.on_deselect_all: Callable[[], None] = _noop
+        self.on_select_by_track: Callable[[str], None] = _noop
+        self.on_select_by_level: Callable[[int], None] = _noop
+        self.on_select_by_track_and_level: Callable[[str, int], None] = _noop
+        self.on_select_every_nth: Callable[[int, str], None] = _noop
+        self.on_set_level: Callable[[int], None] = _noop
+        self.on_move_to_playhead: Callable[[], None] = _noop
+
+        self._menu_bar_tag: Optional[int] = None
+
+        # Submenus whose items are built on first show: {menu_tag: builder}
+        self._lazy_submenus: dict[int, Callable[[int], None]] = {}
+        self._lazy_handler_registry: Optional[int] = None
+
+        # Static dialogs, built on first open and hidden on close
+        self._shortcuts_window: Optional[int] = None
+        self._about_window: Optional[int] = None
+        self._nth_dialog_tag: Optional[int] = None
+        self._n_input_tag: Optional[int] = None
+        self._lane_combo_tag: Optional[int] = None
 
     def create(self, parent: int):
-        """Create the menu bar."""
-        with dpg.menu_bar(parent=parent):
-            # File menu
-            with dpg.menu(label="File"):
-                dpg.add_menu_item(
-                    label="New",
-                    shortcut=f"{MOD_KEY}+N",
-                    callback=lambda: self._call(self.on_new),
-                )
-                dpg.add_separator()
-                dpg.add_menu_item(
-                    label="Open Audio...",
-                    shortcut=f"{MOD_KEY}+O",
-                    callback=lambda: self._call(self.on_open_audio),
-                )
-                dpg.add_menu_item(
-                    label="Open Beatmap...",
-                    callback=lambda: self._call(self.on_open_beatmap),
-                )
-                dpg.add_separator()
-                dpg.add_menu_item(
-                    label="Save",
-                    shortcut=f"{MOD_KEY}+S",
-                    callback=lambda: self._call(self.on_save),
-                )
-                dpg.add_menu_item(
-                    label="Save As...",
-                    shortcut=f"{MOD_KEY}+Shift+S",
-                    callback=lambda: self._call(self.on_save_as),
-                )
-
-            # Edit menu
-            with dpg.menu(label="Edit"):
-                dpg.add_menu_item(
-                    label="Undo",
-                    shortcut=f"{MOD_KEY}+Z",
-                    callback=lambda: self._call(self.on_undo),
-                )
-                dpg.add_menu_item(
-                    label="Redo",
-                    shortcut=f"{MOD_KEY}+Shift+Z",
-                    callback=lambda: self._call(self.on_redo),
-                )
-                dpg.add_separator()
-                dpg.add_menu_item(
-                    label="Copy",
-                    shortcut=f"{MOD_KEY}+C",
-                    callback=lambda: self._call(self.on_copy),
-                )
-                dpg.add_menu_item(
-                    label="Paste",
-                    shortcut=f"{MOD_KEY}+V",
-                    callback=lambda: self._call(self.on_paste),
-                )
-                dpg.add_menu_item(
-                    label="Duplicate",
-                    shortcut=f"{MOD_KEY}+D",
-                    callback=lambda: self._call(self.on_duplicate),
-                )
-                dpg.add_menu_item(
-                    label="Move to Playhead",
-                    shortcut="Opt+C",
-                    callback=lambda: self._call(self.on_move_to_playhead),
-                )
-                dpg.add_separator()
-                dpg.add_menu_item(
-                    label="Delete Selected",
-                    shortcut="Delete",
-                    callback=lambda: self._call(self.on_delete),
-                )
-                dpg.add_separator()
-
-                # Set Level submenu
-                with dpg.menu(label="Set Level"):
+        """Create the menu bar (no-op if it has already been built)."""
+        if self._menu_bar_tag is not None and dpg.does_item_exist(self._menu_bar_tag):
+            return
+
+        # Hold the DPG lock for the whole build instead of once per item
+        with dpg.mutex():
+            # Shared handler that populates deferred submenus on first show
+            with dpg.item_handler_registry() as self._lazy_handler_registry:
+                dpg.add_item_visible_handler(callback=self._on_submenu_visible)
+
+            with dpg.menu_bar(parent=parent) as self._menu_bar_tag:
+                # File menu
+                with dpg.menu(label="File"):
                     dpg.add_menu_item(
-                        label="Level 1 (Easy)",
-                        shortcut="1",
-                        callback=lambda: self._call_with_arg(self.on_set_level, 1),
+                        label="New",
+                        shortcut=SHORTCUTS["new"],
+                        callback=self._dispatch,
+                        user_data="on_new",
                     )
+                    dpg.add_separator()
                     dpg.add_menu_item(
-                        label="Level 2 (Medium)",
-                        shortcut="2",
-                        callback=lambda: self._call_with_arg(self.on_set_level, 2),
+                        label="Open Audio...",
+                        shortcut=SHORTCUTS["open_audio"],
+                        callback=self._dispatch,
+                        user_data="on_open_audio",
                     )
                     dpg.add_menu_item(
-                        label="Level 3 (Hard)",
-                        shortcut="3",
-                        callback=lambda: self._call_with_arg(self.on_set_level, 3),
+                        label="Open Beatmap...",
+                        callback=self._dispatch,
+                        user_data="on_open_beatmap",
+                    )
+                    dpg.add_separator()
+                    dpg.add_menu_item(
+                        label="Save",
+                        shortcut=SHORTCUTS["save"],
+                        callback=self._dispatch,
+                        user_data="on_save",
+                    )
+                    dpg.add_menu_item(
+                        label="Save As...",
+                        shortcut=SHORTCUTS["save_as"],
+                        callback=self._dispatch,
+                        user_data="on_save_as",
                     )
 
-                dpg.add_separator()
-
-                # Snap Selection to Beat submenu
-                with dpg.menu(label="Snap Selection to Beat"):
+                # Edit menu
+                with dpg.menu(label="Edit"):
+                    dpg.add_menu_item(
+                        label="Undo",
+                        shortcut=SHORTCUTS["undo"],
+                        callback=self._dispatch,
+                        user_data="on_undo",
+                    )
+                    dpg.add_menu_item(
+                        label="Redo",
+                        shortcut=SHORTCUTS["redo"],
+                        callback=self._dispatch,
+                        user_data="on_redo",
+                    )
+                    dpg.add_separator()
                     dpg.add_menu_item(
-                        label="1/16 (Sixteenth)",
-                        callback=self._make_snap_callback(16),
+                        label="Copy",
+                        shortcut=SHORTCUTS["copy"],
+                        callback=self._dispatch,
+                        user_data="on_copy",
                     )
                     dpg.add_menu_item(
-                        label="1/8 (Eighth)",
-                        callback=self._make_snap_callback(8),
+                        label="Paste",
+                        shortcut=SHORTCUTS["paste"],
+                        callback=self._dispatch,
+                        user_data="on_paste",
                     )
                     dpg.add_menu_item(
-                        label="1/4 (Quarter)",
-                        callback=self._make_snap_callback(4),
+                        label="Duplicate",
+                        shortcut=SHORTCUTS["duplicate"],
+                        callback=self._dispatch,
+                        user_data="on_duplicate",
                     )
                     dpg.add_menu_item(
-                        label="1/2 (Half)",
-                        callback=self._make_snap_callback(2),
+                        label="Move to Playhead",
+                        shortcut="Opt+C",
+                        callback=self._dispatch,
+                        user_data="on_move_to_playhead",
                     )
+                    dpg.add_separator()
                     dpg.add_menu_item(
-                        label="1 (Whole Beat)",
-                        callback=self._make_snap_callback(1),
+                        label="Delete Selected",
+                        shortcut="Delete",
+                        callback=self._dispatch,
+                        user_data="on_delete",
                     )
+                    dpg.add_separator()
 
-                dpg.add_menu_item(
-                    label="Clean Up Beat Markers",
-                    callback=lambda: self._call(self.on_cleanup_duplicates),
-                )
+                    # Set Level submenu
+                    self._add_lazy_submenu("Set Level", self._build_set_level_submenu)
+
+                    dpg.add_separator()
+
+                    # Snap Selection to Beat submenu
+                    self._add_lazy_submenu(
+                        "Snap Selection to Beat", self._build_snap_submenu
+                    )
 
-            # Select menu
-            with dpg.menu(label="Select"):
-                dpg.add_menu_item(
-                    label="Select All",
-                    shortcut=f"{MOD_KEY}+A",
-                    callback=lambda s, a: self._call(self.on_select_all),
-                )
-                dpg.add_menu_item(
-                    label="Deselect All",
-                    callback=lambda s, a: self._call(self.on_deselect_all),
-                )
-                dpg.add_separator()
-
-                # Select by Track submenu
-                with dpg.menu(label="Select by Track"):
-                    for track in NOTE_TYPES:
-                        dpg.add_menu_item(
-                            label=track.capitalize(),
-                            callback=self._make_track_callback(track),
-                        )
-
-                # Select by Level submenu
-                with dpg.menu(label="Select by Level"):
                     dpg.add_menu_item(
-                        label="Level 1 (Easy)",
-                        callback=self._make_level_callback(1),
+                        label="Clean Up Beat Markers",
+                        callback=self._dispatch,
+                        user_data="on_cleanup_duplicates",
                     )
+
+                # Select menu
+                with dpg.menu(label="Select"):
                     dpg.add_menu_item(
-                        label="Level 2 (Medium)",
-                        callback=self._make_level_callback(2),
+                        label="Select All",
+                        shortcut=SHORTCUTS["select_all"],
+                        callback=self._dispatch,
+                        user_data="on_select_all",
                     )
                     dpg.add_menu_item(
-                        label="Level 3 (Hard)",
-                        callback=self._make_level_callback(3),
+                        label="Deselect All",
+                        callback=self._dispatch,
+                        user_data="on_deselect_all",
                     )
+                    dpg.add_separator()
 
-                dpg.add_separator()
-
-                # Select by Track and Level submenu
-                with dpg.menu(label="Select by Track & Level"):
-                    for track in NOTE_TYPES:
-                        with dpg.menu(label=track.capitalize()):
-                            for level in [1, 2, 3]:
-                                level_name = {1: "Easy", 2: "Medium", 3: "Hard"}[level]
-                                dpg.add_menu_item(
-                                    label=f"Level {level} ({level_name})",
-                                    callback=self._make_track_level_callback(
-                                        track, level
-                                    ),
-                                )
-
-                dpg.add_separator()
-
-                # Select Every Nth After Cursor
-                dpg.add_menu_item(
-                    label="Select Every Nth After Cursor...",
-                    callback=lambda s, a: self._show_select_every_nth_dialog(),
-                )
+                    # Select by Track submenu
+                    self._add_lazy_submenu("Select by Track", self._build_track_submenu)
 
-            # Help menu
-            with dpg.menu(label="Help"):
-                dpg.add_menu_item(
-                    label="Keyboard Shortcuts",
-                    callback=self._show_shortcuts,
-                )
-                dpg.add_menu_item(
-                    label="About",
-                    callback=self._show_about,
-                )
+                    # Select by Level submenu
+                    self._add_lazy_submenu("Select by Level", self._build_level_submenu)
 
-    def _call(self, callback: Optional[Callable]):
-        """Safely call a callback."""
-        if callback:
-            callback()
+                    dpg.add_separator()
 
-    def _call_with_arg(self, callback: Optional[Callable], arg):
-        """Safely call a callback with one argument."""
-        if callback:
-            callback(arg)
+                    # Select by Track and Level submenu
+                    self._add_lazy_submenu(
+                        "Select by Track & Level", self._build_track_level_submenu
+                    )
 
-    def _call_with_two_args(self, callback: Optional[Callable], arg1, arg2):
-        """Safely call a callback with two arguments."""
-        if callback:
-            callback(arg1, arg2)
+                    dpg.add_separator()
 
-    def _make_track_callback(self, track: str):
-        """Create a callback for selecting by track (captures track value)."""
+                    # Select Every Nth After Cursor
+                    dpg.add_menu_item(
+                        label="Select Every Nth After Cursor...",
+                        callback=self._show_select_every_nth_dialog,
+                    )
 
-        def callback(sender, app_data):
-            self._call_with_arg(self.on_select_by_track, track)
+                # Help menu
+                with dpg.menu(label="Help"):
+                    dpg.add_menu_item(
+                        label="Keyboard Shortcuts",
+                        callback=self._show_shortcuts,
+                    )
+                    dpg.add_menu_item(
+                        label="About",
+                        callback=self._show_about,
+                    )
 
-        return callback
+    def _add_lazy_submenu(self, label: str, builder: Callable[[int], None]):
+        """Add an empty submenu whose items are built the first time it is shown."""
+        menu = dpg.add_menu(label=label)
+        self._lazy_submenus[menu] = builder
+        dpg.bind_item_handler_registry(menu, self._lazy_handler_registry)
+
+    def _on_submenu_visible(self, sender, app_data):
+        """Populate a deferred submenu on its first show (app_data is the menu)."""
+        builder = self._lazy_submenus.pop(app_data, None)
+        if builder:
+            builder(app_data)
+
+    def _build_set_level_submenu(self, menu: int):
+        """Build the Edit > Set Level items."""
+        for level, label in LEVEL_LABELS.items():
+            dpg.add_menu_item(
+                label=label,
+                shortcut=str(level),
+                callback=self._dispatch_set_level,
+                user_data=level,
+                parent=menu,
+            )
 
-    def _make_level_callback(self, level: int):
-        """Create a callback for selecting by level (captures level value)."""
+    def _build_snap_submenu(self, menu: int):
+        """Build the Edit > Snap Selection to Beat items."""
+        dpg.add_menu_item(
+            label="1/16 (Sixteenth)",
+            callback=self._dispatch_snap,
+            user_data=16,
+            parent=menu,
+        )
+        dpg.add_menu_item(
+            label="1/8 (Eighth)",
+            callback=self._dispatch_snap,
+            user_data=8,
+            parent=menu,
+        )
+        dpg.add_menu_item(
+            label="1/4 (Quarter)",
+            callback=self._dispatch_snap,
+            user_data=4,
+            parent=menu,
+        )
+        dpg.add_menu_item(
+            label="1/2 (Half)",
+            callback=self._dispatch_snap,
+            user_data=2,
+            parent=menu,
+        )
+        dpg.add_menu_item(
+            label="1 (Whole Beat)",
+            callback=self._dispatch_snap,
+            user_data=1,
+            parent=menu,
+        )
+
+    def _build_track_submenu(self, menu: int):
+        """Build the Select > Select by Track items."""
+        for track, track_label in zip(NOTE_TYPES, NOTE_TYPES_CAP):
+            dpg.add_menu_item(
+                label=track_label,
+                callback=self._dispatch_track,
+                user_data=track,
+                parent=menu,
+            )
 
-        def callback(sender, app_data):
-            self._call_with_arg(self.on_select_by_level, level)
+    def _build_level_submenu(self, menu: int):
+        """Build the Select > Select by Level items."""
+        for level, label in LEVEL_LABELS.items():
+            dpg.add_menu_item(
+                label=label,
+                callback=self._dispatch_level,
+                user_data=level,
+                parent=menu,
+            )
 
-        return callback
+    def _build_track_level_submenu(self, menu: int):
+        """Build the Select > Select by Track & Level items."""
+        for track, track_label in zip(NOTE_TYPES, NOTE_TYPES_CAP):
+            with dpg.menu(label=track_label, parent=menu):
+                for level, label in LEVEL_LABELS.items():
+                    dpg.add_menu_item(
+                        label=label,
+                        callback=self._dispatch_track_level,
+                        user_data=(track, level),
+                    )
 
-    def _make_track_level_callback(self, track: str, level: int):
-        """Create a callback for selecting by track and level (captures both values)."""
+    def _dispatch(self, sender, app_data, user_data: str):
+        """Invoke the on_* callback named by user_data."""
+        getattr(self, user_data)()
 
-        def callback(sender, app_data):
-            self._call_with_two_args(self.on_select_by_track_and_level, track, level)
+    def _dispatch_set_level(self, sender, app_data, user_data: int):
+        """Invoke on_set_level with the level stored in user_data."""
+        self.on_set_level(user_data)
 
-        return callback
+    def _dispatch_snap(self, sender, app_data, user_data: int):
+        """Invoke on_snap_selection with the subdivision stored in user_data."""
+        self.on_snap_selection(user_data)
 
-    def _make_snap_callback(self, subdivision: int):
-        """Create a callback for snapping selection to a beat subdivision."""
+    def _dispatch_track(self, sender, app_data, user_data: str):
+        """Invoke on_select_by_track with the track stored in user_data."""
+        self.on_select_by_track(user_data)
 
-        def callback(sender, app_data):
-            self._call_with_arg(self.on_snap_selection, subdivision)
+    def _dispatch_level(self, sender, app_data, user_data: int):
+        """Invoke on_select_by_level with the level stored in user_data."""
+        self.on_select_by_level(user_data)
 
-        return callback
+    def _dispatch_track_level(self, sender, app_data, user_data: tuple[str, int]):
+        """Invoke on_select_by_track_and_level with the (track, level) pair."""
+        self.on_select_by_track_and_level(*user_data)
 
     def _show_shortcuts(self):
-        """Show keyboard shortcuts dialog."""
+        """Show keyboard shortcuts dialog (built once, then re-shown)."""
+        if self._shortcuts_window is not None:
+            dpg.configure_item(self._shortcuts_window, show=True)
+            return
+
         with dpg.window(
             label="Keyboard Shortcuts",
             modal=True,
             width=400,
             height=450,
             pos=(200, 100),
-        ):
-            dpg.add_text("Playback")
-            dpg.add_text("  Space         - Play/Pause")
-            dpg.add_separator()
-            dpg.add_text("File")
-            dpg.add_text(f"  {MOD_KEY}+N        - New Project")
-            dpg.add_text(f"  {MOD_KEY}+O        - Open Audio")
-            dpg.add_text(f"  {MOD_KEY}+S        - Save Beatmap")
-            dpg.add_text(f"  {MOD_KEY}+Shift+S  - Save As")
-            dpg.add_separator()
-            dpg.add_text("Edit")
-            dpg.add_text(f"  {MOD_KEY}+Z        - Undo")
-            dpg.add_text(f"  {MOD_KEY}+Shift+Z  - Redo")
-            dpg.add_text(f"  {MOD_KEY}+C        - Copy Selected")
-            dpg.add_text(f"  {MOD_KEY}+V        - Paste at Playhead")
-            dpg.add_text(f"  {MOD_KEY}+D        - Duplicate Selected")
-            dpg.add_text("  Delete        - Delete Selected")
-            dpg.add_text("  1/2/3         - Set Level for Selected")
-            dpg.add_separator()
-            dpg.add_text("Select")
-            dpg.add_text(f"  {MOD_KEY}+A        - Select All")
-            dpg.add_text("  (Use Select menu for track/level/Nth selection)")
-            dpg.add_separator()
-            dpg.add_text("Markers")
-            dpg.add_text("  Double-Click  - Add Marker / Cycle Level")
-            dpg.add_text("  Click         - Select Marker")
-            dpg.add_text(f"  {MOD_KEY}+Click    - Multi-Select")
+        ) as self._shortcuts_window:
+            for line in self._SHORTCUT_LINES:
+                if line is None:
+                    dpg.add_separator()
+                else:
+                    dpg.add_text(line)
             dpg.add_separator()
             dpg.add_button(
                 label="Close",
-                callback=lambda: dpg.delete_item(dpg.get_item_parent(dpg.last_item())),
+                callback=_close_window,
+                user_data=self._shortcuts_window,
             )
 
     def _show_select_every_nth_dialog(self):
         """Show dialog for selecting every Nth marker after cursor in a lane."""
-        dialog_tag = dpg.generate_uuid()
+        if self._nth_dialog_tag is None:
+            self._build_select_every_nth_dialog()
+        else:
+            dpg.set_value(self._n_input_tag, 2)
+            dpg.set_value(self._lane_combo_tag, "All Lanes")
+            dpg.configure_item(self._nth_dialog_tag, show=True)
+
+    def _build_select_every_nth_dialog(self):
+        """Build the Select Every Nth dialog; it is hidden rather than deleted."""
 
         def on_apply():
-            n_value = int(dpg.get_value(n_input_tag))
-            lane = dpg.get_value(lane_combo_tag)
-            if n_value >= 1 and self.on_select_every_nth:
+            n_value = int(dpg.get_value(self._n_input_tag))
+            lane = dpg.get_value(self._lane_combo_tag)
+            if n_value >= 1:
                 self.on_select_every_nth(n_value, lane)
-            dpg.delete_item(dialog_tag)
-
-        def on_cancel():
-            dpg.delete_item(dialog_tag)
+            dpg.hide_item(self._nth_dialog_tag)
 
         with dpg.window(
             label="Select Every Nth After Cursor",
@@ -347,15 +477,14 @@ class Menu:
             width=320,
             height=180,
             pos=(250, 150),
-            tag=dialog_tag,
-        ):
+        ) as self._nth_dialog_tag:
             dpg.add_text("Select every Nth beat marker after the cursor")
             dpg.add_text("position in the specified lane.")
             dpg.add_spacer(height=10)
 
             with dpg.group(horizontal=True):
                 dpg.add_text("Every")
-                n_input_tag = dpg.add_input_int(
+                self._n_input_tag = dpg.add_input_int(
                     default_value=2,
                     min_value=1,
                     max_value=100,
@@ -367,8 +496,8 @@ class Menu:
 
             with dpg.group(horizontal=True):
                 dpg.add_text("Lane:")
-                lane_combo_tag = dpg.add_combo(
-                    items=["All Lanes"] + [t.capitalize() for t in NOTE_TYPES],
+                self._lane_combo_tag = dpg.add_combo(
+                    items=_LANE_ITEMS,
                     default_value="All Lanes",
                     width=150,
                 )
@@ -377,17 +506,26 @@ class Menu:
 
             with dpg.group(horizontal=True):
                 dpg.add_button(label="Select", callback=on_apply, width=100)
-                dpg.add_button(label="Cancel", callback=on_cancel, width=100)
+                dpg.add_button(
+                    label="Cancel",
+                    callback=_close_window,
+                    user_data=self._nth_dialog_tag,
+                    width=100,
+                )
 
     def _show_about(self):
-        """Show about dialog."""
+        """Show about dialog (built once, then re-shown)."""
+        if self._about_window is not None:
+            dpg.configure_item(self._about_window, show=True)
+            return
+
         with dpg.window(
             label="About",
             modal=True,
             width=300,
             height=150,
             pos=(250, 150),
-        ):
+        ) as self._about_window:
             dpg.add_text("Beatmap Editor")
             dpg.add_text("Version 1.0")
             dpg.add_spacer(height=10)
@@ -396,5 +534,6 @@ class Menu:
             dpg.add_spacer(height=10)
             dpg.add_button(
                 label="Close",
-                callback=lambda: dpg.delete_item(dpg.get_item_parent(dpg.last_item())),
+                callback=_close_window,
+                user_data=self._about_window,
             )
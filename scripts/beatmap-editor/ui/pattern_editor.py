@@ -5,19 +5,23 @@ Allows visual editing with live preview before applying changes.
 """
 
 import dearpygui.dearpygui as dpg
-from typing import TYPE_CHECKING, Optional, Callable, List
+from typing import TYPE_CHECKING, Optional, Callable, Dict, List
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
     from core.project import Project
     from core.beatmap import Note
 
+# XOR flips a pattern byte between 'o' and 'x'
+_TOGGLE_MARKER = ord("o") ^ ord("x")
+_INVERT_PATTERN = bytes.maketrans(b"ox", b"xo")
+
 
 @dataclass
 class PatternSlot:
     """Represents a single slot in the pattern."""
 
-    time: float  # Grid time position
+    time: float  # Grid time position (rounded to ms; used as the lookup key)
     has_marker: bool  # Whether there's a marker at this position
     original_marker: bool  # Original state (for preview/cancel)
     note: Optional["Note"] = None  # Reference to existing note (if any)
@@ -35,6 +39,12 @@ class PatternEditor:
     SLOT_SIZE = 24  # Size of each pattern slot button
     SLOT_SPACING = 2
 
+    # Slot button colors (normal, hovered) for marker / empty slots
+    _ON_COLOR = (51, 204, 51, 255)
+    _ON_HOVER = (81, 234, 81, 255)
+    _OFF_COLOR = (60, 60, 60, 255)
+    _OFF_HOVER = (80, 80, 80, 255)
+
     def __init__(self, project: "Project"):
         self.project = project
 
@@ -46,17 +56,34 @@ class PatternEditor:
 
         # Original state for restoration on cancel
         self._original_notes: List["Note"] = []
+        self._original_notes_by_time: Dict[float, "Note"] = {}
         # Store the original beatmap state for cancel
         self._original_beatmap_notes: List["Note"] = []
         # Store the original pattern string for "Apply to All"
         self._original_pattern: str = ""
+        # Current pattern as 'o'/'x' bytes, kept in step with pattern_slots
+        self._pattern_bytes = bytearray()
         # Store the grid step duration for pattern matching
         self._grid_step: float = 0.0
+        # Time range covered by pattern_slots
+        self._slot_min_time: float = 0.0
+        self._slot_max_time: float = 0.0
 
         # UI tags
         self._modal_tag: Optional[int] = None
         self._pattern_group_tag: Optional[int] = None
         self._pattern_text_tag: Optional[int] = None
+        # Pattern text last pushed to the label, to skip redundant set_value calls
+        self._last_pattern_str: str = ""
+
+        # Slot buttons, their last rendered state, and the shared on/off themes
+        self._slot_btn_tags: List[int] = []
+        self._rendered_markers: List[bool] = []
+        self._on_theme: Optional[int] = None
+        self._off_theme: Optional[int] = None
+
+        # Set when slot changes are waiting for the next-frame refresh
+        self._dirty = False
 
         # Callbacks - now includes notes_added and notes_removed for history
         self.on_apply: Optional[Callable[[List["Note"], List["Note"]], None]] = None
@@ -88,8 +115,14 @@ class PatternEditor:
         self.level = selected_notes[0].level
         self.selected_notes = selected_notes
 
-        # Store original notes for cancel restoration
+        # Millisecond-rounded time keys, computed once per note and shared by
+        # every lookup below (slot times are stored already rounded)
+        note_keys = [round(n.time, 3) for n in selected_notes]
+
+        # Store original notes for cancel restoration (private copies, so they
+        # can be handed to the apply callbacks as-is)
         self._original_notes = [n.copy() for n in selected_notes]
+        self._original_notes_by_time = dict(zip(note_keys, self._original_notes))
 
         # Calculate grid step for pattern matching
         sorted_grid = sorted(grid_times)
@@ -99,19 +132,13 @@ class PatternEditor:
             self._grid_step = 0.0
 
         # Build pattern slots from grid times
-        note_times = {round(n.time, 3) for n in selected_notes}
+        note_by_time = dict(zip(note_keys, selected_notes))
         self.pattern_slots = []
 
         for grid_time in sorted_grid:
             rounded_time = round(grid_time, 3)
-            has_marker = rounded_time in note_times
-
-            # Find the actual note if it exists
-            note = None
-            for n in selected_notes:
-                if round(n.time, 3) == rounded_time:
-                    note = n
-                    break
+            note = note_by_time.get(rounded_time)
+            has_marker = note is not None
 
             self.pattern_slots.append(
                 PatternSlot(
@@ -125,8 +152,13 @@ class PatternEditor:
         if not self.pattern_slots:
             return False
 
+        # Slots follow the sorted grid, so the ends give the selection bounds
+        self._slot_min_time = self.pattern_slots[0].time
+        self._slot_max_time = self.pattern_slots[-1].time
+
         # Store original pattern for "Apply to All" matching
         self._original_pattern = self._get_original_pattern_string()
+        self._pattern_bytes = bytearray(self._original_pattern, "ascii")
 
         self._create_modal()
         return True
@@ -141,6 +173,7 @@ class PatternEditor:
         """Create the modal dialog UI."""
         # Generate unique tag for this modal instance
         self._modal_tag = dpg.generate_uuid()
+        self._create_themes()
 
         with dpg.window(
             tag=self._modal_tag,
@@ -158,8 +191,9 @@ class PatternEditor:
             dpg.add_spacer(height=10)
 
             # Pattern display (text representation)
+            self._last_pattern_str = self._get_pattern_string()
             self._pattern_text_tag = dpg.add_text(
-                self._get_pattern_string(), color=(150, 200, 255, 255)
+                self._last_pattern_str, color=(150, 200, 255, 255)
             )
 
             dpg.add_spacer(height=10)
@@ -202,6 +236,21 @@ class PatternEditor:
                 color=(150, 150, 150, 255),
             )
 
+    def _create_themes(self):
+        """Create the shared on/off slot button themes (once per editor)."""
+        if self._on_theme is not None:
+            return
+
+        with dpg.theme() as self._on_theme:
+            with dpg.theme_component(dpg.mvButton):
+                dpg.add_theme_color(dpg.mvThemeCol_Button, self._ON_COLOR)
+                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, self._ON_HOVER)
+
+        with dpg.theme() as self._off_theme:
+            with dpg.theme_component(dpg.mvButton):
+                dpg.add_theme_color(dpg.mvThemeCol_Button, self._OFF_COLOR)
+                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, self._OFF_HOVER)
+
     def _create_pattern_slots(self):
         """Create clickable slot buttons for each grid position."""
         if not self._pattern_group_tag:
@@ -209,37 +258,32 @@ class PatternEditor:
 
         # Clear existing children
         dpg.delete_item(self._pattern_group_tag, children_only=True)
+        self._slot_btn_tags = []
+        self._rendered_markers = []
 
         for i, slot in enumerate(self.pattern_slots):
             # Create a small button for each slot
-            label = "o" if slot.has_marker else "x"
-            color = (51, 204, 51, 255) if slot.has_marker else (100, 100, 100, 255)
-
-            with dpg.group(parent=self._pattern_group_tag):
-                btn = dpg.add_button(
-                    label=label,
-                    callback=self._on_slot_click,
-                    user_data=i,
-                    width=self.SLOT_SIZE,
-                    height=self.SLOT_SIZE,
-                )
+            btn = dpg.add_button(
+                label="o" if slot.has_marker else "x",
+                callback=self._on_slot_click,
+                user_data=i,
+                width=self.SLOT_SIZE,
+                height=self.SLOT_SIZE,
+                parent=self._pattern_group_tag,
+            )
+            dpg.bind_item_theme(
+                btn, self._on_theme if slot.has_marker else self._off_theme
+            )
+            self._slot_btn_tags.append(btn)
+            self._rendered_markers.append(slot.has_marker)
 
-                # Apply color theme
-                with dpg.theme() as btn_theme:
-                    with dpg.theme_component(dpg.mvButton):
-                        dpg.add_theme_color(
-                            dpg.mvThemeCol_Button,
-                            color if slot.has_marker else (60, 60, 60, 255),
-                        )
-                        dpg.add_theme_color(
-                            dpg.mvThemeCol_ButtonHovered,
-                            (
-                                (color[0] + 30, color[1] + 30, color[2] + 30, 255)
-                                if slot.has_marker
-                                else (80, 80, 80, 255)
-                            ),
-                        )
-                dpg.bind_item_theme(btn, btn_theme)
+    def _refresh_slot(self, index: int):
+        """Update one slot button's label and theme to match its state."""
+        has_marker = self.pattern_slots[index].has_marker
+        btn = self._slot_btn_tags[index]
+        dpg.set_item_label(btn, "o" if has_marker else "x")
+        dpg.bind_item_theme(btn, self._on_theme if has_marker else self._off_theme)
+        self._rendered_markers[index] = has_marker
 
     def _on_slot_click(self, sender, app_data, user_data):
         """Handle slot button click."""
@@ -252,90 +296,107 @@ class PatternEditor:
             self.pattern_slots[index].has_marker = not self.pattern_slots[
                 index
             ].has_marker
-            self._update_display()
-            self._update_live_preview()
+            self._pattern_bytes[index] ^= _TOGGLE_MARKER
+            self._request_update()
+
+    def _request_update(self):
+        """Schedule one display + live preview refresh for the next frame."""
+        if self._dirty:
+            return
+        self._dirty = True
+        dpg.set_frame_callback(dpg.get_frame_count() + 1, self._flush_update)
+
+    def _flush_update(self, sender=None, app_data=None):
+        """Run a pending refresh, coalescing all changes since the last one."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._update_display()
+        self._update_live_preview()
 
     def _get_pattern_string(self) -> str:
         """Get the pattern as a string like 'oxxooxoo'."""
-        return "".join("o" if slot.has_marker else "x" for slot in self.pattern_slots)
+        return self._pattern_bytes.decode("ascii")
 
     def _update_display(self):
         """Update the visual display of the pattern."""
         # Update text representation
-        if self._pattern_text_tag:
-            dpg.set_value(self._pattern_text_tag, self._get_pattern_string())
+        pattern = self._get_pattern_string()
+        if self._pattern_text_tag and pattern != self._last_pattern_str:
+            dpg.set_value(self._pattern_text_tag, pattern)
+            self._last_pattern_str = pattern
 
-        # Recreate slot buttons to reflect new state
-        self._create_pattern_slots()
+        # Refresh only the slot buttons whose state changed
+        for i, slot in enumerate(self.pattern_slots):
+            if slot.has_marker != self._rendered_markers[i]:
+                self._refresh_slot(i)
 
     def _update_live_preview(self):
         """Apply live preview by modifying the beatmap temporarily."""
         # This is called on every change for live preview
         # The actual notes are modified in real-time
 
-        # Find notes to add and remove
-        times_to_add = []
-        times_to_remove = []
-
-        for slot in self.pattern_slots:
-            if slot.has_marker and slot.note is None:
-                # Need to add a marker here
-                times_to_add.append(slot.time)
-            elif not slot.has_marker and slot.note is not None:
-                # Need to remove this marker
-                times_to_remove.append(slot.time)
-
-        # Apply preview changes to beatmap
-        from core.beatmap import Note
+        from core.beatmap import Note, insort_note
 
-        # Remove markers
+        # One pass over the slots collects both removals and additions
+        removed_ids = set()
+        new_notes = []
         for slot in self.pattern_slots:
-            if not slot.has_marker and slot.note is not None:
-                if slot.note in self.project.beatmap.notes:
-                    self.project.beatmap._notes.remove(slot.note)
+            if slot.has_marker:
+                if slot.note is None:
+                    new_note = Note(
+                        time=slot.time, level=self.level, type=self.lane_type
+                    )
+                    # Select the new note to keep it in the selection
+                    new_note.selected = True
+                    new_notes.append(new_note)
+                    slot.note = new_note
+            elif slot.note is not None:
+                removed_ids.add(id(slot.note))
                 slot.note = None
 
-        # Add markers
-        for slot in self.pattern_slots:
-            if slot.has_marker and slot.note is None:
-                new_note = Note(time=slot.time, level=self.level, type=self.lane_type)
-                self.project.beatmap._notes.append(new_note)
-                self.project.beatmap._notes.sort(key=lambda n: n.time)
-                slot.note = new_note
-                # Select the new note to keep it in the selection
-                new_note.selected = True
+        # Then commit them to the beatmap: one sweep for removals, one insert/sort
+        notes = self.project.beatmap._notes
+        if removed_ids:
+            notes[:] = [n for n in notes if id(n) not in removed_ids]
+        if len(new_notes) == 1:
+            # Single toggle: binary-search insert instead of a full sort
+            insort_note(notes, new_notes[0])
+        elif new_notes:
+            notes.extend(new_notes)
+            notes.sort(key=lambda n: n.time)
 
     def _set_all_on(self, sender=None, app_data=None):
         """Set all slots to have markers."""
         for slot in self.pattern_slots:
             slot.has_marker = True
-        self._update_display()
-        self._update_live_preview()
+        self._pattern_bytes[:] = b"o" * len(self._pattern_bytes)
+        self._request_update()
 
     def _set_all_off(self, sender=None, app_data=None):
         """Set all slots to be empty."""
         for slot in self.pattern_slots:
             slot.has_marker = False
-        self._update_display()
-        self._update_live_preview()
+        self._pattern_bytes[:] = b"x" * len(self._pattern_bytes)
+        self._request_update()
 
     def _invert_pattern(self, sender=None, app_data=None):
         """Invert the pattern (toggle all slots)."""
         for slot in self.pattern_slots:
             slot.has_marker = not slot.has_marker
-        self._update_display()
-        self._update_live_preview()
+        self._pattern_bytes = self._pattern_bytes.translate(_INVERT_PATTERN)
+        self._request_update()
 
     def _reset_pattern(self, sender=None, app_data=None):
         """Reset pattern to original state."""
         for slot in self.pattern_slots:
             slot.has_marker = slot.original_marker
-        self._update_display()
-        self._update_live_preview()
+        self._pattern_bytes[:] = self._original_pattern.encode("ascii")
+        self._request_update()
 
     def _on_apply(self, sender=None, app_data=None):
         """Apply the pattern changes and close."""
-        from core.beatmap import Note
+        self._flush_update()
 
         # Collect notes that were added and removed
         notes_added = []
@@ -348,10 +409,9 @@ class PatternEditor:
                     notes_added.append(slot.note.copy())
             elif not slot.has_marker and slot.original_marker:
                 # This slot was removed - find the original note
-                for orig_note in self._original_notes:
-                    if round(orig_note.time, 3) == round(slot.time, 3):
-                        notes_removed.append(orig_note.copy())
-                        break
+                orig_note = self._original_notes_by_time.get(slot.time)
+                if orig_note is not None:
+                    notes_removed.append(orig_note)
 
         # Close the modal
         self._close()
@@ -362,6 +422,7 @@ class PatternEditor:
 
     def _on_apply_to_all(self, sender=None, app_data=None):
         """Apply pattern changes to all matching occurrences in the lane."""
+        self._flush_update()
         from core.beatmap import Note
 
         # First, collect the changes for the current selection (same as _on_apply)
@@ -376,86 +437,143 @@ class PatternEditor:
             self._on_apply()
             return
 
+        # An unchanged pattern edits nothing elsewhere, and an all-empty original
+        # has no marker to anchor matches on, so skip the lane scan for both
+        if (
+            self._get_pattern_string() == self._original_pattern
+            or "o" not in self._original_pattern
+        ):
+            self._on_apply()
+            return
+
         # Collect changes for current selection
         for slot in self.pattern_slots:
             if slot.has_marker and not slot.original_marker:
                 if slot.note:
                     notes_added.append(slot.note.copy())
             elif not slot.has_marker and slot.original_marker:
-                for orig_note in self._original_notes:
-                    if round(orig_note.time, 3) == round(slot.time, 3):
-                        notes_removed.append(orig_note.copy())
-                        break
+                orig_note = self._original_notes_by_time.get(slot.time)
+                if orig_note is not None:
+                    notes_removed.append(orig_note)
 
         # Now find all other occurrences of the original pattern in the lane
         # and apply the same transformation
-        all_notes_in_lane = [
-            n for n in self.project.beatmap.notes if n.type == self.lane_type
-        ]
-        all_note_times = {round(n.time, 3): n for n in all_notes_in_lane}
+        step = self._grid_step
+        lane_type = self.lane_type
+
+        # One pass over the beatmap builds both the lane's time -> note map and
+        # its bitmask over grid positions (bit g = note at g*step), so each
+        # candidate start is checked with one shift/and/compare
+        all_note_times = {}
+        lane_bits = 0
+        for n in self.project.beatmap.notes:
+            if n.type != lane_type:
+                continue
+            note_time = round(n.time, 3)
+            all_note_times[note_time] = n
+            grid_index = round(note_time / step)
+            if round(grid_index * step, 3) == note_time:
+                lane_bits |= 1 << grid_index
 
         # Get the current selection time range to exclude it
-        current_min_time = min(slot.time for slot in self.pattern_slots) - 0.001
-        current_max_time = max(slot.time for slot in self.pattern_slots) + 0.001
+        current_min_time = self._slot_min_time - 0.001
+        current_max_time = self._slot_max_time + 0.001
 
         # Find pattern matches by scanning through possible start positions
-        pattern_duration = (pattern_length - 1) * self._grid_step
+        pattern_duration = (pattern_length - 1) * step
         matches_count = 0
 
-        # Generate all possible start times on the grid
-        min_note_time = min(all_note_times.keys()) if all_note_times else 0
-        max_note_time = (
-            max(all_note_times.keys()) if all_note_times else self.project.duration
-        )
+        # Hoist slot state into locals: the original pattern as a bitmask, and
+        # the slot offsets each match gains or loses a marker at
+        expected = tuple(slot.original_marker for slot in self.pattern_slots)
+        pattern_bits = 0
+        for i, marked in enumerate(expected):
+            if marked:
+                pattern_bits |= 1 << i
+        add_offsets = [
+            i
+            for i, slot in enumerate(self.pattern_slots)
+            if slot.has_marker and not expected[i]
+        ]
+        remove_offsets = [
+            i
+            for i, slot in enumerate(self.pattern_slots)
+            if not slot.has_marker and expected[i]
+        ]
+        pattern_mask = (1 << pattern_length) - 1
+
+        if self.project.duration >= pattern_duration:
+            num_starts = (
+                int((self.project.duration - pattern_duration) / step + 1e-9) + 1
+            )
+        else:
+            num_starts = 0
+
+        # Edits buffered until the scan is done: new notes, and ids of notes to
+        # drop (Note is unhashable)
+        new_notes = []
+        removed_ids = set()
+        beatmap_notes = self.project.beatmap._notes
+        level = self.level
+
+        # A match must put a note under the pattern's first 'o', so jump straight
+        # to starts where that bit is set (lane_bits is re-read after each edit).
+        # The all-empty original returned early, so pattern_bits is non-zero
+        first_marker = (pattern_bits & -pattern_bits).bit_length() - 1
 
         # Scan through potential pattern start positions
-        current_time = 0.0
-        while current_time + pattern_duration <= self.project.duration:
+        start = -1
+        while True:
+            start += 1
+            rest = lane_bits >> (start + first_marker)
+            if not rest:
+                break
+            start += (rest & -rest).bit_length() - 1
+            if start >= num_starts:
+                break
+            current_time = start * step
+
             # Skip if this overlaps with the current selection
             pattern_end = current_time + pattern_duration
             if not (pattern_end < current_min_time or current_time > current_max_time):
-                current_time += self._grid_step
                 continue
 
             # Check if this position matches the original pattern
-            matches = True
-            for i, slot in enumerate(self.pattern_slots):
-                check_time = round(current_time + i * self._grid_step, 3)
-                has_note = check_time in all_note_times
-                expected = slot.original_marker
-                if has_note != expected:
-                    matches = False
-                    break
-
-            if matches:
-                matches_count += 1
-                # Apply the same transformation to this occurrence
-                for i, slot in enumerate(self.pattern_slots):
-                    check_time = round(current_time + i * self._grid_step, 3)
-
-                    if slot.has_marker and not slot.original_marker:
-                        # Need to add a note here
-                        if check_time not in all_note_times:
-                            new_note = Note(
-                                time=check_time, level=self.level, type=self.lane_type
-                            )
-                            self.project.beatmap._notes.append(new_note)
-                            notes_added.append(new_note.copy())
-                            all_note_times[check_time] = new_note
-
-                    elif not slot.has_marker and slot.original_marker:
-                        # Need to remove a note here
-                        if check_time in all_note_times:
-                            note_to_remove = all_note_times[check_time]
-                            if note_to_remove in self.project.beatmap._notes:
-                                notes_removed.append(note_to_remove.copy())
-                                self.project.beatmap._notes.remove(note_to_remove)
-                                del all_note_times[check_time]
-
-            current_time += self._grid_step
-
-        # Sort the notes after all modifications
-        self.project.beatmap._notes.sort(key=lambda n: n.time)
+            if (lane_bits >> start) & pattern_mask != pattern_bits:
+                continue
+
+            matches_count += 1
+            # Apply the same transformation to this occurrence; lane_bits doubles
+            # as the membership test, so only real edits touch the time map
+            for i in add_offsets:
+                # Need to add a note here
+                bit = 1 << (start + i)
+                if not lane_bits & bit:
+                    check_time = round((start + i) * step, 3)
+                    new_note = Note(time=check_time, level=level, type=lane_type)
+                    new_notes.append(new_note)
+                    notes_added.append(new_note.copy())
+                    all_note_times[check_time] = new_note
+                    lane_bits |= bit
+
+            for i in remove_offsets:
+                # Need to remove a note here
+                bit = 1 << (start + i)
+                if lane_bits & bit:
+                    note_to_remove = all_note_times.pop(round((start + i) * step, 3))
+                    # Already detached from the beatmap, so no copy is needed
+                    note_to_remove.selected = False
+                    notes_removed.append(note_to_remove)
+                    removed_ids.add(id(note_to_remove))
+                    lane_bits &= ~bit
+
+        # Commit all edits at once: drop removed notes in one sweep, append the
+        # surviving new notes, then sort after all modifications
+        if removed_ids:
+            beatmap_notes[:] = [n for n in beatmap_notes if id(n) not in removed_ids]
+            new_notes = [n for n in new_notes if id(n) not in removed_ids]
+        beatmap_notes.extend(new_notes)
+        beatmap_notes.sort(key=lambda n: n.time)
 
         # Close the modal
         self._close()
@@ -484,19 +602,16 @@ class PatternEditor:
         from core.beatmap import Note
 
         # Remove all notes in the current selection range from this lane
-        min_time = min(slot.time for slot in self.pattern_slots) - 0.001
-        max_time = max(slot.time for slot in self.pattern_slots) + 0.001
+        min_time = self._slot_min_time - 0.001
+        max_time = self._slot_max_time + 0.001
 
-        notes_to_remove = [
+        notes = self.project.beatmap._notes
+        notes[:] = [
             n
-            for n in self.project.beatmap.notes
-            if n.type == self.lane_type and min_time <= n.time <= max_time
+            for n in notes
+            if not (n.type == self.lane_type and min_time <= n.time <= max_time)
         ]
 
-        for note in notes_to_remove:
-            if note in self.project.beatmap._notes:
-                self.project.beatmap._notes.remove(note)
-
         # Add back the original notes
         for original_note in self._original_notes:
             new_note = Note(
@@ -505,9 +620,9 @@ class PatternEditor:
                 type=original_note.type,
             )
             new_note.selected = True
-            self.project.beatmap._notes.append(new_note)
+            notes.append(new_note)
 
-        self.project.beatmap._notes.sort(key=lambda n: n.time)
+        notes.sort(key=lambda n: n.time)
 
     def _close(self):
         """Close the modal dialog."""
@@ -518,9 +633,14 @@ class PatternEditor:
                 pass
 
         # Reset state
+        self._dirty = False
         self.pattern_slots = []
         self.selected_notes = []
         self._original_notes = []
+        self._original_notes_by_time = {}
         self._modal_tag = None
         self._pattern_group_tag = None
         self._pattern_text_tag = None
+        self._last_pattern_str = ""
+        self._slot_btn_tags = []
+        self._rendered_markers = []
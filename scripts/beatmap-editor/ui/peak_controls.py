@@ -3,6 +3,8 @@ Peak highlight controls UI.
 Allows users to configure peak detection thresholds per track and add markers from peaks.
 """
 
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import dearpygui.dearpygui as dpg
 from typing import TYPE_CHECKING, Optional, Callable
 
@@ -17,8 +19,10 @@ from core.constants import (
     DEFAULT_THRESHOLD_PERCENT,
     DEFAULT_REARM_RATIO,
     MIN_PEAK_GAP_SECONDS,
+    PEAK_SLIDER_DEBOUNCE_SECONDS,
+    PEAK_CACHE_SIZE,
 )
-from utils.peaks import PeakState, PeakSettings, detect_peaks
+from utils.peaks import PeakState, PeakSettings, detect_peaks, rms_envelope
 from utils.input import is_shift_down
 
 
@@ -46,6 +50,10 @@ class PeakControls:
         # Callbacks - on_add_markers now takes (waveform_key, peaks, after_playhead_only)
         self.on_peaks_changed: Optional[Callable[[], None]] = None
         self.on_add_markers: Optional[Callable[[str, list[float], bool], None]] = None
+        # Add All: ([(waveform_key, peaks), ...], after_playhead_only), one call
+        self.on_add_markers_batch: Optional[
+            Callable[[list[tuple[str, list[float]]], bool], None]
+        ] = None
 
         # DearPyGui tags for sliders (to update peak detection on change)
         self._slider_tags: dict[str, int] = {}
@@ -53,11 +61,31 @@ class PeakControls:
         self._checkbox_tags: dict[str, int] = {}
         self._link_checkbox_tags: dict[str, int] = {}
         self._add_button_tags: dict[str, int] = {}
+        self._add_all_button_tag: Optional[int] = None
 
-        # Cache tracking to avoid unnecessary peak recalculations
-        self._last_settings_hash: dict[str, int] = {}
+        # Tracks whose settings changed since peaks were last computed
+        # (all tracks start dirty so the first update computes enabled ones)
+        self._dirty: set[str] = {waveform_key for _, waveform_key in TRACKS}
+        # Shift state shown on the add buttons (updated by key handlers)
         self._last_shift_state: bool = False
 
+        # Slider-driven recalculations waiting for the drag to settle:
+        # {waveform_key: monotonic deadline}
+        self._pending_updates: dict[str, float] = {}
+
+        # Recent detect_peaks() results, least recently used first. Keyed by
+        # (waveform_key, id(waveform_data), duration, threshold, rearm); each
+        # entry keeps its waveform_data alive so the id() can't be reused.
+        self._peak_cache: dict[tuple, tuple[dict, list[float]]] = {}
+
+        # Peak detection runs on a worker thread so long waveforms don't stall
+        # the UI; results are installed by update_pending() on the UI thread.
+        # {waveform_key: (cache_key, waveform_data, future)}, latest job only
+        self._peak_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="peak-detect"
+        )
+        self._peak_jobs: dict[str, tuple[tuple, dict, Future]] = {}
+
     def create(self, parent: int):
         """Create the peak controls panel."""
         with dpg.child_window(
@@ -127,6 +155,12 @@ class PeakControls:
             tag="peak_add_all_button",
         )
 
+        # Swap add button labels on Shift press/release instead of polling
+        with dpg.handler_registry():
+            for key in (dpg.mvKey_LShift, dpg.mvKey_RShift):
+                dpg.add_key_press_handler(key, callback=self._on_shift_changed)
+                dpg.add_key_release_handler(key, callback=self._on_shift_changed)
+
     def _create_track_controls(self, display_name: str, waveform_key: str):
         """Create controls for a single track (compact layout)."""
         with dpg.group():
@@ -199,6 +233,7 @@ class PeakControls:
     def _on_checkbox_changed(self, waveform_key: str, value: bool):
         """Handle checkbox state change."""
         self.peak_state.settings[waveform_key].enabled = value
+        self._dirty.discard(waveform_key)
         self._update_peaks(waveform_key)
 
         if self.on_peaks_changed:
@@ -221,29 +256,76 @@ class PeakControls:
             if dpg.does_item_exist(rearm_slider_tag):
                 dpg.set_value(rearm_slider_tag, rearm_value)
 
-        # Only update if enabled
+        # Only update if enabled (deferred until the slider stops moving)
         if settings.enabled:
-            self._update_peaks(waveform_key)
-
-            if self.on_peaks_changed:
-                self.on_peaks_changed()
+            self._schedule_update(waveform_key)
 
     def _on_rearm_slider_changed(self, waveform_key: str, value: int):
         """Handle re-arm threshold slider value change."""
         settings = self.peak_state.settings[waveform_key]
         settings.rearm_threshold_percent = float(value)
 
-        # Only update if enabled
+        # Only update if enabled (deferred until the slider stops moving)
         if settings.enabled:
-            self._update_peaks(waveform_key)
+            self._schedule_update(waveform_key)
+
+    def _schedule_update(self, waveform_key: str):
+        """Defer peak detection for a track until its slider has been idle."""
+        self._pending_updates[waveform_key] = (
+            time.monotonic() + PEAK_SLIDER_DEBOUNCE_SECONDS
+        )
 
-            if self.on_peaks_changed:
+    def update_pending(self, force: bool = False):
+        """
+        Start deferred peak detection whose debounce has elapsed and install
+        finished background results (call every frame).
+
+        Args:
+            force: Run all pending updates now, regardless of their deadline,
+                and wait for their results
+        """
+        if self._pending_updates:
+            now = time.monotonic()
+            due = [
+                key
+                for key, deadline in self._pending_updates.items()
+                if force or deadline <= now
+            ]
+            for waveform_key in due:
+                del self._pending_updates[waveform_key]
+                self._dirty.discard(waveform_key)
+                self._update_peaks(waveform_key)
+
+            if due and self.on_peaks_changed:
                 self.on_peaks_changed()
 
+        if self._peak_jobs:
+            self._collect_peak_jobs(wait=force)
+
+    def _collect_peak_jobs(self, wait: bool = False):
+        """Install results of finished background peak detection jobs."""
+        finished = [
+            waveform_key
+            for waveform_key, (_, _, future) in self._peak_jobs.items()
+            if wait or future.done()
+        ]
+        if not finished:
+            return
+
+        for waveform_key in finished:
+            cache_key, waveform_data, future = self._peak_jobs.pop(waveform_key)
+            peaks = future.result()
+            self._cache_peaks(cache_key, waveform_data, peaks)
+            self._set_peaks(waveform_key, peaks)
+
+        if self.on_peaks_changed:
+            self.on_peaks_changed()
+
     def _on_link_changed(self, waveform_key: str, value: bool):
         """Handle link checkbox change."""
         settings = self.peak_state.settings[waveform_key]
         settings.linked = value
+        self._dirty.add(waveform_key)
 
         # Enable/disable re-arm slider based on link state
         rearm_slider_tag = f"peak_rearm_slider_{waveform_key}"
@@ -255,6 +337,7 @@ class PeakControls:
 
     def _on_add_markers(self, waveform_key: str):
         """Handle add markers button click."""
+        self.update_pending(force=True)
         peaks = self.peak_state.peaks.get(waveform_key, [])
         after_playhead_only = is_shift_down()
 
@@ -263,45 +346,99 @@ class PeakControls:
 
     def _on_add_all_markers(self):
         """Handle add all markers button click - adds peaks from all enabled tracks."""
-        if not self.on_add_markers:
+        if not self.on_add_markers_batch and not self.on_add_markers:
             return
 
+        self.update_pending(force=True)
         after_playhead_only = is_shift_down()
 
-        for waveform_key, settings in self.peak_state.settings.items():
-            if settings.enabled:
-                peaks = self.peak_state.peaks.get(waveform_key, [])
-                if peaks:
-                    self.on_add_markers(waveform_key, peaks, after_playhead_only)
+        track_peaks = [
+            (waveform_key, self.peak_state.peaks.get(waveform_key, []))
+            for waveform_key, settings in self.peak_state.settings.items()
+            if settings.enabled
+        ]
+        track_peaks = [(key, peaks) for key, peaks in track_peaks if peaks]
+
+        # Prefer a single batched call so the receiver refreshes once
+        if self.on_add_markers_batch:
+            if track_peaks:
+                self.on_add_markers_batch(track_peaks, after_playhead_only)
+            return
+
+        for waveform_key, peaks in track_peaks:
+            self.on_add_markers(waveform_key, peaks, after_playhead_only)
 
     def _update_peaks(self, waveform_key: str):
-        """Recalculate peaks for a track."""
+        """
+        Recalculate peaks for a track. Cached results and cleared tracks are
+        applied immediately; otherwise detection is queued on the worker thread
+        and installed later by update_pending().
+        """
         settings = self.peak_state.settings[waveform_key]
 
+        # Any queued or running job for this track is now stale
+        job = self._peak_jobs.pop(waveform_key, None)
+        if job is not None:
+            job[2].cancel()
+
         if not settings.enabled:
-            self.peak_state.peaks[waveform_key] = []
-            self._update_peak_count(waveform_key, 0)
+            self._set_peaks(waveform_key, [])
             return
 
         # Get waveform data
         waveform_data = self.project.waveform_data.get(waveform_key)
 
         if not waveform_data or self.project.duration <= 0:
-            self.peak_state.peaks[waveform_key] = []
-            self._update_peak_count(waveform_key, 0)
+            self._set_peaks(waveform_key, [])
             return
 
         # Detect peaks with custom re-arm threshold if not linked
         rearm_threshold = None if settings.linked else settings.rearm_threshold_percent
 
-        peaks = detect_peaks(
+        cache_key = (
+            waveform_key,
+            id(waveform_data),
+            self.project.duration,
+            settings.threshold_percent,
+            rearm_threshold,
+        )
+        cached = self._peak_cache.get(cache_key)
+        if cached is not None:
+            peaks = cached[1]
+            self._cache_peaks(cache_key, waveform_data, peaks)
+            self._set_peaks(waveform_key, peaks)
+            return
+
+        # RMS array and range are built once per waveform, not per detection
+        envelope = self.peak_state.envelopes.get(waveform_key)
+        if envelope is None or envelope.source is not waveform_data:
+            envelope = rms_envelope(waveform_data)
+            if envelope is None:
+                self._set_peaks(waveform_key, [])
+                return
+            self.peak_state.envelopes[waveform_key] = envelope
+
+        future = self._peak_executor.submit(
+            detect_peaks,
             waveform_data=waveform_data,
             duration=self.project.duration,
             threshold_percent=settings.threshold_percent,
             min_gap_seconds=MIN_PEAK_GAP_SECONDS,
             rearm_threshold_percent=rearm_threshold,
+            envelope=envelope,
         )
-
+        self._peak_jobs[waveform_key] = (cache_key, waveform_data, future)
+
+    def _cache_peaks(self, cache_key: tuple, waveform_data: dict, peaks: list[float]):
+        """Store a detection result as the most recently used cache entry."""
+        self._peak_cache.pop(cache_key, None)
+        if len(self._peak_cache) >= PEAK_CACHE_SIZE:
+            # Evict the least recently used entry
+            del self._peak_cache[next(iter(self._peak_cache))]
+        self._peak_cache[cache_key] = (waveform_data, peaks)
+
+    def _set_peaks(self, waveform_key: str, peaks: list[float]):
+        """Install detected peaks for a track and update its count display."""
         self.peak_state.peaks[waveform_key] = peaks
         self._update_peak_count(waveform_key, len(peaks))
 
@@ -311,39 +448,51 @@ class PeakControls:
         if dpg.does_item_exist(tag):
             dpg.set_value(tag, f"({count})")
 
+    def invalidate(self):
+        """Drop cached peaks and recompute all tracks (e.g. after loading audio)."""
+        for _, _, future in self._peak_jobs.values():
+            future.cancel()
+        self._peak_jobs.clear()
+        self._peak_cache.clear()
+        self.peak_state.envelopes.clear()
+        self._dirty.update(waveform_key for _, waveform_key in TRACKS)
+
+    def shutdown(self):
+        """Stop the detection worker without waiting for a running job."""
+        self._peak_jobs.clear()
+        self._peak_executor.shutdown(wait=False, cancel_futures=True)
+
     def update(self):
-        """Update peak detection for all enabled tracks and UI state."""
-        # Only recalculate peaks if settings changed (not every frame)
-        for _, waveform_key in TRACKS:
-            settings = self.peak_state.settings[waveform_key]
-            if settings.enabled:
-                # Check if settings changed since last update
-                settings_hash = hash(
-                    (
-                        settings.enabled,
-                        settings.threshold_percent,
-                        settings.rearm_threshold_percent,
-                        settings.linked,
-                    )
-                )
-                if self._last_settings_hash.get(waveform_key) != settings_hash:
-                    self._update_peaks(waveform_key)
-                    self._last_settings_hash[waveform_key] = settings_hash
+        """Update peak detection for tracks whose settings changed."""
+        # Only recalculate peaks for tracks whose settings changed
+        if not self._dirty:
+            return
+
+        for waveform_key in list(self._dirty):
+            if waveform_key in self._pending_updates:
+                continue  # Still debouncing; update_pending() will handle it
+            self._dirty.discard(waveform_key)
+            if self.peak_state.settings[waveform_key].enabled:
+                self._update_peaks(waveform_key)
 
-        # Update button labels based on shift key state (only if changed)
+    def _on_shift_changed(self, sender=None, app_data=None):
+        """Update add button labels when Shift is pressed or released."""
         shift_down = is_shift_down()
-        if shift_down != self._last_shift_state:
-            self._last_shift_state = shift_down
-            for waveform_key, btn_tag in self._add_button_tags.items():
-                if dpg.does_item_exist(btn_tag):
-                    dpg.configure_item(btn_tag, label="▶" if shift_down else "+")
-
-            # Update "Add All" button label
-            if dpg.does_item_exist("peak_add_all_button"):
-                dpg.configure_item(
-                    "peak_add_all_button",
-                    label="▶ Add After Playhead" if shift_down else "+ Add All Peaks",
-                )
+        if shift_down == self._last_shift_state:
+            return
+        self._last_shift_state = shift_down
+
+        # The buttons are created together with this handler and owned by us,
+        # so their tags are configured directly without existence checks
+        label = "▶" if shift_down else "+"
+        for btn_tag in self._add_button_tags.values():
+            dpg.configure_item(btn_tag, label=label)
+
+        # Update "Add All" button label
+        dpg.configure_item(
+            self._add_all_button_tag,
+            label="▶ Add After Playhead" if shift_down else "+ Add All Peaks",
+        )
 
     def get_peaks_for_lane(self, lane_name: str) -> list[float]:
         """Get detected peaks for a lane (mapped from waveform key)."""
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
 
 from core.constants import LANES, MARKER_COLORS
+from utils.grid import beat_duration
 
 if TYPE_CHECKING:
     from core.project import Project
@@ -31,6 +32,28 @@ TARGET_Y_RATIO = 0.85  # Target line Y position (from top)
 # Preview uses MARKER_COLORS from constants for level colors
 LEVEL_COLORS = MARKER_COLORS  # Alias for backward compatibility
 
+# Level RGB by level index (notes are validated to levels 1-3; index 0 unused)
+_LEVEL_RGB = tuple(LEVEL_COLORS[level][:3] for level in (1, 1, 2, 3))
+
+# Stroke X position per note type (spread across width, 0.5 = center)
+STROKE_X_RATIOS = {
+    "base": 0.5,
+    "drum": 0.3,
+    "bass": 0.7,
+    "vocal": 0.2,
+    "lead": 0.8,
+}
+# Unscaled X offset from center per note type (scaled by perspective per frame)
+_STROKE_X_OFFSETS = {
+    note_type: (ratio - 0.5) * (PREVIEW_WIDTH - 40)
+    for note_type, ratio in STROKE_X_RATIOS.items()
+}
+
+
+def perspective_scale(depth: float) -> float:
+    """Perspective scale at a depth (1.0 at the target, shrinking with distance)."""
+    return 1.0 / (1.0 + depth * PERSPECTIVE_FACTOR)
+
 
 @dataclass
 class ConveyorLine:
@@ -54,6 +77,8 @@ class Preview:
         # Filter state
         self._preview_level: int = 3  # Show notes up to this level (1, 2, or 3)
         self._visible_lanes: dict[str, bool] = {lane: True for lane in LANES}
+        # Lanes currently shown, kept in sync by _on_lane_toggle for fast lookups
+        self._shown_lanes: frozenset[str] = frozenset(LANES)
 
         # UI tags for filter controls
         self._level_radio_tag: Optional[int] = None
@@ -64,15 +89,23 @@ class Preview:
         self._next_conveyor_spawn_time: float = 0.0
         self._last_playhead: float = 0.0
 
+        # Inputs of the last drawn frame; redraw is skipped while unchanged
+        self._last_frame_key: Optional[tuple] = None
+
+        # Persistent draw items, reconfigured each frame instead of being
+        # deleted and recreated. Built lazily for the current drawlist.
+        self._pool_drawlist_tag: Optional[int] = None
+        self._conveyor_layer_tag: Optional[int] = None
+        self._stroke_layer_tag: Optional[int] = None
+        self._conveyor_line_tags: list[int] = []
+        self._stroke_tags: list[tuple[int, int]] = []  # (marker, glow) per slot
+        self._shown_conveyor_lines: int = 0
+        self._shown_strokes: int = 0
+
     def _should_show_note(self, note) -> bool:
         """Check if a note should be shown based on current filter settings."""
-        # Check level filter (show notes with level <= preview_level)
-        if note.level > self._preview_level:
-            return False
-        # Check lane filter
-        if not self._visible_lanes.get(note.type, True):
-            return False
-        return True
+        # Level filter (show notes with level <= preview_level) and lane filter
+        return note.level <= self._preview_level and note.type in self._shown_lanes
 
     def _on_level_change(self, sender, app_data):
         """Handle level radio button change."""
@@ -84,6 +117,9 @@ class Preview:
         """Handle lane checkbox toggle."""
         lane = user_data
         self._visible_lanes[lane] = app_data
+        self._shown_lanes = frozenset(
+            lane for lane, visible in self._visible_lanes.items() if visible
+        )
 
     def create(self, parent: int):
         """Create the preview widget."""
@@ -107,12 +143,10 @@ class Preview:
         bpm = self.project.bpm
         if bpm <= 0:
             return 0.5
-        return 60.0 / bpm
+        return beat_duration(bpm)
 
-    def _update_conveyor_lines(self, current_time: float):
+    def _update_conveyor_lines(self, current_time: float, spawn_interval: float):
         """Update conveyor belt lines, spawning new ones and removing old ones."""
-        spawn_interval = self._get_conveyor_spawn_interval()
-
         # Detect if playhead jumped (seek or loop)
         if abs(current_time - self._last_playhead) > 0.5:
             # Reset conveyor lines on seek
@@ -155,11 +189,29 @@ class Preview:
         ]
 
     def _draw_conveyor_lines(
-        self, current_time: float, horizon_y: float, target_y: float
+        self,
+        current_time: float,
+        horizon_y: float,
+        target_y: float,
+        spawn_interval: float,
     ):
         """Draw the BPM-synced conveyor belt lines with perspective."""
+        # Loop invariants, computed once per frame
         center_x = PREVIEW_WIDTH / 2
-        bottom_width = PREVIEW_WIDTH * 0.9  # Width at target line
+        half_bottom_width = PREVIEW_WIDTH * 0.9 / 2  # Half width at target line
+        y_span = target_y - horizon_y
+        line_tags = self._conveyor_line_tags
+        count = 0
+
+        # Beat pulse effect: lines are spawned one spawn_interval apart, so
+        # they all share the same phase within the beat; compute it once from
+        # the newest line instead of a modulo per line
+        if spawn_interval > 0 and self._conveyor_lines:
+            newest_elapsed = current_time - self._conveyor_lines[-1].spawn_time
+            beat_phase = (newest_elapsed % spawn_interval) / spawn_interval
+            beat_pulse = max(0, 1.0 - beat_phase * 4.0) * 0.3
+        else:
+            beat_pulse = 0
 
         for line in self._conveyor_lines:
             elapsed = current_time - line.spawn_time
@@ -168,46 +220,46 @@ class Preview:
             if progress < 0 or progress >= 1.0:
                 continue
 
-            # Calculate depth (decreases as line moves toward camera)
-            current_depth = SPAWN_DEPTH * (1.0 - progress)
-
-            # Perspective scale (increases as line gets closer)
-            scale = 1.0 / (1.0 + current_depth * PERSPECTIVE_FACTOR)
+            # Perspective scale at the current depth (depth decreases as the
+            # line moves toward camera, so scale increases as it gets closer)
+            scale = perspective_scale(SPAWN_DEPTH * (1.0 - progress))
 
             # Calculate Y position using perspective
             # Line moves from horizon_y to target_y
-            y = horizon_y + (target_y - horizon_y) * scale
+            y = horizon_y + y_span * scale
 
-            # Calculate width at this depth
-            current_width = bottom_width * scale
+            # Calculate half width at this depth
+            half_width = half_bottom_width * scale
 
             # Alpha based on scale (fades in as it gets closer)
             # Plus a pulse effect near beat times
             base_alpha = 0.1 + 0.4 * scale
 
-            # Beat pulse effect
-            spawn_interval = self._get_conveyor_spawn_interval()
-            if spawn_interval > 0:
-                time_in_beat = elapsed % spawn_interval
-                normalized_beat_time = time_in_beat / spawn_interval
-                beat_pulse = max(0, 1.0 - normalized_beat_time * 4.0) * 0.3
-            else:
-                beat_pulse = 0
-
             alpha = min(1.0, base_alpha + beat_pulse)
             color_value = int(255 * alpha)
 
-            # Draw the line
-            x1 = center_x - current_width / 2
-            x2 = center_x + current_width / 2
-
-            dpg.draw_line(
-                p1=(x1, y),
-                p2=(x2, y),
+            # Draw the line, growing the pool if this frame needs more slots
+            if count == len(line_tags):
+                line_tags.append(
+                    dpg.draw_line(
+                        p1=(0, 0),
+                        p2=(0, 0),
+                        thickness=2,
+                        show=False,
+                        parent=self._conveyor_layer_tag,
+                    )
+                )
+            dpg.configure_item(
+                line_tags[count],
+                p1=(center_x - half_width, y),
+                p2=(center_x + half_width, y),
                 color=(color_value, color_value, color_value, int(alpha * 200)),
-                thickness=2,
-                parent=self._drawlist_tag,
+                show=True,
             )
+            count += 1
+
+        self._hide_unused(line_tags, count, self._shown_conveyor_lines)
+        self._shown_conveyor_lines = count
 
     def update(self):
         """Update the preview display."""
@@ -218,13 +270,80 @@ class Preview:
         if not dpg.does_item_exist(self._drawlist_tag):
             return
 
-        # Clear previous drawings
-        try:
-            dpg.delete_item(self._drawlist_tag, children_only=True)
-        except SystemError:
-            # Drawlist may have been deleted, skip this update
+        current_time = self.project.playhead
+        has_audio = self.project.has_audio
+        spawn_interval = self._get_conveyor_spawn_interval()
+
+        # Notes are kept sorted by time, so the visible window (within flight
+        # duration) is found by binary search instead of scanning every note,
+        # then narrowed by the level and lane filters (inlined _should_show_note)
+        max_level = self._preview_level
+        shown_lanes = self._shown_lanes
+        shown_notes = [
+            note
+            for note in self.project.beatmap.get_notes_in_range(
+                current_time, current_time + FLIGHT_DURATION
+            )
+            if note.level <= max_level and note.type in shown_lanes
+        ]
+
+        # Skip the redraw when nothing that affects the picture changed
+        # (e.g. paused with no edits); filter changes show up in shown_notes
+        frame_key = (
+            self._drawlist_tag,
+            current_time,
+            has_audio,
+            spawn_interval,
+            tuple((note.time, note.level, note.type) for note in shown_notes),
+        )
+        if frame_key == self._last_frame_key:
             return
 
+        if self._pool_drawlist_tag != self._drawlist_tag:
+            try:
+                self._create_draw_items()
+            except SystemError:
+                # Drawlist may have been deleted, skip this update
+                return
+        self._last_frame_key = frame_key
+
+        # Calculate positions
+        horizon_y = PREVIEW_HEIGHT * HORIZON_Y_RATIO  # Vanishing point near top
+        target_y = PREVIEW_HEIGHT * TARGET_Y_RATIO  # Target line near bottom
+
+        # Update and draw conveyor belt lines (only when playing or audio loaded)
+        if has_audio:
+            self._update_conveyor_lines(current_time, spawn_interval)
+            self._draw_conveyor_lines(current_time, horizon_y, target_y, spawn_interval)
+        else:
+            self._hide_unused(self._conveyor_line_tags, 0, self._shown_conveyor_lines)
+            self._shown_conveyor_lines = 0
+
+        # Draw flying strokes, growing the pool if this frame needs more slots
+        stroke_tags = self._stroke_tags
+        for i, note in enumerate(shown_notes):
+            if i == len(stroke_tags):
+                stroke_tags.append(self._add_stroke_slot())
+            self._draw_flying_stroke(
+                stroke_tags[i], note, current_time, horizon_y, target_y
+            )
+
+        count = len(shown_notes)
+        for i in range(count, self._shown_strokes):
+            marker_tag, glow_tag = stroke_tags[i]
+            dpg.configure_item(marker_tag, show=False)
+            dpg.configure_item(glow_tag, show=False)
+        self._shown_strokes = count
+
+    def _create_draw_items(self):
+        """Create the static shapes and empty item pools in the drawlist."""
+        dpg.delete_item(self._drawlist_tag, children_only=True)
+        self._pool_drawlist_tag = self._drawlist_tag
+        self._conveyor_line_tags = []
+        self._stroke_tags = []
+        self._shown_conveyor_lines = 0
+        self._shown_strokes = 0
+
         # Draw background
         dpg.draw_rectangle(
             pmin=(0, 0),
@@ -234,18 +353,11 @@ class Preview:
             parent=self._drawlist_tag,
         )
 
-        # Calculate positions
-        horizon_y = PREVIEW_HEIGHT * HORIZON_Y_RATIO  # Vanishing point near top
-        target_y = PREVIEW_HEIGHT * TARGET_Y_RATIO  # Target line near bottom
-
-        current_time = self.project.playhead
-
-        # Update and draw conveyor belt lines (only when playing or audio loaded)
-        if self.project.has_audio:
-            self._update_conveyor_lines(current_time)
-            self._draw_conveyor_lines(current_time, horizon_y, target_y)
+        # Layers keep draw order (conveyor, target line, strokes) as pools grow
+        self._conveyor_layer_tag = dpg.add_draw_layer(parent=self._drawlist_tag)
 
         # Draw target line
+        target_y = PREVIEW_HEIGHT * TARGET_Y_RATIO
         dpg.draw_line(
             p1=(20, target_y),
             p2=(PREVIEW_WIDTH - 20, target_y),
@@ -254,19 +366,39 @@ class Preview:
             parent=self._drawlist_tag,
         )
 
-        # Draw flying strokes
-        # Get notes that should be visible (within flight duration window)
-        visible_start = current_time
-        visible_end = current_time + FLIGHT_DURATION
+        self._stroke_layer_tag = dpg.add_draw_layer(parent=self._drawlist_tag)
 
-        for note in self.project.beatmap.notes:
-            if visible_start <= note.time <= visible_end:
-                # Apply level and lane filters
-                if self._should_show_note(note):
-                    self._draw_flying_stroke(note, current_time, horizon_y, target_y)
+    def _add_stroke_slot(self) -> tuple[int, int]:
+        """Add a hidden (marker, glow) circle pair to the stroke pool."""
+        marker_tag = dpg.draw_circle(
+            center=(0, 0),
+            radius=1,
+            thickness=2,
+            show=False,
+            parent=self._stroke_layer_tag,
+        )
+        glow_tag = dpg.draw_circle(
+            center=(0, 0),
+            radius=1,
+            thickness=3,
+            show=False,
+            parent=self._stroke_layer_tag,
+        )
+        return marker_tag, glow_tag
+
+    @staticmethod
+    def _hide_unused(tags: list[int], used: int, previously_shown: int):
+        """Hide pooled items that were shown last frame but not this one."""
+        for tag in tags[used:previously_shown]:
+            dpg.configure_item(tag, show=False)
 
     def _draw_flying_stroke(
-        self, note, current_time: float, horizon_y: float, target_y: float
+        self,
+        slot: tuple[int, int],
+        note,
+        current_time: float,
+        horizon_y: float,
+        target_y: float,
     ):
         """Draw a single flying stroke with perspective matching the conveyor belt."""
         time_until_arrival = note.time - current_time
@@ -275,58 +407,48 @@ class Preview:
         progress = time_until_arrival / FLIGHT_DURATION
         progress = max(0.0, min(1.0, progress))
 
-        # Calculate depth (same as conveyor lines)
-        current_depth = SPAWN_DEPTH * progress
-
-        # Perspective scale (same as conveyor lines)
-        scale = 1.0 / (1.0 + current_depth * PERSPECTIVE_FACTOR)
+        # Perspective scale at the current depth (same as conveyor lines)
+        scale = perspective_scale(SPAWN_DEPTH * progress)
 
         # Calculate Y position using perspective (same as conveyor lines)
         y = horizon_y + (target_y - horizon_y) * scale
 
-        # X position based on note type (spread across width, also scaled)
-        type_positions = {
-            "base": 0.5,
-            "drum": 0.3,
-            "bass": 0.7,
-            "vocal": 0.2,
-            "lead": 0.8,
-        }
-        x_ratio = type_positions.get(note.type, 0.5)
-        center_x = PREVIEW_WIDTH / 2
-        # X offset from center, scaled by perspective
-        x_offset = (x_ratio - 0.5) * (PREVIEW_WIDTH - 40)
-        x = center_x + x_offset * scale
+        # X position based on note type, offset from center scaled by perspective
+        x = PREVIEW_WIDTH / 2 + _STROKE_X_OFFSETS.get(note.type, 0.0) * scale
 
         # Size based on perspective scale
         base_size = 15
         size = base_size * scale
 
-        # Alpha based on depth (fades in as it gets closer)
-        alpha = int(max(0.0, min(1.0, 1.0 - (current_depth / SPAWN_DEPTH) * 0.7)) * 255)
+        # Alpha based on depth (fades in as it gets closer); progress is
+        # already clamped to [0, 1], so this stays within [0.3, 1.0]
+        alpha = int((1.0 - progress * 0.7) * 255)
 
         # Get color
-        base_color = LEVEL_COLORS.get(note.level, LEVEL_COLORS[1])
-        color = (base_color[0], base_color[1], base_color[2], alpha)
-        fill_color = (base_color[0], base_color[1], base_color[2], alpha // 2)
+        r, g, b = _LEVEL_RGB[note.level]
+        color = (r, g, b, alpha)
+        fill_color = (r, g, b, alpha // 2)
 
         # Draw the stroke marker
-        dpg.draw_circle(
+        marker_tag, glow_tag = slot
+        dpg.configure_item(
+            marker_tag,
             center=(x, y),
             radius=size,
             color=color,
             fill=fill_color,
-            thickness=2,
-            parent=self._drawlist_tag,
+            show=True,
         )
 
         # Draw glow effect for close strokes
         if progress < 0.3:
             glow_alpha = int((0.3 - progress) / 0.3 * 0.3 * 255)
-            dpg.draw_circle(
+            dpg.configure_item(
+                glow_tag,
                 center=(x, y),
                 radius=size * 1.5,
-                color=(base_color[0], base_color[1], base_color[2], glow_alpha),
-                thickness=3,
-                parent=self._drawlist_tag,
+                color=(r, g, b, glow_alpha),
+                show=True,
             )
+        else:
+            dpg.configure_item(glow_tag, show=False)
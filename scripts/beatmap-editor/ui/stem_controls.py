@@ -6,7 +6,7 @@ import dearpygui.dearpygui as dpg
 from typing import TYPE_CHECKING, Optional, Callable
 
 if TYPE_CHECKING:
-    from core.project import Project
+    from core.project import Project, StemState
     from audio.player import AudioPlayer
 
 
@@ -20,6 +20,14 @@ COLORS = {
     "mute_off": (100, 100, 100, 255),
 }
 
+# Button themes: (attribute, COLORS key, hovered color, active color)
+BUTTON_THEMES = [
+    ("_solo_on_theme", "solo_on", (255, 200, 70, 255), (200, 150, 40, 255)),
+    ("_solo_off_theme", "solo_off", (120, 120, 120, 255), (80, 80, 80, 255)),
+    ("_mute_on_theme", "mute_on", (255, 100, 100, 255), (200, 50, 50, 255)),
+    ("_mute_off_theme", "mute_off", (120, 120, 120, 255), (80, 80, 80, 255)),
+]
+
 
 class StemControls:
     """
@@ -40,98 +48,105 @@ class StemControls:
         self._mute_on_theme: Optional[int] = None
         self._mute_off_theme: Optional[int] = None
 
+        # (stem, state, solo button, mute button) per stem in STEMS order,
+        # built in create(); button callbacks index it by stem position
+        self._stem_records: tuple[tuple[str, "StemState", int, int], ...] = ()
+
+        # Theme currently bound to each button tag (skips redundant rebinds)
+        self._bound_themes: dict[int, int] = {}
+
         self._create_themes()
 
     def _create_themes(self):
-        """Create button themes for different states."""
-        with dpg.theme() as self._solo_on_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, COLORS["solo_on"])
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, (255, 200, 70, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, (200, 150, 40, 255))
-
-        with dpg.theme() as self._solo_off_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, COLORS["solo_off"])
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, (120, 120, 120, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, (80, 80, 80, 255))
-
-        with dpg.theme() as self._mute_on_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, COLORS["mute_on"])
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, (255, 100, 100, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, (200, 50, 50, 255))
-
-        with dpg.theme() as self._mute_off_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, COLORS["mute_off"])
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, (120, 120, 120, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, (80, 80, 80, 255))
+        """Create button themes for different states (identical ones are shared)."""
+        themes: dict[tuple, int] = {}
+        for attr, color_key, hovered, active in BUTTON_THEMES:
+            colors = (COLORS[color_key], hovered, active)
+            if colors not in themes:
+                with dpg.theme() as theme:
+                    with dpg.theme_component(dpg.mvButton):
+                        for target, color in zip(
+                            (
+                                dpg.mvThemeCol_Button,
+                                dpg.mvThemeCol_ButtonHovered,
+                                dpg.mvThemeCol_ButtonActive,
+                            ),
+                            colors,
+                        ):
+                            dpg.add_theme_color(target, color)
+                themes[colors] = theme
+            setattr(self, attr, themes[colors])
 
     def create(self, parent: int):
         """Create the stem controls panel."""
         with dpg.group(horizontal=True, parent=parent):
             dpg.add_text("Stems:")
 
-            for stem in STEMS:
+            for index, stem in enumerate(STEMS):
                 with dpg.group(horizontal=True):
                     dpg.add_text(f"  {stem.capitalize()}:")
 
-                    # Solo button - use user_data to pass stem name
+                    # Solo button - use user_data to pass stem index and kind
                     self._solo_buttons[stem] = dpg.add_button(
                         label="S",
                         width=25,
-                        callback=self._on_solo_callback,
-                        user_data=stem,
+                        callback=self._on_toggle,
+                        user_data=(index, "solo"),
                     )
 
-                    # Mute button - use user_data to pass stem name
+                    # Mute button - use user_data to pass stem index and kind
                     self._mute_buttons[stem] = dpg.add_button(
                         label="M",
                         width=25,
-                        callback=self._on_mute_callback,
-                        user_data=stem,
+                        callback=self._on_toggle,
+                        user_data=(index, "mute"),
                     )
 
-        self.update()
-
-    def _on_solo_callback(self, sender, app_data, user_data):
-        """DearPyGui callback wrapper for solo button."""
-        self._on_solo(user_data)
+        self._stem_records = tuple(
+            (
+                stem,
+                self.project.stem_states[stem],
+                self._solo_buttons[stem],
+                self._mute_buttons[stem],
+            )
+            for stem in STEMS
+        )
 
-    def _on_mute_callback(self, sender, app_data, user_data):
-        """DearPyGui callback wrapper for mute button."""
-        self._on_mute(user_data)
+        self.update()
 
     def update(self):
         """Update button colors based on state."""
-        for stem in STEMS:
-            stem_state = self.project.stem_states.get(stem)
-            if not stem_state:
-                continue
-
-            # Update solo button theme
-            if stem in self._solo_buttons:
-                theme = self._solo_on_theme if stem_state.solo else self._solo_off_theme
-                dpg.bind_item_theme(self._solo_buttons[stem], theme)
-
-            # Update mute button theme
-            if stem in self._mute_buttons:
-                theme = self._mute_on_theme if stem_state.mute else self._mute_off_theme
-                dpg.bind_item_theme(self._mute_buttons[stem], theme)
-
-    def _on_solo(self, stem: str):
-        """Handle solo button click."""
-        stem_state = self.project.stem_states.get(stem)
-        if stem_state:
+        for _, stem_state, solo_button, mute_button in self._stem_records:
+            self._apply_solo_theme(solo_button, stem_state.solo)
+            self._apply_mute_theme(mute_button, stem_state.mute)
+
+    def _apply_solo_theme(self, solo_button: int, solo: bool):
+        """Update one solo button's theme."""
+        self._bind_theme(
+            solo_button, self._solo_on_theme if solo else self._solo_off_theme
+        )
+
+    def _apply_mute_theme(self, mute_button: int, mute: bool):
+        """Update one mute button's theme."""
+        self._bind_theme(
+            mute_button, self._mute_on_theme if mute else self._mute_off_theme
+        )
+
+    def _bind_theme(self, button: int, theme: int):
+        """Bind a theme to a button unless it is already bound."""
+        if self._bound_themes.get(button) != theme:
+            dpg.bind_item_theme(button, theme)
+            self._bound_themes[button] = theme
+
+    def _on_toggle(self, sender, app_data, user_data):
+        """Handle solo/mute button click (user_data is (index, "solo" | "mute"))."""
+        index, kind = user_data
+        stem, stem_state, solo_button, mute_button = self._stem_records[index]
+        if kind == "solo":
             stem_state.solo = not stem_state.solo
             self.audio_player.set_solo(stem, stem_state.solo)
-        self.update()
-
-    def _on_mute(self, stem: str):
-        """Handle mute button click."""
-        stem_state = self.project.stem_states.get(stem)
-        if stem_state:
+            self._apply_solo_theme(solo_button, stem_state.solo)
+        else:
             stem_state.mute = not stem_state.mute
             self.audio_player.set_mute(stem, stem_state.mute)
-        self.update()
+            self._apply_mute_theme(mute_button, stem_state.mute)
@@ -5,10 +5,12 @@ Displays waveforms, grid lines, and markers for each lane.
 
 import dearpygui.dearpygui as dpg
 import numpy as np
+from bisect import bisect_left, bisect_right
 from typing import Optional, Callable, TYPE_CHECKING
 
 from core.constants import (
     LANES,
+    LANE_INDEX,
     LANE_TO_WAVEFORM,
     LANE_HEIGHT,
     LANE_SPACING,
@@ -22,9 +24,13 @@ from core.constants import (
     DEFAULT_ZOOM,
     MIN_ZOOM,
     MAX_ZOOM,
+    WAVEFORM_TILE_WIDTH,
+    WAVEFORM_CACHE_TILES,
 )
 from utils.input import is_ctrl_down, is_shift_down, is_alt_down, is_modifier_down
 from core.history import MoveNotesCommand
+from core.beatmap import bisect_notes_left, bisect_notes_right
+from utils.grid import beat_duration
 
 if TYPE_CHECKING:
     from core.project import Project
@@ -32,6 +38,47 @@ if TYPE_CHECKING:
     from ui.peak_controls import PeakControls
 
 
+def _note_times(notes: list["Note"]) -> np.ndarray:
+    """Times of the given notes as an array."""
+    return np.fromiter(
+        (note.time for note in notes), dtype=np.float64, count=len(notes)
+    )
+
+
+def _note_lanes(notes: list["Note"]) -> np.ndarray:
+    """Lane indices of the given notes as an array."""
+    return np.fromiter(
+        (LANE_INDEX.get(note.type, 0) for note in notes),
+        dtype=np.intp,
+        count=len(notes),
+    )
+
+
+# Top and center y of each lane, by lane index
+LANE_Y_STARTS = tuple(
+    HEADER_HEIGHT + i * (LANE_HEIGHT + LANE_SPACING) for i in range(len(LANES))
+)
+LANE_Y_CENTERS = tuple(y + LANE_HEIGHT / 2 for y in LANE_Y_STARTS)
+
+# Lane index for each whole-pixel y, None above the lanes; a lane's row
+# includes the spacing below it. Lane boundaries fall on whole pixels, so
+# int(y) selects the same lane as dividing the float y.
+_LANE_AT_Y = tuple(
+    None if y < HEADER_HEIGHT else (y - HEADER_HEIGHT) // (LANE_HEIGHT + LANE_SPACING)
+    for y in range(HEADER_HEIGHT + len(LANES) * (LANE_HEIGHT + LANE_SPACING))
+)
+
+# Derived colors, built once
+_GRID_FINE_COLOR = (*COLORS["grid_sub"][:3], 51)  # Low alpha (51/255 ~ 0.2)
+_WAVEFORM_PLACEHOLDER_COLOR = (*COLORS["waveform"][:3], 50)
+_WAVEFORM_RGB = tuple(c / 255 for c in COLORS["waveform"][:3])  # Texture floats
+_WAVEFORM_LINE_ALPHA = COLORS["waveform"][3] / 255
+_WAVEFORM_FILL_ALPHA = 60 / 255  # Semi-transparent fill
+
+# Marker color by note level (levels are validated to 1-3 by Note)
+_MARKER_COLOR_BY_LEVEL = (COLORS["marker_1"], *(MARKER_COLORS[i] for i in (1, 2, 3)))
+
+
 class Timeline:
     """
     Timeline widget showing lanes with waveforms and markers.
@@ -60,6 +107,13 @@ class Timeline:
         self._drawlist_tag: Optional[int] = None
         self._labels_drawlist_tag: Optional[int] = None  # Sticky labels column
 
+        # Drawlist layers: static content is rebuilt on redraw, while the
+        # playhead and selection box are retained items that are only moved
+        self._static_layer_tag: Optional[int] = None
+        self._playhead_line_tag: Optional[int] = None
+        self._playhead_head_tag: Optional[int] = None
+        self._selection_box_tag: Optional[int] = None
+
         # Callbacks
         self.on_marker_click: Optional[Callable[["Note"], None]] = None
         self.on_marker_double_click: Optional[Callable[["Note"], None]] = None
@@ -69,13 +123,26 @@ class Timeline:
         # Dirty tracking for performance
         self._needs_full_redraw: bool = True
         self._last_playhead: float = 0.0
-        self._last_zoom: float = DEFAULT_ZOOM
-        self._last_duration: float = 0.0
-        self._last_note_count: int = 0
-        self._last_bpm: float = 0.0
+        self._last_state: tuple = ()  # See _static_state
+
+        # (1/16 beat, 1/4 beat) step durations, cached for _grid_bpm
+        self._grid_bpm: float = 0.0
+        self._grid_steps: tuple[float, float] = (0.0, 0.0)
+
+        # Timeline window (pos, x scroll, width), read once per frame
+        self._geometry: tuple = ()
+        self._geometry_frame: int = -1
 
-        # Waveform cache: {waveform_key: {zoom_level: (points_upper, points_lower)}}
-        self._waveform_cache: dict[str, dict[int, tuple[list, list]]] = {}
+        # Drawlist x range drawn by the last redraw (viewport culling)
+        self._draw_x0: float = 0.0
+        self._draw_x1: float = 0.0
+
+        # Waveform tile textures, least recently used first:
+        # {(waveform_key, total_width, lane_height, tile_index): texture}
+        self._waveform_cache: dict[tuple, int] = {}
+        self._waveform_tiles_drawn: int = 0  # Tiles drawn by the current redraw
+        self._texture_registry_tag: Optional[int] = None
+        self._stale_textures: list[int] = []  # Invalidated, deleted on redraw
 
     def create(self, parent: int):
         """Create the timeline widget."""
@@ -97,6 +164,8 @@ class Timeline:
                     height=self.height + 1,
                     tag="timeline_labels_drawlist",
                 )
+                # Labels only depend on the lane layout, so draw them once
+                self._draw_sticky_labels()
 
             # Scrollable timeline content
             with dpg.child_window(
@@ -115,6 +184,7 @@ class Timeline:
                     height=self.height + 1,  # +1 forces scroll to work properly
                     tag="timeline_drawlist",
                 )
+                self._create_layers()
 
             # Register mouse handlers
             with dpg.handler_registry():
@@ -128,6 +198,42 @@ class Timeline:
                 dpg.add_key_press_handler(dpg.mvKey_Up, callback=self._on_key_up)
                 dpg.add_key_press_handler(dpg.mvKey_Down, callback=self._on_key_down)
 
+    def _create_layers(self):
+        """
+        Create the static layer, the retained playhead/selection items and
+        the registry for waveform tile textures.
+        """
+        self._texture_registry_tag = dpg.add_texture_registry()
+        self._static_layer_tag = dpg.add_draw_layer(parent=self._drawlist_tag)
+        dynamic_layer = dpg.add_draw_layer(parent=self._drawlist_tag)
+
+        # Playhead: vertical line and triangle at top
+        self._playhead_line_tag = dpg.draw_line(
+            p1=(0, 0),
+            p2=(0, self.height),
+            color=COLORS["playhead"],
+            thickness=2,
+            parent=dynamic_layer,
+        )
+        self._playhead_head_tag = dpg.draw_triangle(
+            p1=(0, 0),
+            p2=(-8, 15),
+            p3=(8, 15),
+            color=COLORS["playhead"],
+            fill=COLORS["playhead"],
+            parent=dynamic_layer,
+        )
+
+        self._selection_box_tag = dpg.draw_rectangle(
+            pmin=(0, 0),
+            pmax=(0, 0),
+            color=COLORS["selection_box"],
+            fill=COLORS["selection_fill"],
+            thickness=1,
+            show=False,
+            parent=dynamic_layer,
+        )
+
     def update(self):
         """Redraw the timeline (only if needed)."""
         if not self._drawlist_tag:
@@ -140,83 +246,88 @@ class Timeline:
         # Check if full redraw is needed
         needs_redraw = self._check_dirty_state()
 
+        # The playhead only needs moving, not a redraw of everything else
+        if needs_redraw or self._last_playhead != self.project.playhead:
+            self._draw_playhead()
+
         if not needs_redraw:
             return
 
         # Clear previous drawings
         try:
-            dpg.delete_item(self._drawlist_tag, children_only=True)
+            dpg.delete_item(self._static_layer_tag, children_only=True)
         except SystemError:
             return
+        for texture in self._stale_textures:
+            dpg.delete_item(texture)
+        self._stale_textures.clear()
 
         # Calculate total width
         total_width = max(800, int(self.project.duration * self.zoom))
         dpg.configure_item(self._drawlist_tag, width=total_width)
 
+        # Only draw the visible area plus one view width on each side, so
+        # small scrolls don't need a redraw (see _check_dirty_state)
+        x0, x1 = self._visible_range_px()
+        margin = x1 - x0
+        self._draw_x0 = max(0.0, x0 - margin)
+        self._draw_x1 = x1 + margin
+
         # Draw components
         self._draw_background(total_width)
         self._draw_grid(total_width)
         self._draw_lanes(total_width)
         self._draw_peak_highlights()
         self._draw_markers()
-        self._draw_playhead()
         self._draw_selection_box()
 
-        # Draw sticky labels column
-        self._draw_sticky_labels()
-
         # Reset dirty flag
         self._needs_full_redraw = False
 
+    def _static_state(self) -> tuple:
+        """
+        Values the static layer depends on, compared as a single tuple:
+        zoom, duration, note count (simplified dirty check) and BPM (grid).
+        """
+        return (
+            self.zoom,
+            self.project.duration,
+            len(self.project.beatmap.notes),
+            self.project.bpm,
+        )
+
     def _check_dirty_state(self) -> bool:
         """
         Check if redraw is needed based on state changes.
         Returns True if redraw is required.
         """
-        # Always redraw if explicitly marked dirty
-        if self._needs_full_redraw:
-            self._update_cached_state()
+        # Redraw if explicitly marked dirty or any tracked value changed
+        state = self._static_state()
+        if self._needs_full_redraw or state != self._last_state:
+            self._last_state = state
             return True
 
-        # Check if playhead moved
-        if self._last_playhead != self.project.playhead:
-            self._update_cached_state()
-            return True
-
-        # Check if zoom changed
-        if self._last_zoom != self.zoom:
-            self._update_cached_state()
-            return True
-
-        # Check if duration changed
-        if self._last_duration != self.project.duration:
-            self._update_cached_state()
-            return True
-
-        # Check if note count changed (simplified dirty check)
-        current_note_count = len(self.project.beatmap.notes)
-        if self._last_note_count != current_note_count:
-            self._update_cached_state()
-            return True
-
-        # Check if BPM changed (affects grid lines)
-        if self._last_bpm != self.project.bpm:
-            self._update_cached_state()
-            return True
-
-        # Check if selecting (need to update selection box)
-        if self.selecting:
-            return True
-
-        return False
-
-    def _update_cached_state(self):
-        """Update cached state values."""
-        self._last_playhead = self.project.playhead
-        self._last_zoom = self.zoom
-        self._last_duration = self.project.duration
-        self._last_note_count = len(self.project.beatmap.notes)
-        self._last_bpm = self.project.bpm
+        # Check if the view scrolled outside the drawn area
+        x0, x1 = self._visible_range_px()
+        return x0 < self._draw_x0 or x1 > self._draw_x1
+
+    def _visible_range_px(self) -> tuple[float, float]:
+        """Get the drawlist x range visible in the scroll window."""
+        scroll_x = dpg.get_x_scroll(self._window_tag)
+        width = dpg.get_item_rect_size(self._window_tag)[0]
+        if width <= 0:
+            # Not laid out yet, assume the widest possible view
+            width = dpg.get_viewport_client_width()
+        return scroll_x, scroll_x + width
+
+    def _get_grid_steps(self) -> tuple[float, float]:
+        """Return the (1/16 beat, 1/4 beat) durations for the current BPM."""
+        bpm = self.project.bpm
+        if bpm != self._grid_bpm:
+            beat = beat_duration(bpm)
+            self._grid_steps = (beat / 16, beat / 4)
+            self._grid_bpm = bpm
+        return self._grid_steps
 
     def mark_dirty(self):
         """Mark the timeline as needing a full redraw."""
@@ -224,10 +335,11 @@ class Timeline:
 
     def invalidate_waveform_cache(self, waveform_key: Optional[str] = None):
         """Invalidate waveform cache (call when audio/stems change)."""
-        if waveform_key:
-            self._waveform_cache.pop(waveform_key, None)
-        else:
-            self._waveform_cache.clear()
+        # Textures may still be drawn until the next redraw clears the
+        # static layer, so they are only deleted then
+        for key in list(self._waveform_cache):
+            if not waveform_key or key[0] == waveform_key:
+                self._stale_textures.append(self._waveform_cache.pop(key))
         self._needs_full_redraw = True
 
     def _draw_background(self, total_width: int):
@@ -237,7 +349,7 @@ class Timeline:
             pmax=(total_width, self.height),
             color=COLORS["background"],
             fill=COLORS["background"],
-            parent=self._drawlist_tag,
+            parent=self._static_layer_tag,
         )
 
     def _draw_grid(self, total_width: int):
@@ -245,61 +357,70 @@ class Timeline:
         if self.project.bpm <= 0:
             return
 
-        beat_duration = 60.0 / self.project.bpm
         subdivision = 16  # 1/16 note grid
 
-        sub_duration = beat_duration / subdivision
+        sub_duration = beat_duration(self.project.bpm) / subdivision
         sub_width = sub_duration * self.zoom
 
-        x = 0.0
-        beat_index = 0
-
-        while x < total_width:
-            # Determine line style based on beat position
-            if beat_index % subdivision == 0:
-                # Full beat
-                color = COLORS["grid_beat"]
-                thickness = 1.5
-            elif beat_index % 4 == 0:
-                # Quarter subdivision
-                color = COLORS["grid_sub"]
-                thickness = 1.0
-            else:
-                # Fine subdivision (only draw if zoomed in enough)
-                if self.zoom > 50:
-                    color = (*COLORS["grid_sub"][:3], 51)  # Low alpha (51/255 ~ 0.2)
-                    thickness = 0.5
-                else:
-                    beat_index += 1
-                    x += sub_width
-                    continue
-
-            dpg.draw_line(
-                p1=(x, HEADER_HEIGHT),
-                p2=(x, self.height),
-                color=color,
-                thickness=thickness,
-                parent=self._drawlist_tag,
+        # Line positions per style, computed as index * width so positions
+        # don't drift the way a running x += sub_width sum does
+        first = int(self._draw_x0 / sub_width)
+        indices = np.arange(first, int(self._draw_x1 / sub_width) + 1)
+        xs = indices * sub_width
+        in_view = (xs >= self._draw_x0) & (xs < min(total_width, self._draw_x1))
+        indices = indices[in_view]
+        xs = xs[in_view]
+
+        beat_mask = indices % subdivision == 0  # Full beats
+        sub_mask = (indices % 4 == 0) & ~beat_mask  # Quarter subdivisions
+
+        # Draw beat number on major beats
+        for beat_index, x in zip(indices[beat_mask].tolist(), xs[beat_mask].tolist()):
+            beat_num = beat_index // subdivision + 1
+            dpg.draw_text(
+                pos=(x + 2, 5),
+                text=str(beat_num),
+                color=COLORS["text"],
+                size=12,
+                parent=self._static_layer_tag,
             )
 
-            # Draw beat number on major beats
-            if beat_index % subdivision == 0:
-                beat_num = beat_index // subdivision + 1
-                dpg.draw_text(
-                    pos=(x + 2, 5),
-                    text=str(beat_num),
-                    color=COLORS["text"],
-                    size=12,
-                    parent=self._drawlist_tag,
-                )
+        self._draw_grid_lines(xs[beat_mask], COLORS["grid_beat"], 1.5)
+        self._draw_grid_lines(xs[sub_mask], COLORS["grid_sub"], 1.0)
+        # Fine subdivision (only draw if zoomed in enough)
+        if self.zoom > 50:
+            fine_mask = ~(beat_mask | sub_mask)
+            self._draw_grid_lines(xs[fine_mask], _GRID_FINE_COLOR, 0.5)
+
+    def _draw_grid_lines(self, xs: np.ndarray, color: tuple, thickness: float):
+        """
+        Draw vertical grid lines at xs as a single polyline.
+        Consecutive lines alternate direction and are joined inside the first
+        lane (hidden by its opaque background, drawn afterwards) and just
+        below the drawlist's bottom edge, so only the lines themselves show.
+        """
+        if len(xs) == 0:
+            return
+
+        top = HEADER_HEIGHT + LANE_HEIGHT / 2
+        bottom = self.height + 4
+        ys = np.empty((len(xs), 2))
+        ys[0::2] = (top, bottom)
+        ys[1::2] = (bottom, top)
+        points = np.column_stack((np.repeat(xs, 2), ys.ravel())).tolist()
 
-            beat_index += 1
-            x += sub_width
+        dpg.draw_polyline(
+            points=points,
+            color=color,
+            thickness=thickness,
+            parent=self._static_layer_tag,
+        )
 
     def _draw_lanes(self, total_width: int):
         """Draw lane backgrounds (labels are in sticky column)."""
+        self._waveform_tiles_drawn = 0
         for i, lane_name in enumerate(LANES):
-            y_start = HEADER_HEIGHT + i * (LANE_HEIGHT + LANE_SPACING)
+            y_start = LANE_Y_STARTS[i]
             y_end = y_start + LANE_HEIGHT
 
             # Lane background
@@ -309,11 +430,12 @@ class Timeline:
                 color=COLORS["lane_border"],
                 fill=COLORS["lane_bg"],
                 thickness=1,
-                parent=self._drawlist_tag,
+                parent=self._static_layer_tag,
             )
 
             # Draw waveform for this lane (if stems available)
             self._draw_lane_waveform(lane_name, y_start, y_end, total_width)
+        self._trim_waveform_cache()
 
     def _draw_sticky_labels(self):
         """Draw sticky lane labels in the fixed left column."""
@@ -334,7 +456,7 @@ class Timeline:
 
         # Draw each lane label
         for i, lane_name in enumerate(LANES):
-            y_start = HEADER_HEIGHT + i * (LANE_HEIGHT + LANE_SPACING)
+            y_start = LANE_Y_STARTS[i]
             y_end = y_start + LANE_HEIGHT
 
             # Lane label background (matching lane style)
@@ -360,193 +482,208 @@ class Timeline:
     def _draw_lane_waveform(
         self, lane_name: str, y_start: float, y_end: float, total_width: int
     ):
-        """Draw waveform for a specific lane as a connected line graph."""
+        """Draw waveform for a specific lane as cached image tiles."""
         waveform_key = LANE_TO_WAVEFORM.get(lane_name)
         waveform_data = (
             self.project.waveform_data.get(waveform_key) if waveform_key else None
         )
 
         center_y = (y_start + y_end) / 2
-        lane_height = y_end - y_start
-        half_height = (lane_height * 0.85) / 2  # Use 85% of lane height
-
-        # Check if waveform_data is the new dict format or old list format
-        if waveform_data:
-            if isinstance(waveform_data, dict):
-                waveform_min = waveform_data.get("min", [])
-                waveform_max = waveform_data.get("max", [])
-                num_samples = len(waveform_min)
-            else:
-                # Legacy list format - treat as symmetric
-                waveform_min = [-v for v in waveform_data]
-                waveform_max = waveform_data
-                num_samples = len(waveform_data)
-        else:
-            num_samples = 0
+        lane_height = int(y_end - y_start)
+
+        # Waveform data holds float32 'min'/'max' arrays (see Project)
+        num_samples = len(waveform_data["min"]) if waveform_data else 0
 
         if num_samples > 0:
             duration = self.project.duration
 
             if duration > 0:
-                # Check cache for precomputed polylines
-                zoom_key = int(self.zoom)
-                cache_key = f"{waveform_key}_{zoom_key}_{total_width}"
-
-                # Try to get from cache
-                cached = self._get_cached_waveform(waveform_key, zoom_key, total_width)
-
-                if cached:
-                    points_upper, points_lower = cached
-                else:
-                    # Calculate and cache polylines
-                    points_upper, points_lower = self._compute_waveform_polylines(
-                        waveform_min,
-                        waveform_max,
-                        num_samples,
-                        total_width,
-                        center_y,
-                        half_height,
-                    )
-                    self._cache_waveform(
-                        waveform_key, zoom_key, total_width, points_upper, points_lower
-                    )
-
-                # Offset points to correct y position
-                offset_upper = [
-                    (x, center_y - (center_y - y) + (y_start + y_end) / 2 - center_y)
-                    for x, y in points_upper
-                ]
-                offset_lower = [
-                    (x, center_y - (center_y - y) + (y_start + y_end) / 2 - center_y)
-                    for x, y in points_lower
-                ]
-
-                # Actually, let's just recompute with correct y values for simplicity
-                # The caching benefit comes from not recomputing sample indices
-                envelope_color = COLORS["waveform"]
-                line_thickness = 1.0
-
-                # Draw upper envelope (positive peaks)
-                if len(points_upper) > 1:
-                    dpg.draw_polyline(
-                        points=points_upper,
-                        color=envelope_color,
-                        thickness=line_thickness,
-                        parent=self._drawlist_tag,
-                    )
-
-                # Draw lower envelope (negative peaks)
-                if len(points_lower) > 1:
-                    dpg.draw_polyline(
-                        points=points_lower,
-                        color=envelope_color,
-                        thickness=line_thickness,
-                        parent=self._drawlist_tag,
-                    )
-
-                # Fill between envelopes for better visibility
-                if len(points_upper) > 1 and len(points_lower) > 1:
-                    fill_color = (*COLORS["waveform"][:3], 60)  # Semi-transparent fill
-                    fill_points = points_upper + list(reversed(points_lower))
-                    dpg.draw_polygon(
-                        points=fill_points,
-                        color=(0, 0, 0, 0),  # No outline
-                        fill=fill_color,
-                        parent=self._drawlist_tag,
+                # Draw the drawn area as fixed-width textures, so scrolling
+                # only rasterizes tiles that haven't been seen yet
+                first_tile = int(self._draw_x0 // WAVEFORM_TILE_WIDTH)
+                last_tile = int(
+                    (min(self._draw_x1, total_width) - 1) // WAVEFORM_TILE_WIDTH
+                )
+                for tile_index in range(first_tile, last_tile + 1):
+                    px_start = tile_index * WAVEFORM_TILE_WIDTH
+                    px_end = min(px_start + WAVEFORM_TILE_WIDTH, total_width)
+
+                    cache_key = (waveform_key, total_width, lane_height, tile_index)
+                    texture = self._get_cached_waveform(cache_key)
+                    if texture is None:
+                        image = self._rasterize_waveform_tile(
+                            waveform_data["min"],
+                            waveform_data["max"],
+                            num_samples,
+                            total_width,
+                            px_start,
+                            px_end,
+                            lane_height,
+                        )
+                        texture = dpg.add_static_texture(
+                            width=px_end - px_start,
+                            height=lane_height,
+                            default_value=image.ravel(),
+                            parent=self._texture_registry_tag,
+                        )
+                        self._cache_waveform(cache_key, texture)
+
+                    dpg.draw_image(
+                        texture,
+                        pmin=(px_start, y_start),
+                        pmax=(px_end, y_start + lane_height),
+                        parent=self._static_layer_tag,
                     )
+                    self._waveform_tiles_drawn += 1
         else:
             # Draw placeholder center line if no waveform data
             dpg.draw_line(
                 p1=(0, center_y),
                 p2=(total_width, center_y),
-                color=(*COLORS["waveform"][:3], 50),
+                color=_WAVEFORM_PLACEHOLDER_COLOR,
                 thickness=1,
-                parent=self._drawlist_tag,
+                parent=self._static_layer_tag,
             )
 
-    def _compute_waveform_polylines(
+    def _compute_waveform_columns(
         self,
-        waveform_min: list,
-        waveform_max: list,
+        waveform_min: np.ndarray,
+        waveform_max: np.ndarray,
         num_samples: int,
         total_width: int,
-        center_y: float,
-        half_height: float,
-    ) -> tuple[list, list]:
-        """Compute polyline points for waveform visualization."""
-        # Calculate samples per pixel - higher detail rendering
-        samples_per_pixel = num_samples / total_width
-
-        # Determine step size based on zoom level for performance
-        if self.zoom > 200:
-            step = 1  # Maximum detail at high zoom
-        elif self.zoom > 100:
-            step = max(1, int(total_width / 3000))
-        elif self.zoom > 50:
-            step = max(1, int(total_width / 2000))
-        else:
-            step = max(1, int(total_width / 1500))
-
-        # Build points for upper and lower envelope lines
-        points_upper = []  # max values (upper envelope)
-        points_lower = []  # min values (lower envelope)
-
-        for px in range(0, int(total_width), step):
-            # Get sample range for this pixel
-            sample_start = int(px * samples_per_pixel)
-            sample_end = int((px + step) * samples_per_pixel)
-            sample_start = min(sample_start, num_samples - 1)
-            sample_end = min(sample_end, num_samples)
-
-            if sample_start >= sample_end:
-                continue
-
-            # Get min/max over the sample range for this pixel
-            chunk_min = min(waveform_min[sample_start:sample_end])
-            chunk_max = max(waveform_max[sample_start:sample_end])
-
-            # Convert to y coordinates
-            y_upper = center_y - chunk_max * half_height  # max goes up
-            y_lower = center_y - chunk_min * half_height  # min goes down
-
-            points_upper.append((px, y_upper))
-            points_lower.append((px, y_lower))
-
-        return points_upper, points_lower
+        px_start: int,
+        px_end: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Min/max of the waveform under each pixel column in [px_start, px_end).
+        Columns without samples of their own are left out.
 
-    def _get_cached_waveform(
-        self, waveform_key: str, zoom_key: int, total_width: int
-    ) -> Optional[tuple[list, list]]:
-        """Get cached waveform polylines if available."""
-        cache_dict = self._waveform_cache.get(waveform_key)
-        if cache_dict:
-            return cache_dict.get((zoom_key, total_width))
-        return None
+        Returns:
+            Tuple of (pixels, chunk_min, chunk_max) arrays
+        """
+        samples_per_pixel = num_samples / total_width
+        pixels = np.arange(px_start, px_end)
 
-    def _cache_waveform(
+        # Sample range [start, end) for each pixel column, as in a per-pixel
+        # scan: start/end truncate px * samples_per_pixel toward zero
+        sample_starts = np.minimum(
+            (pixels * samples_per_pixel).astype(np.int64), num_samples - 1
+        )
+        sample_ends = np.minimum(
+            ((pixels + 1) * samples_per_pixel).astype(np.int64), num_samples
+        )
+        valid = sample_starts < sample_ends
+        pixels = pixels[valid]
+        if len(pixels) == 0:
+            return pixels, np.empty(0), np.empty(0)
+
+        # Zoomed in to at most one sample per column: each remaining column
+        # covers exactly one sample, so gather instead of reducing
+        if samples_per_pixel <= 1:
+            sample_indices = sample_starts[valid]
+            chunk_min = waveform_min[sample_indices]
+            chunk_max = waveform_max[sample_indices]
+            return pixels, chunk_min.astype(np.float64), chunk_max.astype(np.float64)
+
+        # Min/max over each range in one reduceat pass: interleave the bounds
+        # as [s0, e0, s1, e1, ...] and keep every other result. A final end of
+        # num_samples is dropped, since reduceat runs the last range to the end.
+        bounds = np.column_stack((sample_starts[valid], sample_ends[valid])).ravel()
+        if bounds[-1] == num_samples:
+            bounds = bounds[:-1]
+        chunk_min = np.minimum.reduceat(waveform_min[:num_samples], bounds)[::2]
+        chunk_max = np.maximum.reduceat(waveform_max[:num_samples], bounds)[::2]
+
+        return pixels, chunk_min.astype(np.float64), chunk_max.astype(np.float64)
+
+    def _rasterize_waveform_tile(
         self,
-        waveform_key: str,
-        zoom_key: int,
+        waveform_min: np.ndarray,
+        waveform_max: np.ndarray,
+        num_samples: int,
         total_width: int,
-        points_upper: list,
-        points_lower: list,
-    ):
-        """Cache waveform polylines."""
-        if waveform_key not in self._waveform_cache:
-            self._waveform_cache[waveform_key] = {}
-        # Limit cache size per waveform (keep last 3 zoom levels)
-        if len(self._waveform_cache[waveform_key]) > 3:
-            # Remove oldest entry
-            oldest_key = next(iter(self._waveform_cache[waveform_key]))
-            del self._waveform_cache[waveform_key][oldest_key]
-        self._waveform_cache[waveform_key][(zoom_key, total_width)] = (
-            points_upper,
-            points_lower,
+        px_start: int,
+        px_end: int,
+        height: int,
+    ) -> np.ndarray:
+        """
+        Rasterize pixel columns [px_start, px_end) of a waveform into an RGBA
+        float32 image of shape (height, px_end - px_start, 4): envelope lines
+        over a semi-transparent fill between them.
+        """
+        width = px_end - px_start
+        image = np.zeros((height, width, 4), dtype=np.float32)
+
+        # When zoomed in past the data resolution, some columns have no
+        # samples; they are interpolated from their neighbours like a
+        # polyline through the sampled columns. Look a little beyond the
+        # tile so its edges join up with the adjacent tiles.
+        pad = int(total_width / num_samples) + 2
+        pixels, chunk_min, chunk_max = self._compute_waveform_columns(
+            waveform_min,
+            waveform_max,
+            num_samples,
+            total_width,
+            max(0, px_start - pad),
+            min(total_width, px_end + pad),
         )
+        if len(pixels) == 0:
+            return image
+
+        # Envelope y per column, plus the column before the tile so line
+        # segments can be joined across the tile edge
+        center = height / 2
+        half_height = (height * 0.85) / 2  # Use 85% of lane height
+        columns = np.arange(px_start - 1, px_end)
+        y_upper = np.interp(columns, pixels, center - chunk_max * half_height)
+        y_lower = np.interp(columns, pixels, center - chunk_min * half_height)
+        top = np.clip(np.floor(y_upper), 0, height - 1)
+        bottom = np.clip(np.floor(y_lower), 0, height - 1)
+
+        # Fill between the envelopes; each envelope line covers the rows
+        # from its previous column's y to its own, so steep slopes stay joined
+        rows = np.arange(height)[:, None]
+        fill = (rows >= top[1:]) & (rows <= bottom[1:])
+        line = np.zeros((height, width), dtype=bool)
+        for edge in (top, bottom):
+            line_lo = np.minimum(edge[1:], edge[:-1])
+            line_hi = np.maximum(edge[1:], edge[:-1])
+            line |= (rows >= line_lo) & (rows <= line_hi)
+
+        image[fill | line, :3] = _WAVEFORM_RGB
+        image[fill, 3] = _WAVEFORM_FILL_ALPHA
+        image[line, 3] = _WAVEFORM_LINE_ALPHA
+        return image
+
+    def _get_cached_waveform(self, cache_key: tuple) -> Optional[int]:
+        """Get a cached waveform tile texture if available."""
+        texture = self._waveform_cache.pop(cache_key, None)
+        if texture is not None:
+            # Reinsert to mark as most recently used
+            self._waveform_cache[cache_key] = texture
+        return texture
+
+    def _cache_waveform(self, cache_key: tuple, texture: int):
+        """Cache a waveform tile texture."""
+        self._waveform_cache[cache_key] = texture
+
+    def _trim_waveform_cache(self):
+        """Delete least recently used tile textures beyond the cache size."""
+        # Tiles drawn by this redraw are the most recently used; keep them
+        # even if they alone exceed the cache size
+        keep = max(WAVEFORM_CACHE_TILES, self._waveform_tiles_drawn)
+        while len(self._waveform_cache) > keep:
+            oldest_key = next(iter(self._waveform_cache))
+            dpg.delete_item(self._waveform_cache.pop(oldest_key))
 
     def _draw_markers(self):
-        """Draw all markers/notes."""
-        for note in self.project.beatmap.notes:
+        """Draw markers/notes inside the drawn area."""
+        notes = self.project.beatmap.notes
+        # Include markers whose circle (with selection outline) reaches in
+        reach = (MARKER_RADIUS + 4) / self.zoom
+        lo = bisect_notes_left(notes, self._draw_x0 / self.zoom - reach)
+        hi = bisect_notes_right(notes, self._draw_x1 / self.zoom + reach)
+        for note in notes[lo:hi]:
             self._draw_marker(note)
 
     def _draw_peak_highlights(self):
@@ -554,6 +691,7 @@ class Timeline:
         if not self.peak_controls:
             return
 
+        color = COLORS["peak_highlight"]
         for i, lane_name in enumerate(LANES):
             if not self.peak_controls.is_enabled_for_lane(lane_name):
                 continue
@@ -562,43 +700,49 @@ class Timeline:
             if not peaks:
                 continue
 
-            y_start = HEADER_HEIGHT + i * (LANE_HEIGHT + LANE_SPACING)
+            y_start = LANE_Y_STARTS[i]
             y_end = y_start + LANE_HEIGHT
+            line_top = y_start + 5
+            line_bottom = y_end - 5
+            triangle_base = y_start + 12
 
-            for peak_time in peaks:
-                x = peak_time * self.zoom
+            # Peaks are time-sorted; skip those outside the drawn area
+            reach = 4 / self.zoom  # Triangle half-width
+            lo = bisect_left(peaks, self._draw_x0 / self.zoom - reach)
+            hi = bisect_right(peaks, self._draw_x1 / self.zoom + reach)
+            xs = (np.asarray(peaks[lo:hi]) * self.zoom).tolist()
 
+            for x in xs:
                 # Draw vertical line for peak
                 dpg.draw_line(
-                    p1=(x, y_start + 5),
-                    p2=(x, y_end - 5),
-                    color=COLORS["peak_highlight"],
+                    p1=(x, line_top),
+                    p2=(x, line_bottom),
+                    color=color,
                     thickness=2,
-                    parent=self._drawlist_tag,
+                    parent=self._static_layer_tag,
                 )
 
                 # Draw small triangle at top
                 dpg.draw_triangle(
-                    p1=(x, y_start + 5),
-                    p2=(x - 4, y_start + 12),
-                    p3=(x + 4, y_start + 12),
-                    color=COLORS["peak_highlight"],
-                    fill=COLORS["peak_highlight"],
-                    parent=self._drawlist_tag,
+                    p1=(x, line_top),
+                    p2=(x - 4, triangle_base),
+                    p3=(x + 4, triangle_base),
+                    color=color,
+                    fill=color,
+                    parent=self._static_layer_tag,
                 )
 
     def _draw_marker(self, note: "Note"):
         """Draw a single marker."""
         # Get lane index
-        lane_index = LANES.index(note.type) if note.type in LANES else 0
+        lane_index = LANE_INDEX.get(note.type, 0)
 
         # Calculate position
         x = note.time * self.zoom
-        y_start = HEADER_HEIGHT + lane_index * (LANE_HEIGHT + LANE_SPACING)
-        y_center = y_start + LANE_HEIGHT / 2
+        y_center = LANE_Y_CENTERS[lane_index]
 
         # Get color based on level
-        color = MARKER_COLORS.get(note.level, COLORS["marker_1"])
+        color = _MARKER_COLOR_BY_LEVEL[note.level]
 
         # Draw marker
         dpg.draw_circle(
@@ -606,7 +750,7 @@ class Timeline:
             radius=MARKER_RADIUS,
             color=color,
             fill=color,
-            parent=self._drawlist_tag,
+            parent=self._static_layer_tag,
         )
 
         # Draw selection outline
@@ -616,48 +760,33 @@ class Timeline:
                 radius=MARKER_RADIUS + 3,
                 color=COLORS["marker_selected"],
                 thickness=2,
-                parent=self._drawlist_tag,
+                parent=self._static_layer_tag,
             )
 
     def _draw_playhead(self):
-        """Draw the playhead indicator."""
+        """Move the playhead indicator to the current playhead time."""
+        self._last_playhead = self.project.playhead
         x = self.project.playhead * self.zoom
 
-        # Vertical line
-        dpg.draw_line(
-            p1=(x, 0),
-            p2=(x, self.height),
-            color=COLORS["playhead"],
-            thickness=2,
-            parent=self._drawlist_tag,
-        )
-
-        # Triangle at top
-        dpg.draw_triangle(
-            p1=(x, 0),
-            p2=(x - 8, 15),
-            p3=(x + 8, 15),
-            color=COLORS["playhead"],
-            fill=COLORS["playhead"],
-            parent=self._drawlist_tag,
+        dpg.configure_item(self._playhead_line_tag, p1=(x, 0), p2=(x, self.height))
+        dpg.configure_item(
+            self._playhead_head_tag, p1=(x, 0), p2=(x - 8, 15), p3=(x + 8, 15)
         )
 
     def _draw_selection_box(self):
-        """Draw selection box if selecting."""
+        """Show the selection box while selecting, hide it otherwise."""
         if not self.selecting or not self.selection_start or not self._selection_end:
+            dpg.configure_item(self._selection_box_tag, show=False)
             return
 
         x1, y1 = self.selection_start
         x2, y2 = self._selection_end
 
-        # Draw selection rectangle
-        dpg.draw_rectangle(
+        dpg.configure_item(
+            self._selection_box_tag,
             pmin=(min(x1, x2), min(y1, y2)),
             pmax=(max(x1, x2), max(y1, y2)),
-            color=(100, 150, 255, 200),
-            fill=(100, 150, 255, 50),
-            thickness=1,
-            parent=self._drawlist_tag,
+            show=True,
         )
 
     def _get_time_at_x(self, x: float) -> float:
@@ -666,14 +795,9 @@ class Timeline:
 
     def _get_lane_at_y(self, y: float) -> Optional[int]:
         """Get lane index at y coordinate."""
-        if y < HEADER_HEIGHT:
-            return None
-
-        adjusted_y = y - HEADER_HEIGHT
-        lane_index = int(adjusted_y / (LANE_HEIGHT + LANE_SPACING))
-
-        if 0 <= lane_index < len(LANES):
-            return lane_index
+        iy = int(y)
+        if 0 <= iy < len(_LANE_AT_Y):
+            return _LANE_AT_Y[iy]
         return None
 
     def _get_marker_at(self, x: float, y: float) -> Optional["Note"]:
@@ -686,9 +810,8 @@ class Timeline:
 
         lane_name = LANES[lane_index]
 
-        # Calculate marker center y position for this lane
-        lane_y_start = HEADER_HEIGHT + lane_index * (LANE_HEIGHT + LANE_SPACING)
-        marker_center_y = lane_y_start + LANE_HEIGHT / 2
+        # Marker center y position for this lane
+        marker_center_y = LANE_Y_CENTERS[lane_index]
 
         # Check vertical distance from marker center
         vertical_tolerance = MARKER_RADIUS + 5  # Marker radius + small padding
@@ -698,8 +821,12 @@ class Timeline:
         # Search for marker near this position (horizontal tolerance)
         tolerance = MARKER_CLICK_TOLERANCE / self.zoom
 
-        for note in self.project.beatmap.notes:
-            if note.type == lane_name and abs(note.time - time) <= tolerance:
+        # Notes are time-sorted, so only look at those within tolerance
+        candidates = self.project.beatmap.get_notes_in_range(
+            time - tolerance, time + tolerance
+        )
+        for note in candidates:
+            if note.type == lane_name:
                 return note
 
         return None
@@ -748,6 +875,8 @@ class Timeline:
                 self.dragging_playhead = True
                 if self.on_playhead_click:
                     self.on_playhead_click(time)
+                # Only the retained playhead moves, update() handles that
+                return
             else:
                 # Clicking on empty lane space - start box selection
                 if not modifier_down:
@@ -811,20 +940,22 @@ class Timeline:
             time = max(0, min(time, self.project.duration))
             if self.on_playhead_click:
                 self.on_playhead_click(time)
-            self.mark_dirty()
             return
 
         # Box selection mode
         if self.selecting and self.selection_start:
             self._selection_end = (x, y)
-            self._update_box_selection()
-            self.mark_dirty()
+            # The box itself is retained; markers only need a redraw when
+            # the selection changed
+            self._draw_selection_box()
+            if self._update_box_selection():
+                self.mark_dirty()
             return
 
-    def _update_box_selection(self):
-        """Update selection based on current box."""
+    def _update_box_selection(self) -> bool:
+        """Update selection based on current box. Returns True if it changed."""
         if not self.selection_start or not self._selection_end:
-            return
+            return False
 
         x1, y1 = self.selection_start
         x2, y2 = self._selection_end
@@ -844,27 +975,35 @@ class Timeline:
         # Check for modifier key (Ctrl/Cmd)
         modifier_down = is_ctrl_down()
 
-        # If not holding modifier, clear existing selection first
-        if not modifier_down:
-            for note in self.project.beatmap.notes:
-                note.selected = False
+        # Lanes covered by the box (all lanes if the box has no valid bounds)
+        if min_lane is not None and max_lane is not None:
+            box_lanes = set(LANES[min_lane : max_lane + 1])
+        else:
+            box_lanes = set(LANES)
 
-        # Select markers within the box
-        for note in self.project.beatmap.notes:
-            # Check time range
-            if not (min_time <= note.time <= max_time):
-                continue
+        # Markers within the box (time range via binary search)
+        in_box = [
+            note
+            for note in self.project.beatmap.get_notes_in_range(min_time, max_time)
+            if note.type in box_lanes
+        ]
 
-            # Check lane (if we have valid lane bounds)
-            if min_lane is not None and max_lane is not None:
-                try:
-                    note_lane = LANES.index(note.type)
-                    if not (min_lane <= note_lane <= max_lane):
-                        continue
-                except ValueError:
-                    continue
+        # Only flip notes whose state differs, to know if a redraw is needed
+        changed = False
 
-            note.selected = True
+        # If not holding modifier, deselect everything outside the box
+        if not modifier_down:
+            in_box_ids = {id(note) for note in in_box}
+            for note in self.project.beatmap.notes:
+                if note.selected and id(note) not in in_box_ids:
+                    note.selected = False
+                    changed = True
+
+        for note in in_box:
+            if not note.selected:
+                note.selected = True
+                changed = True
+        return changed
 
     def _on_mouse_release(self, sender, app_data):
         """Handle mouse release."""
@@ -926,18 +1065,14 @@ class Timeline:
         if not selected:
             return
 
-        # Calculate new lanes for each note
-        new_types = []
-        for note in selected:
-            current_lane_index = LANES.index(note.type) if note.type in LANES else 0
-            new_lane_index = current_lane_index + direction
-            # Clamp to valid lane range
-            new_lane_index = max(0, min(new_lane_index, len(LANES) - 1))
-            new_types.append(LANES[new_lane_index])
+        # Calculate new lanes for all notes at once, clamped to valid lanes
+        lanes = _note_lanes(selected)
+        new_lanes = np.clip(lanes + direction, 0, len(LANES) - 1)
 
         # Check if any notes actually changed
-        if all(note.type == new_type for note, new_type in zip(selected, new_types)):
+        if np.array_equal(new_lanes, lanes):
             return  # No change needed
+        new_types = [LANES[i] for i in new_lanes.tolist()]
 
         # Create and execute command
         cmd = MoveNotesCommand(
@@ -961,8 +1096,7 @@ class Timeline:
 
         # Calculate grid step size (1/16 note)
         if self.project.bpm > 0:
-            beat_duration = 60.0 / self.project.bpm
-            grid_step = beat_duration / 16  # 1/16 note
+            grid_step = self._get_grid_steps()[0]  # 1/16 note
 
             # Snap current position to nearest grid point first, then move
             current_grid_index = round(self.project.playhead / grid_step)
@@ -976,12 +1110,10 @@ class Timeline:
         new_time = max(0, min(new_time, self.project.duration))
         self.project.playhead = new_time
 
-        # Notify via callback if available
+        # Notify via callback if available; update() moves the playhead
         if self.on_playhead_click:
             self.on_playhead_click(self.project.playhead)
 
-        self.mark_dirty()
-
     def _snap_selection_to_beat(self, direction: int):
         """Snap selection to 1/4 beat grid, then move by 1/4 beat.
 
@@ -995,20 +1127,13 @@ class Timeline:
         if self.project.bpm <= 0:
             return
 
-        # Calculate 1/4 beat duration (quarter note = 1/4 of a full beat)
-        beat_duration = 60.0 / self.project.bpm
-        quarter_beat = beat_duration / 4  # 1/4 of a beat
-
-        # Calculate new times: snap to 1/4 grid, then move by 1/4 beat
-        new_times = []
-        for note in selected:
-            # Step 1: Snap current position to nearest 1/4 beat grid
-            snapped_time = round(note.time / quarter_beat) * quarter_beat
-            # Step 2: Move by 1/4 beat in the specified direction
-            new_time = snapped_time + (direction * quarter_beat)
-            # Clamp to valid range
-            new_time = max(0, min(new_time, self.project.duration))
-            new_times.append(round(new_time, 3))
+        # 1/4 beat duration (quarter note = 1/4 of a full beat)
+        quarter_beat = self._get_grid_steps()[1]
+
+        # Calculate new times: snap to nearest 1/4 beat grid (np.round rounds
+        # half to even like round()), then move by 1/4 beat in the direction
+        snapped = np.round(_note_times(selected) / quarter_beat) * quarter_beat
+        new_times = self._clamp_times(snapped + (direction * quarter_beat))
 
         # Create and execute command
         cmd = MoveNotesCommand(
@@ -1020,6 +1145,12 @@ class Timeline:
         self.project.history.execute(cmd)
         self.mark_dirty()
 
+    def _clamp_times(self, times: np.ndarray) -> list[float]:
+        """Clamp note times to the song and round them to milliseconds."""
+        times = np.clip(times, 0, self.project.duration)
+        # round() rather than np.round, which can differ in the last digit
+        return [round(t, 3) for t in times.tolist()]
+
     def _adjust_selection_spacing(self, direction: int):
         """Adjust the spacing between selected markers.
 
@@ -1032,8 +1163,7 @@ class Timeline:
 
         # Calculate grid step size (1/16 note)
         if self.project.bpm > 0:
-            beat_duration = 60.0 / self.project.bpm
-            grid_step = beat_duration / 16  # 1/16 note
+            grid_step = self._get_grid_steps()[0]  # 1/16 note
         else:
             grid_step = 0.1  # Fallback: 100ms
 
@@ -1043,27 +1173,19 @@ class Timeline:
         # Use the first note as anchor (it stays in place)
         anchor_time = selected_sorted[0].time
 
-        # Calculate new times for each note
-        new_times = []
-        for i, note in enumerate(selected_sorted):
-            if i == 0:
-                new_times.append(note.time)  # First note stays in place
-                continue
+        # Calculate new times for all notes at once: each subsequent note
+        # moves by i * grid_step in the direction
+        times = _note_times(selected_sorted)
+        offsets = np.arange(len(selected_sorted)) * grid_step
+        new_times = times + direction * offsets
 
-            # Calculate how much to move this note
-            # Each subsequent note moves by i * grid_step in the direction
-            time_delta = direction * i * grid_step
-            new_time = note.time + time_delta
-
-            # Clamp to valid range and ensure it doesn't go before the anchor
-            if direction < 0:
-                # When decreasing, don't let notes collapse past each other
-                min_time = anchor_time + (
-                    i * grid_step * 0.5
-                )  # Keep at least half spacing
-                new_time = max(min_time, new_time)
-            new_time = max(0, min(new_time, self.project.duration))
-            new_times.append(round(new_time, 3))
+        # Clamp to valid range and ensure it doesn't go before the anchor
+        if direction < 0:
+            # When decreasing, don't let notes collapse past each other
+            # (keep at least half spacing)
+            new_times = np.maximum(anchor_time + offsets * 0.5, new_times)
+        new_times = self._clamp_times(new_times)
+        new_times[0] = anchor_time  # First note stays in place
 
         # Create and execute command (use sorted notes to match new_times order)
         cmd = MoveNotesCommand(
@@ -1092,8 +1214,7 @@ class Timeline:
 
         # Calculate grid step size (1/16 note)
         if self.project.bpm > 0:
-            beat_duration = 60.0 / self.project.bpm
-            grid_step = beat_duration / 16  # 1/16 note
+            grid_step = self._get_grid_steps()[0]  # 1/16 note
         else:
             grid_step = 0.1  # Fallback: 100ms
 
@@ -1101,12 +1222,7 @@ class Timeline:
         time_delta = direction * steps * grid_step
 
         # Calculate new times for all selected markers
-        new_times = []
-        for note in selected:
-            new_time = note.time + time_delta
-            # Clamp to valid range
-            new_time = max(0, min(new_time, self.project.duration))
-            new_times.append(round(new_time, 3))
+        new_times = self._clamp_times(_note_times(selected) + time_delta)
 
         # Create and execute command
         cmd = MoveNotesCommand(
@@ -1115,7 +1231,8 @@ class Timeline:
             new_times=new_times,
             description_text=f"Move {len(selected)} notes {'left' if direction < 0 else 'right'}",
         )
-        self.project.history.execute(cmd)
+        # Held arrow keys repeat quickly; merge the burst into one undo step
+        self.project.history.execute(cmd, merge=True)
         self.mark_dirty()
 
     def _is_mouse_over_timeline(self) -> bool:
@@ -1127,6 +1244,27 @@ class Timeline:
             "timeline_drawlist"
         )
 
+    def _get_window_geometry(self) -> tuple:
+        """Return the timeline window's (pos, x scroll, width) for this frame.
+
+        Mouse events can arrive many times per frame, so the values are only
+        queried from DearPyGui once per frame (or after we scroll ourselves).
+        """
+        frame = dpg.get_frame_count()
+        if frame != self._geometry_frame:
+            self._geometry = (
+                dpg.get_item_pos("timeline_window"),
+                dpg.get_x_scroll("timeline_window"),
+                dpg.get_item_width("timeline_window"),
+            )
+            self._geometry_frame = frame
+        return self._geometry
+
+    def _set_x_scroll(self, scroll_x: float):
+        """Scroll the timeline window and drop the cached geometry."""
+        dpg.set_x_scroll("timeline_window", scroll_x)
+        self._geometry_frame = -1
+
     def _screen_to_local(
         self, screen_pos: tuple[float, float]
     ) -> Optional[tuple[float, float]]:
@@ -1134,11 +1272,8 @@ class Timeline:
         if not self._window_tag:
             return None
 
-        # Get window position
-        window_pos = dpg.get_item_pos("timeline_window")
-
-        # Get scroll offset
-        scroll_x = dpg.get_x_scroll("timeline_window")
+        # Window position and scroll offset
+        window_pos, scroll_x, _ = self._get_window_geometry()
 
         local_x = screen_pos[0] - window_pos[0] + scroll_x
         local_y = screen_pos[1] - window_pos[1]
@@ -1155,11 +1290,14 @@ class Timeline:
         old_zoom = self.zoom
         self.zoom = max(MIN_ZOOM, min(MAX_ZOOM, zoom))
 
+        # Already at a zoom bound: nothing to scroll or redraw
+        if self.zoom == old_zoom:
+            return
+
         # If center_time provided, adjust scroll to keep it centered
-        if center_time is not None and self._window_tag and old_zoom != self.zoom:
-            # Get current scroll and window width
-            current_scroll = dpg.get_x_scroll("timeline_window")
-            window_width = dpg.get_item_width("timeline_window")
+        if center_time is not None and self._window_tag:
+            # Get current scroll
+            _, current_scroll, _ = self._get_window_geometry()
 
             # Calculate where center_time was on screen (relative to window)
             old_x = center_time * old_zoom
@@ -1171,7 +1309,7 @@ class Timeline:
 
             # Apply new scroll (clamp to valid range)
             new_scroll = max(0, new_scroll)
-            dpg.set_x_scroll("timeline_window", new_scroll)
+            self._set_x_scroll(new_scroll)
 
         self.mark_dirty()
 
@@ -1183,13 +1321,16 @@ class Timeline:
         """Zoom out, optionally centered on a specific time."""
         self.set_zoom(self.zoom / 1.2, center_time)
 
+    def zoom_steps(self, steps: int, center_time: float = None):
+        """Apply several zoom in (positive) or out (negative) steps at once."""
+        self.set_zoom(self.zoom * 1.2**steps, center_time)
+
     def get_visible_center_time(self) -> float:
         """Get the time at the center of the visible timeline area."""
         if not self._window_tag:
             return self.project.playhead
 
-        scroll_x = dpg.get_x_scroll("timeline_window")
-        window_width = dpg.get_item_width("timeline_window")
+        _, scroll_x, window_width = self._get_window_geometry()
         center_x = scroll_x + window_width / 2
         return center_x / self.zoom
 
@@ -1197,4 +1338,4 @@ class Timeline:
         """Scroll to show a specific time."""
         if self._window_tag:
             x = time * self.zoom
-            dpg.set_x_scroll("timeline_window", x - 100)
+            self._set_x_scroll(x - 100)
@@ -5,7 +5,7 @@ Play/pause, seek, and time display.
 
 import dearpygui.dearpygui as dpg
 from typing import TYPE_CHECKING, Optional, Callable
-from utils.input import register_text_input
+from utils.input import register_text_input, is_text_input_focused
 
 if TYPE_CHECKING:
     from core.project import Project
@@ -45,6 +45,12 @@ class Transport:
         self._category_input_tag: Optional[int] = None
         self._priority_input_tag: Optional[int] = None
 
+        # Last displayed values, so update() only writes widgets on change
+        self._last_times: tuple[float, float] = (-1.0, -1.0)
+        self._last_time_text: str = ""
+        self._last_play_label: str = ""
+        self._last_meta: tuple = ()  # (bpm, title, category, priority)
+
     def create(self, parent: int):
         """Create the transport controls."""
         with dpg.group(horizontal=True, parent=parent):
@@ -140,15 +146,35 @@ class Transport:
     def update(self):
         """Update display."""
         # Update time display
-        if self._time_text_tag:
-            current = format_time(self.project.playhead)
-            total = format_time(self.project.duration)
-            dpg.set_value(self._time_text_tag, f"{current} / {total}")
+        times = (self.project.playhead, self.project.duration)
+        if self._time_text_tag and times != self._last_times:
+            self._last_times = times
+            current = format_time(times[0])
+            total = format_time(times[1])
+            time_text = f"{current} / {total}"
+            # The text only changes every 10 ms of playback
+            if time_text != self._last_time_text:
+                self._last_time_text = time_text
+                dpg.set_value(self._time_text_tag, time_text)
 
         # Update play button
         if self._play_button_tag:
             label = "||" if self.project.is_playing else ">"
-            dpg.configure_item(self._play_button_tag, label=label)
+            if label != self._last_play_label:
+                self._last_play_label = label
+                dpg.configure_item(self._play_button_tag, label=label)
+
+        # Sync the metadata inputs only when the values changed since the
+        # last sync; otherwise they already match and need no widget reads.
+        # Typing can leave an input out of sync, so re-sync once it ends.
+        meta = self.project.beatmap.meta
+        meta_values = (self.project.bpm, meta.title, meta.category, meta.priority)
+        if is_text_input_focused():
+            self._last_meta = ()
+        elif meta_values == self._last_meta:
+            return
+        else:
+            self._last_meta = meta_values
 
         # Update BPM input (only if value differs to avoid interrupting user input)
         if self._bpm_input_tag:
@@ -174,7 +200,9 @@ class Transport:
         if self._priority_input_tag:
             current_value = dpg.get_value(self._priority_input_tag)
             if current_value != int(self.project.beatmap.meta.priority):
-                dpg.set_value(self._priority_input_tag, int(self.project.beatmap.meta.priority))
+                dpg.set_value(
+                    self._priority_input_tag, int(self.project.beatmap.meta.priority)
+                )
 
     def _on_play_pause(self):
         """Handle play/pause button."""
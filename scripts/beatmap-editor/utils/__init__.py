@@ -1,6 +1,17 @@
 """Utility functions for beatmap editor."""
 
-from .grid import generate_beat_grid, snap_to_grid
+from .grid import (
+    beat_duration,
+    generate_beat_grid,
+    snap_to_grid,
+    snap_times_to_grid,
+)
 from .waveform import generate_waveform_texture
 
-__all__ = ["generate_beat_grid", "snap_to_grid", "generate_waveform_texture"]
+__all__ = [
+    "beat_duration",
+    "generate_beat_grid",
+    "snap_to_grid",
+    "snap_times_to_grid",
+    "generate_waveform_texture",
+]
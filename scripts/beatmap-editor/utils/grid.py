@@ -4,7 +4,8 @@ Provides beat grid generation and snap-to-grid functionality.
 """
 
 import numpy as np
-from typing import Union
+from functools import lru_cache
+from typing import Optional, Union
 
 from core.constants import (
     SUBDIVISION_HALF,
@@ -14,6 +15,13 @@ from core.constants import (
 )
 
 
+@lru_cache(maxsize=16)
+def beat_duration(bpm: float) -> float:
+    """Duration of one beat in seconds at the given BPM."""
+    return 60.0 / bpm
+
+
+@lru_cache(maxsize=8)
 def generate_beat_grid(
     bpm: float, duration: float, subdivision: int = SUBDIVISION_SIXTEENTH
 ) -> np.ndarray:
@@ -26,16 +34,17 @@ def generate_beat_grid(
         subdivision: Subdivisions per beat (2=half, 4=quarter, 8=eighth, 16=sixteenth)
 
     Returns:
-        NumPy array of grid timestamps
+        Read-only NumPy array of grid timestamps (cached per arguments)
     """
-    beat_duration = 60.0 / bpm
-    subdivision_duration = beat_duration / subdivision
+    subdivision_duration = beat_duration(bpm) / subdivision
 
     num_subdivisions = int(np.ceil(duration / subdivision_duration))
     grid = np.arange(num_subdivisions) * subdivision_duration
 
     # Filter to only include times within duration
     grid = grid[grid < duration]
+    # Shared between callers by the cache, so it must not be modified
+    grid.setflags(write=False)
     return grid
 
 
@@ -43,17 +52,65 @@ def snap_to_grid(time: float, grid: np.ndarray) -> float:
     """
     Snap a time to the nearest grid position.
 
+    Uses a binary search, so the grid must be sorted ascending (as returned
+    by generate_beat_grid).
+
     Args:
         time: Original time in seconds
-        grid: Array of valid grid timestamps
+        grid: Sorted array of valid grid timestamps
 
     Returns:
         Snapped time (nearest grid point)
     """
-    if len(grid) == 0:
+    n = len(grid)
+    if n == 0:
         return time
-    idx = np.argmin(np.abs(grid - time))
-    return float(grid[idx])
+    i = int(np.searchsorted(grid, time))
+    if i == 0:
+        return float(grid[0])
+    if i == n:
+        return float(grid[-1])
+    left = grid[i - 1]
+    right = grid[i]
+    # Ties go to the earlier grid point
+    return float(left if time - left <= right - time else right)
+
+
+def snap_times_to_grid(
+    times: np.ndarray, grid: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Snap many times to their nearest grid positions at once.
+
+    Vectorized counterpart of snap_to_grid with the same tie-breaking.
+
+    Args:
+        times: Array of original times in seconds
+        grid: Sorted array of valid grid timestamps
+        out: Optional preallocated array (same length as times) to write into
+
+    Returns:
+        Array of snapped times (out, if provided)
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(times)
+
+    n = len(grid)
+    if n == 0:
+        out[:] = times
+        return out
+    if n == 1:
+        out[:] = grid[0]
+        return out
+
+    idx = np.searchsorted(grid, times)
+    np.clip(idx, 1, n - 1, out=idx)
+    left = grid[idx - 1]
+    right = grid[idx]
+    np.copyto(out, right)
+    np.copyto(out, left, where=(times - left) <= (right - times))
+    return out
 
 
 def time_to_grid_index(
@@ -70,8 +127,7 @@ def time_to_grid_index(
     Returns:
         Grid index (0-based)
     """
-    beat_duration = 60.0 / bpm
-    subdivision_duration = beat_duration / subdivision
+    subdivision_duration = beat_duration(bpm) / subdivision
     return int(round(time / subdivision_duration))
 
 
@@ -89,8 +145,7 @@ def grid_index_to_time(
     Returns:
         Time in seconds
     """
-    beat_duration = 60.0 / bpm
-    subdivision_duration = beat_duration / subdivision
+    subdivision_duration = beat_duration(bpm) / subdivision
     return index * subdivision_duration
 
 
@@ -105,8 +160,7 @@ def get_beat_number(time: float, bpm: float) -> tuple[int, int]:
     Returns:
         Tuple of (beat_number, subdivision_within_beat) where subdivision is 0-15 for 1/16 grid
     """
-    beat_duration = 60.0 / bpm
-    subdivision_duration = beat_duration / SUBDIVISION_SIXTEENTH
+    subdivision_duration = beat_duration(bpm) / SUBDIVISION_SIXTEENTH
 
     total_subdivisions = int(round(time / subdivision_duration))
     beat_number = total_subdivisions // SUBDIVISION_SIXTEENTH
@@ -7,6 +7,28 @@ import dearpygui.dearpygui as dpg
 from core.constants import IS_MACOS
 
 
+# Modifier key states queried during the current frame, so repeated checks
+# from several key handlers cost one DearPyGui call per key per frame
+_key_state: dict[str, bool] = {}
+_key_state_frame: int = -1
+
+
+def _keys_down(name: str, *keys: int) -> bool:
+    """Return whether any of keys is held, cached under name for this frame."""
+    global _key_state_frame
+
+    frame = dpg.get_frame_count()
+    if frame != _key_state_frame:
+        _key_state.clear()
+        _key_state_frame = frame
+
+    state = _key_state.get(name)
+    if state is None:
+        state = any(dpg.is_key_down(key) for key in keys)
+        _key_state[name] = state
+    return state
+
+
 def is_modifier_down() -> bool:
     """
     Check if the primary modifier key is pressed.
@@ -14,8 +36,8 @@ def is_modifier_down() -> bool:
     """
     if IS_MACOS:
         # macOS uses Command key (LWin/RWin in DearPyGui)
-        return dpg.is_key_down(dpg.mvKey_LWin) or dpg.is_key_down(dpg.mvKey_RWin)
-    return dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
+        return _keys_down("cmd", dpg.mvKey_LWin, dpg.mvKey_RWin)
+    return _keys_down("lr_ctrl", dpg.mvKey_LControl, dpg.mvKey_RControl)
 
 
 def is_ctrl_down() -> bool:
@@ -23,21 +45,17 @@ def is_ctrl_down() -> bool:
     Check if the Ctrl key is pressed (regardless of platform).
     Use is_modifier_down() for platform-aware shortcut handling.
     """
-    return (
-        dpg.is_key_down(dpg.mvKey_Control)
-        or dpg.is_key_down(dpg.mvKey_LControl)
-        or dpg.is_key_down(dpg.mvKey_RControl)
-    )
+    return _keys_down("ctrl", dpg.mvKey_Control, dpg.mvKey_LControl, dpg.mvKey_RControl)
 
 
 def is_shift_down() -> bool:
     """Check if Shift key is pressed."""
-    return dpg.is_key_down(dpg.mvKey_LShift) or dpg.is_key_down(dpg.mvKey_RShift)
+    return _keys_down("shift", dpg.mvKey_LShift, dpg.mvKey_RShift)
 
 
 def is_alt_down() -> bool:
     """Check if Alt/Option key is pressed."""
-    return dpg.is_key_down(dpg.mvKey_Alt)
+    return _keys_down("alt", dpg.mvKey_Alt)
 
 
 def is_cmd_down() -> bool:
@@ -46,21 +64,53 @@ def is_cmd_down() -> bool:
     On non-macOS, always returns False.
     """
     if IS_MACOS:
-        return dpg.is_key_down(dpg.mvKey_LWin) or dpg.is_key_down(dpg.mvKey_RWin)
+        return _keys_down("cmd", dpg.mvKey_LWin, dpg.mvKey_RWin)
     return False
 
 
 # Module-level registry of text input items to check for focus
 _registered_input_items: list[int] = []
 
+# Registered inputs that are currently active, maintained by item handlers
+# so focus checks don't have to poll DearPyGui on every key event
+_active_input_items: set[int] = set()
+_focus_tracking_ready: bool = False
+
+
+def _on_input_activated(sender, app_data, user_data):
+    """Item handler: a registered input gained keyboard focus."""
+    _active_input_items.add(user_data)
+
+
+def _on_input_deactivated(sender, app_data, user_data):
+    """Item handler: a registered input lost keyboard focus."""
+    _active_input_items.discard(user_data)
+
 
 def register_text_input(item_tag: int) -> None:
     """
     Register a text input widget for focus tracking.
     Call this after creating any input_text, input_int, input_float, etc.
     """
-    if item_tag not in _registered_input_items:
-        _registered_input_items.append(item_tag)
+    global _focus_tracking_ready
+
+    if item_tag in _registered_input_items:
+        return
+    _registered_input_items.append(item_tag)
+
+    try:
+        with dpg.item_handler_registry() as handler_registry:
+            dpg.add_item_activated_handler(
+                callback=_on_input_activated, user_data=item_tag
+            )
+            dpg.add_item_deactivated_handler(
+                callback=_on_input_deactivated, user_data=item_tag
+            )
+        dpg.bind_item_handler_registry(item_tag, handler_registry)
+        _focus_tracking_ready = True
+    except Exception:
+        # Handlers unavailable - is_text_input_focused() falls back to polling
+        pass
 
 
 def unregister_text_input(item_tag: int) -> None:
@@ -70,6 +120,7 @@ def unregister_text_input(item_tag: int) -> None:
     """
     if item_tag in _registered_input_items:
         _registered_input_items.remove(item_tag)
+    _active_input_items.discard(item_tag)
 
 
 def is_text_input_focused() -> bool:
@@ -78,6 +129,9 @@ def is_text_input_focused() -> bool:
     Returns True if any registered input widget has keyboard focus.
     This is used to prevent keyboard shortcuts from triggering while typing.
     """
+    if _focus_tracking_ready:
+        return bool(_active_input_items)
+
     for item_tag in _registered_input_items:
         try:
             if dpg.does_item_exist(item_tag) and dpg.is_item_active(item_tag):
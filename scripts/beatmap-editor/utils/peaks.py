@@ -28,6 +28,16 @@ class PeakSettings:
     linked: bool = True  # If True, rearm threshold follows main threshold
 
 
+@dataclass
+class RmsEnvelope:
+    """RMS values of a waveform as an array, with their precomputed range."""
+
+    source: dict  # waveform_data the envelope was built from
+    values: np.ndarray
+    min_value: float
+    max_value: float
+
+
 @dataclass
 class PeakState:
     """Holds peak detection settings and results for all tracks."""
@@ -54,6 +64,33 @@ class PeakState:
         }
     )
 
+    # RMS envelope per track, reused across detections until the waveform changes
+    envelopes: dict[str, RmsEnvelope] = field(default_factory=dict)
+
+
+def rms_envelope(waveform_data: dict) -> Optional[RmsEnvelope]:
+    """
+    Build the RMS envelope used by detect_peaks.
+
+    Returns:
+        RmsEnvelope, or None if the waveform has no RMS data
+    """
+    if not waveform_data:
+        return None
+
+    # Get RMS values (better for energy detection than raw min/max)
+    rms_values = waveform_data.get("rms")
+    if rms_values is None or len(rms_values) == 0:
+        return None
+
+    rms = np.asarray(rms_values, dtype=np.float64)
+    return RmsEnvelope(
+        source=waveform_data,
+        values=rms,
+        min_value=float(np.min(rms)),
+        max_value=float(np.max(rms)),
+    )
+
 
 def detect_peaks(
     waveform_data: dict,
@@ -61,6 +98,7 @@ def detect_peaks(
     threshold_percent: float,
     min_gap_seconds: float = MIN_PEAK_GAP_SECONDS,
     rearm_threshold_percent: Optional[float] = None,
+    envelope: Optional[RmsEnvelope] = None,
 ) -> list[float]:
     """
     Detect peaks in waveform data that exceed the threshold.
@@ -75,28 +113,23 @@ def detect_peaks(
         threshold_percent: Threshold percentage (0-100). Higher = fewer peaks.
         min_gap_seconds: Minimum gap between peaks in seconds
         rearm_threshold_percent: Re-arm threshold percentage (0-100). If None, uses 70% of threshold_percent.
+        envelope: Precomputed rms_envelope(waveform_data), to skip rebuilding it
 
     Returns:
         List of peak times in seconds
     """
-    if not waveform_data:
-        return []
+    if envelope is None:
+        envelope = rms_envelope(waveform_data)
+        if envelope is None:
+            return []
 
-    # Get RMS values (better for energy detection than raw min/max)
-    rms_values = waveform_data.get("rms", [])
-    if not rms_values:
-        return []
-
-    rms = np.array(rms_values)
+    rms = envelope.values
     num_samples = len(rms)
 
-    if num_samples == 0:
-        return []
-
     # Calculate the actual threshold value from percentage
     # threshold_percent of 100 means only the absolute max, 0 means everything
-    max_rms = np.max(rms)
-    min_rms = np.min(rms)
+    max_rms = envelope.max_value
+    min_rms = envelope.min_value
     rms_range = max_rms - min_rms
 
     if rms_range <= 0:
@@ -115,46 +148,48 @@ def detect_peaks(
     samples_per_second = num_samples / duration if duration > 0 else 1
     min_gap_samples = int(min_gap_seconds * samples_per_second)
 
+    # Contiguous runs of samples at/above the threshold, as [start, end) bounds
+    above = rms >= threshold
+    edges = np.diff(above.astype(np.int8), prepend=0, append=0)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    if len(run_starts) == 0:
+        return []
+
+    # Hysteresis: detection starts armed, and every run leaves it disarmed
+    # until the signal drops below the re-arm threshold. Inside a run the
+    # signal is at/above the threshold, so a run triggers a peak only if a
+    # re-arm sample lies in the gap before it (or it is the first run).
+    rearm_count = np.concatenate(([0], np.cumsum(rms < rearm_threshold)))
+    triggered = np.empty(len(run_starts), dtype=bool)
+    triggered[0] = True
+    triggered[1:] = rearm_count[run_starts[1:]] > rearm_count[run_ends[:-1]]
+
+    # Index of the (first) local maximum within each run, computed over the
+    # above-threshold samples packed end to end
+    run_values = rms[above]
+    run_lengths = run_ends - run_starts
+    run_offsets = np.concatenate(([0], np.cumsum(run_lengths)[:-1]))
+    run_max = np.maximum.reduceat(run_values, run_offsets)
+    packed_positions = np.where(
+        run_values == np.repeat(run_max, run_lengths),
+        np.arange(len(run_values)),
+        len(run_values),
+    )
+    first_max = np.minimum.reduceat(packed_positions, run_offsets)
+    peak_indices = np.flatnonzero(above)[first_max[triggered]]
+
+    # Enforce the minimum gap between accepted peaks (sequential by nature,
+    # but only loops over candidate peaks, not samples)
     peaks = []
-    armed = True  # Whether we're looking for a new peak
     last_peak_sample = -min_gap_samples  # Ensure first peak can be detected
-
-    i = 0
-    while i < num_samples:
-        val = rms[i]
-
-        if armed:
-            # Looking for a peak that exceeds threshold
-            if val >= threshold:
-                # Found a peak! Find the local maximum in this region
-                peak_val = val
-                peak_idx = i
-
-                # Search forward for the actual peak
-                j = i + 1
-                while j < num_samples and rms[j] >= threshold:
-                    if rms[j] > peak_val:
-                        peak_val = rms[j]
-                        peak_idx = j
-                    j += 1
-
-                # Check minimum gap
-                if peak_idx - last_peak_sample >= min_gap_samples:
-                    # Convert sample index to time
-                    peak_time = (peak_idx / num_samples) * duration
-                    peaks.append(peak_time)
-                    last_peak_sample = peak_idx
-
-                # Disarm until signal drops below rearm threshold
-                armed = False
-                i = j  # Skip to end of this peak region
-                continue
-        else:
-            # Waiting for signal to drop below rearm threshold
-            if val < rearm_threshold:
-                armed = True
-
-        i += 1
+    for peak_idx in peak_indices.tolist():
+        if peak_idx - last_peak_sample >= min_gap_samples:
+            # Convert sample index to time
+            peak_time = (peak_idx / num_samples) * duration
+            peaks.append(peak_time)
+            last_peak_sample = peak_idx
 
     return peaks
 
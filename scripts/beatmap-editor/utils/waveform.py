@@ -3,7 +3,9 @@ Waveform texture generation for timeline visualization.
 Converts audio data to drawable waveform representations.
 """
 
+import os
 import numpy as np
+from functools import lru_cache
 from typing import Optional
 import librosa
 
@@ -12,6 +14,26 @@ SAMPLE_RATE = 22050
 HOP_LENGTH = 512
 
 
+@lru_cache(maxsize=1)
+def _load_audio_cached(
+    audio_path: str, mtime: float, sample_rate: int
+) -> tuple[np.ndarray, int]:
+    """
+    Decode an audio file once per (path, mtime, sample_rate).
+    Only the most recent track is kept, so a replaced file's samples are freed.
+    """
+    # Downmix to mono so waveform and RMS passes scan a single channel
+    y, sr = librosa.load(audio_path, sr=sample_rate, mono=True)
+    # Shared between callers by the cache, so it must not be modified
+    y.setflags(write=False)
+    return y, sr
+
+
+def _load_audio(audio_path: str) -> tuple[np.ndarray, int]:
+    """Load audio at SAMPLE_RATE, reusing the decode while the file is unchanged."""
+    return _load_audio_cached(audio_path, os.path.getmtime(audio_path), SAMPLE_RATE)
+
+
 def load_audio_for_waveform(audio_path: str) -> tuple[np.ndarray, int]:
     """
     Load audio file for waveform generation.
@@ -20,10 +42,9 @@ def load_audio_for_waveform(audio_path: str) -> tuple[np.ndarray, int]:
         audio_path: Path to audio file
 
     Returns:
-        Tuple of (audio_samples, sample_rate)
+        Tuple of (audio_samples, sample_rate); the samples are read-only
     """
-    y, sr = librosa.load(audio_path, sr=SAMPLE_RATE)
-    return y, sr
+    return _load_audio(audio_path)
 
 
 def generate_waveform_data(
@@ -36,7 +57,7 @@ def generate_waveform_data(
     Generate waveform visualization data from audio samples.
 
     Args:
-        audio_samples: Audio sample array
+        audio_samples: Mono (1-D) audio sample array
         width: Width in pixels (number of columns)
         height: Height in pixels
         sample_rate: Sample rate of the audio
@@ -44,6 +65,10 @@ def generate_waveform_data(
     Returns:
         2D numpy array of shape (height, width) with values 0-255 for grayscale intensity
     """
+    if audio_samples.ndim != 1:
+        raise ValueError(
+            f"Expected mono audio samples, got shape {audio_samples.shape}"
+        )
     if len(audio_samples) == 0:
         return np.zeros((height, width), dtype=np.uint8)
 
@@ -53,33 +78,31 @@ def generate_waveform_data(
     waveform = np.zeros((height, width), dtype=np.uint8)
     center = height // 2
 
-    for x in range(width):
-        start_sample = int(x * samples_per_pixel)
-        end_sample = int((x + 1) * samples_per_pixel)
-        end_sample = min(end_sample, len(audio_samples))
-
-        if start_sample >= end_sample:
-            continue
-
-        chunk = audio_samples[start_sample:end_sample]
-
-        # Get min/max for this chunk (for envelope display)
-        min_val = np.min(chunk)
-        max_val = np.max(chunk)
-
-        # Convert to pixel coordinates
-        min_y = center - int(min_val * center * 0.9)
-        max_y = center - int(max_val * center * 0.9)
-
-        # Clamp to bounds
-        min_y = np.clip(min_y, 0, height - 1)
-        max_y = np.clip(max_y, 0, height - 1)
-
-        # Draw vertical line from min to max
-        if min_y > max_y:
-            min_y, max_y = max_y, min_y
-
-        waveform[min_y : max_y + 1, x] = 200  # Light gray for waveform
+    # Sample bounds of every column: column x covers [bounds[x], bounds[x + 1])
+    bounds = (np.arange(width + 1) * samples_per_pixel).astype(np.intp)
+    np.minimum(bounds, len(audio_samples), out=bounds)
+    columns = np.flatnonzero(bounds[:-1] < bounds[1:])
+    if len(columns) == 0:
+        return waveform
+
+    # Min/max of all non-empty columns at once (for envelope display). Empty
+    # columns sit between non-empty ones without covering any samples, so
+    # each reduction runs up to the next non-empty column's start.
+    samples = audio_samples[: bounds[-1]]
+    starts = bounds[columns]
+    min_vals = np.minimum.reduceat(samples, starts)
+    max_vals = np.maximum.reduceat(samples, starts)
+
+    # Convert to pixel coordinates, clamped to bounds
+    min_ys = np.clip(center - (min_vals * center * 0.9).astype(int), 0, height - 1)
+    max_ys = np.clip(center - (max_vals * center * 0.9).astype(int), 0, height - 1)
+
+    # Draw vertical lines from min to max for all columns in one pass
+    tops = np.minimum(min_ys, max_ys)
+    bottoms = np.maximum(min_ys, max_ys)
+    rows = np.arange(height)[:, None]
+    mask = (rows >= tops) & (rows <= bottoms)
+    waveform[:, columns] = np.where(mask, np.uint8(200), np.uint8(0))  # Light gray
 
     return waveform
 
@@ -129,8 +152,8 @@ def get_audio_duration(audio_path: str) -> float:
     Returns:
         Duration in seconds
     """
-    y, sr = librosa.load(audio_path, sr=SAMPLE_RATE)
-    return librosa.get_duration(y=y, sr=sr)
+    # Read from the file header instead of decoding the whole file
+    return librosa.get_duration(path=audio_path)
 
 
 def extract_rms_envelope(
@@ -146,7 +169,7 @@ def extract_rms_envelope(
     Returns:
         Tuple of (times, rms_values)
     """
-    y, sr = librosa.load(audio_path, sr=SAMPLE_RATE)
+    y, sr = _load_audio(audio_path)
     rms = librosa.feature.rms(y=y, hop_length=hop_length)[0]
     times = librosa.frames_to_time(np.arange(len(rms)), sr=sr, hop_length=hop_length)
     return times, rms
@@ -23,12 +23,17 @@ import json
 import sqlite3
 import struct
 import sys
+import xml.etree.ElementTree as ET
+from functools import partial
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 SAMPLES_PER_STROKE = 64
+CONVERT_CHUNKSIZE = 64  # Kanji per worker task
 FLOATS_PER_STROKE = SAMPLES_PER_STROKE * 2
 BYTES_PER_STROKE = FLOATS_PER_STROKE * 4
+STROKE_STRUCT = struct.Struct("<" + "f" * FLOATS_PER_STROKE)  # Compiled once
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 
@@ -49,25 +54,46 @@ add_keywords_mod = load_module("add_keywords_mod", SCRIPT_DIR / "add_keywords.py
 
 
 # --- Pipeline steps ---------------------------------------------------------
+def iter_kanji_xml(files: List[str]) -> Iterator[Tuple[bytes, str]]:
+    """Stream each <kanji> element of the KanjiVG files as (xml, source filename)."""
+    for f in files:
+        try:
+            for kn in kanj_conv.iter_kanji(f):
+                yield kanj_conv.kanji_to_xml(kn), f
+        except Exception as exc:  # pragma: no cover - defensive
+            print(f"  ! Skipping rest of {f}: {exc}", file=sys.stderr)
+
+
+def convert_kanji(job: Tuple[bytes, str], samples: int, normalize_size: float) -> List[dict]:
+    """Sample the strokes of one serialized <kanji> element (runs in a worker)."""
+    kanji_xml, source_filename = job
+    kn = ET.fromstring(kanji_xml)
+    try:
+        entry = kanj_conv.extract_kanji(
+            kn,
+            samples=samples,
+            do_normalize=True,
+            size=normalize_size,
+            source_filename=source_filename,
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        print(f"  ! Skipping {kn.attrib.get('id') or source_filename}: {exc}", file=sys.stderr)
+        return []
+    return [entry]
+
+
 def convert_kanjivg(input_path: Path, samples: int, normalize_size: float, verbose: bool) -> List[dict]:
     files = kanj_conv.collect_files(str(input_path))
     if verbose:
         print(f"[1/4] Converting KanjiVG -> strokes from {len(files)} file(s)...")
 
+    # Stroke sampling is independent per kanji, so it is spread over all
+    # cores; imap keeps the input order so the output is deterministic
+    convert = partial(convert_kanji, samples=samples, normalize_size=normalize_size)
     all_entries: List[dict] = []
-    for f in files:
-        try:
-            tree = kanj_conv.load_xml(f)
-            entries = kanj_conv.extract_kanji_from_tree(
-                tree,
-                samples=samples,
-                do_normalize=True,
-                size=normalize_size,
-                source_filename=f,
-            )
+    with Pool() as pool:
+        for entries in pool.imap(convert, iter_kanji_xml(files), chunksize=CONVERT_CHUNKSIZE):
             all_entries.extend(entries)
-        except Exception as exc:  # pragma: no cover - defensive
-            print(f"  ! Skipping {f}: {exc}", file=sys.stderr)
     if verbose:
         print(f"    ✓ Converted {len(all_entries)} kanji")
     return all_entries
@@ -83,8 +109,14 @@ def load_jlpt_lookup(path: Path) -> Dict[str, int]:
     }
 
 
-def annotate_tags(entries: Iterable[dict], jlpt_lookup: Dict[str, int], verbose: bool) -> List[dict]:
-    tagged: List[dict] = []
+def enrich_entries(
+    entries: Iterable[dict],
+    jlpt_lookup: Dict[str, int],
+    keyword_map: Dict[str, Dict[str, str]],
+    verbose: bool,
+) -> List[dict]:
+    """Attach tags and keyword metadata in one pass, dropping untagged kanji."""
+    enriched: List[dict] = []
     for entry in entries:
         char = entry.get("kanji") or entry.get("char") or ""
         if not char:
@@ -93,30 +125,17 @@ def annotate_tags(entries: Iterable[dict], jlpt_lookup: Dict[str, int], verbose:
         if not tags:
             # Skip entries without tags to match the previous pipeline behavior
             continue
-        enriched = dict(entry)
-        enriched["tags"] = tags
-        tagged.append(enriched)
-    if verbose:
-        print(f"[2/4] Tagged {len(tagged)} kanji with JLPT/kana categories")
-    return tagged
-
-
-def add_keywords(entries: Iterable[dict], keyword_map: Dict[str, Dict[str, str]], verbose: bool) -> List[dict]:
-    enriched: List[dict] = []
-    for entry in entries:
-        char = entry.get("kanji") or entry.get("char") or ""
-        if not char:
-            continue
 
         uniq_kw = (keyword_map.get(char, {}) or {}).get("uniq", "") or ""
-        kana_reading = add_keywords_mod.get_kana_reading(char)
-        if not uniq_kw and kana_reading:
-            uniq_kw = kana_reading
+        if not uniq_kw:
+            uniq_kw = add_keywords_mod.get_kana_reading(char) or ""
 
         updated = dict(entry)
+        updated["tags"] = tags
         updated["keyword"] = {"uniq": uniq_kw}
         enriched.append(updated)
     if verbose:
+        print(f"[2/4] Tagged {len(enriched)} kanji with JLPT/kana categories")
         print(f"[3/4] Attached keyword metadata to {len(enriched)} kanji")
     return enriched
 
@@ -133,7 +152,28 @@ def pack_points(points: List[List[float]]) -> bytes:
     else:
         flat = flat[:FLOATS_PER_STROKE]
 
-    return struct.pack("<" + "f" * FLOATS_PER_STROKE, *flat)
+    return STROKE_STRUCT.pack(*flat)
+
+
+def iter_kanji_rows(entries: List[dict]) -> Iterator[Tuple[str, str, int, Any]]:
+    for entry in entries:
+        keyword = (entry.get("keyword") or {}).get("uniq") or None
+        yield (entry.get("id") or "", entry.get("char") or "", len(entry.get("strokes") or []), keyword)
+
+
+def iter_tag_rows(entries: List[dict]) -> Iterator[Tuple[str, str]]:
+    for entry in entries:
+        kanji_id = entry.get("id") or ""
+        for tag in entry.get("tags") or []:
+            yield (kanji_id, tag)
+
+
+def iter_stroke_rows(entries: List[dict]) -> Iterator[Tuple[str, int, Any, bytes]]:
+    # Blobs are packed as SQLite consumes the rows rather than held in a list
+    for entry in entries:
+        kanji_id = entry.get("id") or ""
+        for idx, stroke in enumerate(entry.get("strokes") or []):
+            yield (kanji_id, idx, stroke.get("id"), pack_points(stroke.get("points") or []))
 
 
 def write_sqlite(entries: List[dict], out_path: Path, verbose: bool) -> None:
@@ -150,6 +190,8 @@ def write_sqlite(entries: List[dict], out_path: Path, verbose: bool) -> None:
         """
         PRAGMA journal_mode = OFF;
         PRAGMA synchronous = OFF;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
         CREATE TABLE kanji(
             id TEXT PRIMARY KEY,
             char TEXT NOT NULL,
@@ -167,52 +209,35 @@ def write_sqlite(entries: List[dict], out_path: Path, verbose: bool) -> None:
             points BLOB NOT NULL,
             PRIMARY KEY(kanji_id, stroke_index)
         );
-        CREATE INDEX idx_kanji_tags_tag ON kanji_tags(tag);
-        CREATE INDEX idx_strokes_kanji ON strokes(kanji_id);
         """
     )
 
-    kanji_rows = []
-    tag_rows = []
-    stroke_rows = []
-
-    for entry in entries:
-        kanji_id = entry.get("id") or ""
-        char = entry.get("char") or ""
-        strokes = entry.get("strokes") or []
-        keyword = (entry.get("keyword") or {}).get("uniq") or None
-
-        kanji_rows.append((kanji_id, char, len(strokes), keyword))
-
-        for tag in entry.get("tags") or []:
-            tag_rows.append((kanji_id, tag))
-
-        for idx, stroke in enumerate(strokes):
-            points = stroke.get("points") or []
-            stroke_id = stroke.get("id")
-            blob = pack_points(points)
-            stroke_rows.append(
-                (kanji_id, idx, stroke_id, sqlite3.Binary(blob))
-            )
-
+    # All inserts and the index builds run in the one implicit transaction
+    # opened by the first INSERT; the secondary indexes are built once the
+    # tables are full
     cur.executemany(
         "INSERT INTO kanji(id, char, stroke_count, keyword) VALUES (?, ?, ?, ?)",
-        kanji_rows,
+        iter_kanji_rows(entries),
     )
+    kanji_count = cur.rowcount  # Rows inserted by the whole executemany
     cur.executemany(
         "INSERT INTO kanji_tags(kanji_id, tag) VALUES (?, ?)",
-        tag_rows,
+        iter_tag_rows(entries),
     )
+    tag_count = cur.rowcount
     cur.executemany(
         "INSERT INTO strokes(kanji_id, stroke_index, stroke_id, points) VALUES (?, ?, ?, ?)",
-        stroke_rows,
+        iter_stroke_rows(entries),
     )
-
+    stroke_count = cur.rowcount
+    # execute() rather than executescript(), which would commit first
+    cur.execute("CREATE INDEX idx_kanji_tags_tag ON kanji_tags(tag)")
+    cur.execute("CREATE INDEX idx_strokes_kanji ON strokes(kanji_id)")
     conn.commit()
     conn.close()
     if verbose:
         print(
-            f"    ✓ Wrote {len(kanji_rows)} kanji, {len(tag_rows)} tags, {len(stroke_rows)} strokes"
+            f"    ✓ Wrote {kanji_count} kanji, {tag_count} tags, {stroke_count} strokes"
         )
 
 
@@ -242,8 +267,7 @@ def main() -> None:
         normalize_size=args.normalize_size,
         verbose=args.verbose,
     )
-    tagged_entries = annotate_tags(raw_entries, jlpt_lookup, verbose=args.verbose)
-    enriched_entries = add_keywords(tagged_entries, keyword_map, verbose=args.verbose)
+    enriched_entries = enrich_entries(raw_entries, jlpt_lookup, keyword_map, verbose=args.verbose)
     write_sqlite(enriched_entries, Path(args.out), verbose=args.verbose)
 
     if args.verbose:
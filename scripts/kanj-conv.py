@@ -27,35 +27,77 @@ import re
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
-from svgpathtools import parse_path
+from svgpathtools import Arc, parse_path
+
+try:
+    from lxml import etree as lxml_etree  # Faster streaming parse (optional)
+    XML_PARSE_ERRORS = (OSError, ET.ParseError, lxml_etree.XMLSyntaxError)
+except ImportError:
+    lxml_etree = None
+    XML_PARSE_ERRORS = (OSError, ET.ParseError)
 
 
 KVG_NS = {"kvg": "http://kanjivg.tagaini.net"}  # KanjiVG namespace
+KVG_ELEMENT_ATTR = f"{{{KVG_NS['kvg']}}}element"  # Clark-notation kvg:element
 HEX_RE = re.compile(r"([0-9a-fA-F]{4,6})")
 
 
-def sample_svg_path(d: str, samples: int) -> list[list[float]]:
+def sample_svg_path_array(d: str, samples: int) -> np.ndarray:
     """
-    Sample an SVG path `d` into a polyline with `samples` points.
+    Sample an SVG path `d` into a (samples, 2) array of x, y points.
     Uses svgpathtools to handle M/L/C/Q/A/Z etc.
+
+    Equivalent to calling p.point(t) for each t, but maps all t to their
+    segments at once and evaluates each segment on an array of t.
     """
     p = parse_path(d)
     if len(p) == 0:
-        return []
+        return np.empty((0, 2))
     ts = np.linspace(0.0, 1.0, samples)
-    pts = []
-    for t in ts:
-        c = p.point(t)  # complex x + yj
-        pts.append([float(c.real), float(c.imag)])
-    return pts
+
+    # Path.point splits the path parameter between segments by their share
+    # of the total arc length
+    segments = list(p)
+    lengths = [seg.length() for seg in segments]
+    total = sum(lengths)
+    if total == 0:
+        pts = np.array([p.point(t) for t in ts], dtype=complex)
+        return np.column_stack((pts.real, pts.imag))
+    ends = np.cumsum([length / total for length in lengths])
+    starts = np.concatenate(([0.0], ends[:-1]))
+
+    # First segment ending at or after each t, and the position within it
+    seg_idx = np.minimum(np.searchsorted(ends, ts), len(segments) - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        seg_ts = (ts - starts[seg_idx]) / (ends[seg_idx] - starts[seg_idx])
+    # t = 0 and t = 1 are the ends of the first and last segment
+    seg_idx[ts == 0.0], seg_ts[ts == 0.0] = 0, 0.0
+    seg_idx[ts == 1.0], seg_ts[ts == 1.0] = len(segments) - 1, 1.0
+
+    pts = np.empty(samples, dtype=complex)
+    for i in np.unique(seg_idx).tolist():
+        mask = seg_idx == i
+        segment = segments[i]
+        if isinstance(segment, Arc):
+            # Arc.point only takes scalars
+            pts[mask] = [segment.point(t) for t in seg_ts[mask]]
+        else:
+            pts[mask] = segment.point(seg_ts[mask])
+    return np.column_stack((pts.real, pts.imag))
+
+
+def sample_svg_path(d: str, samples: int) -> list[list[float]]:
+    """Sample an SVG path `d` into a polyline with `samples` points."""
+    return sample_svg_path_array(d, samples).tolist()
 
 
-def normalize_points(points: list[list[float]], size: float) -> list[list[float]]:
+def normalize_points(points: np.ndarray, size: float) -> np.ndarray:
     if size <= 0:
         return points
-    return [[x / size, y / size] for x, y in points]
+    return points / size
 
 
 def hex_to_char(hex_str: str) -> str:
@@ -70,10 +112,11 @@ def char_from_element(kn: ET.Element) -> str:
     Try to read the literal character from kvg:element on the first group.
     In KanjiVG data, the outermost g usually has the actual kanji.
     """
-    g = kn.find(".//g[@kvg:element]", KVG_NS)
+    # Plain iteration avoids re-parsing an XPath expression per element
+    g = next((g for g in kn.iter("g") if KVG_ELEMENT_ATTR in g.attrib), None)
     if g is None:
         return ""
-    val = g.attrib.get(f"{{{KVG_NS['kvg']}}}element", "")
+    val = g.attrib.get(KVG_ELEMENT_ATTR, "")
     return val if len(val) == 1 else ""
 
 
@@ -99,6 +142,46 @@ def char_from_filename(filename: str) -> str:
     return hex_to_char(m.group(1)) if m else ""
 
 
+def extract_kanji(
+    kn: ET.Element,
+    samples: int,
+    do_normalize: bool,
+    size: float,
+    source_filename: str = ""
+) -> dict:
+    """Convert one <kanji> element into its id, char and sampled strokes."""
+    kanji_id = kn.attrib.get("id", "")
+
+    # Determine actual character for "char"
+    ch = char_from_element(kn)
+    if not ch:
+        ch = char_from_kanji_id(kanji_id)
+    if not ch and source_filename:
+        ch = char_from_filename(source_filename)
+
+    # Collect strokes
+    strokes_json = []
+    for path_node in kn.iter("path"):
+        d = path_node.attrib.get("d")
+        if not d:
+            continue
+        stroke_id = path_node.attrib.get("id", "")
+        # Stay in NumPy until the points are final, then convert once
+        points = sample_svg_path_array(d, samples)
+        if do_normalize:
+            points = normalize_points(points, size)
+        strokes_json.append({
+            "id": stroke_id,
+            "points": points.tolist()
+        })
+
+    return {
+        "id": kanji_id,
+        "char": ch,
+        "strokes": strokes_json
+    }
+
+
 def extract_kanji_from_tree(
     tree: ET.ElementTree,
     samples: int,
@@ -107,48 +190,44 @@ def extract_kanji_from_tree(
     source_filename: str = ""
 ):
     root = tree.getroot()
-    kanji_nodes = root.findall(".//kanji")
-    results = []
-
-    for kn in kanji_nodes:
-        kanji_id = kn.attrib.get("id", "")
-
-        # Determine actual character for "char"
-        ch = char_from_element(kn)
-        if not ch:
-            ch = char_from_kanji_id(kanji_id)
-        if not ch and source_filename:
-            ch = char_from_filename(source_filename)
-
-        # Collect strokes
-        stroke_paths = kn.findall(".//path")
-        strokes_json = []
-        for path_node in stroke_paths:
-            d = path_node.attrib.get("d")
-            if not d:
-                continue
-            stroke_id = path_node.attrib.get("id", "")
-            points = sample_svg_path(d, samples)
-            if do_normalize:
-                points = normalize_points(points, size)
-            strokes_json.append({
-                "id": stroke_id,
-                "points": points
-            })
-
-        results.append({
-            "id": kanji_id,
-            "char": ch,
-            "strokes": strokes_json
-        })
-
-    return results
+    return [
+        extract_kanji(kn, samples, do_normalize, size, source_filename)
+        for kn in root.findall(".//kanji")
+    ]
 
 
 def load_xml(path: str) -> ET.ElementTree:
     return ET.parse(path)
 
 
+def iter_kanji(path: str) -> Iterator[ET.Element]:
+    """
+    Stream the <kanji> elements of a KanjiVG file without building the
+    whole tree. Each element is cleared once the caller advances, so use
+    it (or serialize it with kanji_to_xml) before moving on.
+    """
+    if lxml_etree is not None:
+        for _, kn in lxml_etree.iterparse(path, tag="kanji"):
+            yield kn
+            kn.clear()
+            # Drop the emptied siblings too, keeping memory flat
+            while kn.getprevious() is not None:
+                del kn.getparent()[0]
+        return
+
+    for _, elem in ET.iterparse(path):
+        if elem.tag == "kanji":
+            yield elem
+            elem.clear()
+
+
+def kanji_to_xml(kn) -> bytes:
+    """Serialize an element from iter_kanji (either parser backend)."""
+    if lxml_etree is not None and isinstance(kn, lxml_etree._Element):
+        return lxml_etree.tostring(kn)
+    return ET.tostring(kn)
+
+
 def collect_files(input_path: str) -> list[str]:
     """
     If input is a directory, collect *.svg, *.xml.
@@ -181,20 +260,22 @@ def main():
     all_kanji = []
 
     for f in files:
+        # Parsing is streamed, so only reading/parsing errors are caught here;
+        # stroke extraction errors still propagate
+        kanji_list = []
         try:
-            tree = load_xml(f)
-        except Exception as e:
+            for kn in iter_kanji(f):
+                kanji_list.append(extract_kanji(
+                    kn,
+                    samples=args.samples,
+                    do_normalize=args.normalize,
+                    size=args.size,
+                    source_filename=f
+                ))
+        except XML_PARSE_ERRORS as e:
             print(f"Failed to parse {f}: {e}", file=sys.stderr)
             continue
 
-        kanji_list = extract_kanji_from_tree(
-            tree,
-            samples=args.samples,
-            do_normalize=args.normalize,
-            size=args.size,
-            source_filename=f
-        )
-
         if args.per_kanji:
             os.makedirs(args.out, exist_ok=True)
             for k in kanji_list: